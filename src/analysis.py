@@ -0,0 +1,639 @@
+"""
+Análise dos Resultados: REST vs GraphQL
+Disciplina: Laboratório de Experimentação de Software
+
+Funções de carga, pareamento e testes estatísticos compartilhadas pelas páginas
+do dashboard. Não depende do Streamlit; o SciPy é importado apenas quando um
+teste estatístico é de fato executado.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def load_results(csv_path):
+    """Lê um arquivo de resultados do experimento."""
+    return pd.read_csv(csv_path)
+
+def filter_data(df, id_range=None, api_types=None):
+    """Aplica os filtros de intervalo de ID e tipo de API usados nas páginas."""
+    mask = pd.Series(True, index=df.index)
+    if id_range is not None:
+        mask &= (df['id'] >= id_range[0]) & (df['id'] <= id_range[1])
+    if api_types is not None:
+        mask &= df['type'].isin(api_types)
+    return df[mask].copy()
+
+def apply_overhead_correction(df, calibration):
+    """
+    Desconta de `time_ms` o piso do harness medido na calibração (mediana do
+    endpoint nulo para o caminho de cliente de cada tipo de API).
+    """
+    floor = df['type'].astype(str).map(calibration['floor_ms']).fillna(0.0)
+    return df.assign(time_ms=df['time_ms'] - floor)
+
+# Índice pareado REST x GraphQL
+API_TYPES = ['REST', 'GraphQL']
+METRICS = ['time_ms', 'size_bytes']
+METRIC_LABELS = {'time_ms': 'Tempo (ms)', 'size_bytes': 'Tamanho (bytes)'}
+PAIR_KEYS = ['run', 'round', 'id', 'repetition', 'scenario', 'pair']
+NO_PAIRS_MESSAGE = ("Os dados não têm pares REST x GraphQL: registros de cenários no modo mix "
+                    "(ou de operações sem `pair`) não têm contraparte, e as análises pareadas "
+                    "não se aplicam.")
+
+def unpaired_records(df):
+    """
+    Máscara dos registros sem contraparte declarada (coluna `pair` vazia), como
+    os de cenários no modo mix; eles ficam fora do índice pareado.
+    """
+    if 'pair' not in df:
+        return pd.Series(False, index=df.index)
+    return df['pair'].isna() | (df['pair'].astype(str) == '')
+
+def build_paired_index(df, values=METRICS):
+    """
+    Constrói o índice pareado REST x GraphQL em uma única passada vetorizada.
+    
+    Cada linha corresponde a uma chave (run, round, id, repetition, scenario,
+    pair) e as colunas formam um MultiIndex (coluna de `values`, tipo de API).
+    Só operações com o mesmo rótulo `pair` (contrapartes declaradas no cenário)
+    são pareadas; registros sem rótulo ficam de fora. Colunas de chave ausentes
+    no CSV recebem valores padrão; a repetição é numerada pela ordem de
+    ocorrência de cada (run, round, scenario, pair, id, type), de modo que uma
+    requisição que falhou (e não foi registrada) em uma rodada não desloca os
+    pares das rodadas seguintes. Pares incompletos permanecem com NaN no lado
+    ausente.
+    """
+    df = df[~unpaired_records(df)]
+    keys = pd.DataFrame(index=df.index)
+    keys['run'] = df['run'] if 'run' in df else 'default'
+    keys['round'] = df['round'] if 'round' in df else 1
+    keys['scenario'] = df['scenario'] if 'scenario' in df else 'default'
+    keys['pair'] = df['pair'] if 'pair' in df else 'default'
+    keys['id'] = df['id']
+    keys['type'] = df['type']
+    if 'repetition' in df:
+        keys['repetition'] = df['repetition']
+    else:
+        keys['repetition'] = keys.groupby(['run', 'round', 'scenario', 'pair', 'id', 'type'],
+                                          sort=False).cumcount()
+    
+    data = pd.concat([keys, df[values]], axis=1)
+    paired = data.pivot_table(index=PAIR_KEYS, columns='type', values=values, aggfunc='mean')
+    return paired.reindex(columns=pd.MultiIndex.from_product([values, API_TYPES]))
+
+def pairing_report(paired):
+    """Conta pares completos e medições sem correspondente no outro tipo de API."""
+    present = paired[METRICS[0]].notna()
+    return {
+        'complete': int((present['REST'] & present['GraphQL']).sum()),
+        'missing_rest': int((~present['REST'] & present['GraphQL']).sum()),
+        'missing_graphql': int((present['REST'] & ~present['GraphQL']).sum()),
+    }
+
+def paired_samples(paired, metric_col, aggregate_repeats='median'):
+    """
+    Retorna o DataFrame [REST, GraphQL] de pares completos para uma métrica.
+    
+    Pares incompletos são descartados. Com `aggregate_repeats`, as repetições de uma
+    mesma (run, id, scenario, pair) são resumidas em um único par, evitando tratar
+    medições repetidas como observações independentes no teste pareado.
+    """
+    pairs = paired[metric_col].dropna()
+    if aggregate_repeats is not None:
+        pairs = pairs.groupby(level=['run', 'id', 'scenario', 'pair'], sort=True).agg(aggregate_repeats)
+    return pairs
+
+# Funções de análise estatística
+def test_normality(data):
+    """Testa normalidade usando Shapiro-Wilk."""
+    from scipy.stats import shapiro
+    
+    stat, p_value = shapiro(data)
+    return stat, p_value, p_value > 0.05
+
+def cohens_d(x, y):
+    """Calcula o tamanho do efeito (Cohen's d) para amostras pareadas."""
+    diff = x - y
+    d = diff.mean() / diff.std()
+    return d
+
+def interpret_cohens_d(d):
+    """Interpreta o tamanho do efeito de Cohen."""
+    abs_d = abs(d)
+    if abs_d < 0.2:
+        return "Desprezível"
+    elif abs_d < 0.5:
+        return "Pequeno"
+    elif abs_d < 0.8:
+        return "Médio"
+    else:
+        return "Grande"
+
+def hypothesis_test(x, y, paired=True):
+    """
+    Escolhe e executa o teste de comparação entre duas amostras.
+    
+    Pareado: Shapiro-Wilk nas diferenças decide entre teste t pareado e Wilcoxon.
+    Independente: Shapiro-Wilk em cada amostra decide entre teste t de Welch e
+    Mann-Whitney. Retorna nome, estatística e p-valor do teste escolhido.
+    """
+    from scipy.stats import mannwhitneyu, ttest_ind, ttest_rel, wilcoxon
+    
+    if paired:
+        differences = x - y
+        if np.all(differences == 0):
+            # Amostras idênticas (ex.: tamanhos determinísticos): não há o que testar
+            return {'shapiro_stat': np.nan, 'shapiro_p': np.nan, 'is_normal': False,
+                    'test_name': "Sem diferença", 'test_stat': 0.0, 'test_p': 1.0}
+        shapiro_stat, shapiro_p, is_normal = test_normality(differences)
+        if is_normal:
+            # Teste t pareado
+            test_name = "Teste t pareado"
+            test_stat, test_p = ttest_rel(x, y)
+        else:
+            # Teste de Wilcoxon (não-paramétrico)
+            test_name = "Teste de Wilcoxon"
+            test_stat, test_p = wilcoxon(x, y)
+    else:
+        stat_x, p_x, normal_x = test_normality(x)
+        stat_y, p_y, normal_y = test_normality(y)
+        shapiro_stat, shapiro_p = (stat_x, p_x) if p_x < p_y else (stat_y, p_y)
+        is_normal = normal_x and normal_y
+        if is_normal:
+            test_name = "Teste t de Welch"
+            test_stat, test_p = ttest_ind(x, y, equal_var=False)
+        else:
+            test_name = "Teste de Mann-Whitney"
+            test_stat, test_p = mannwhitneyu(x, y, alternative='two-sided')
+    
+    return {
+        'shapiro_stat': shapiro_stat,
+        'shapiro_p': shapiro_p,
+        'is_normal': is_normal,
+        'test_name': test_name,
+        'test_stat': test_stat,
+        'test_p': test_p
+    }
+
+def perform_statistical_test(rest_data, graphql_data):
+    """
+    Realiza testes estatísticos apropriados.
+    Retorna resultados do teste de normalidade e do teste de hipótese.
+    """
+    differences = rest_data - graphql_data
+    test_results = hypothesis_test(rest_data, graphql_data, paired=True)
+    
+    # Calcular Cohen's d
+    d = cohens_d(rest_data, graphql_data)
+    d_interpretation = interpret_cohens_d(d)
+    
+    # Intervalo de confiança da diferença (95%)
+    diff_mean = differences.mean()
+    diff_std = differences.std()
+    n = len(differences)
+    se = diff_std / np.sqrt(n)
+    ci_lower = diff_mean - 1.96 * se
+    ci_upper = diff_mean + 1.96 * se
+    
+    return {
+        **test_results,
+        'cohens_d': d,
+        'd_interpretation': d_interpretation,
+        'diff_mean': diff_mean,
+        'ci_lower': ci_lower,
+        'ci_upper': ci_upper
+    }
+
+def summary_table(df):
+    """Tabela de estatísticas descritivas por métrica e tipo de API."""
+    rows = []
+    for metric_col, metric_label in METRIC_LABELS.items():
+        for api_type in API_TYPES:
+            data = df[df['type'] == api_type][metric_col]
+            rows.append({
+                'Métrica': metric_label,
+                'Tipo': api_type,
+                'Média': data.mean(),
+                'Mediana': data.median(),
+                'Desvio Padrão': data.std(),
+                'Mínimo': data.min(),
+                'Máximo': data.max()
+            })
+    return pd.DataFrame(rows)
+
+# Matriz de cenários (comparações múltiplas)
+CORRECTION_METHODS = {'holm': 'Holm-Bonferroni', 'bh': 'Benjamini-Hochberg'}
+
+def adjust_pvalues(p_values, method='holm'):
+    """
+    Ajusta p-valores para comparações múltiplas.
+    
+    'holm' controla a taxa de erro por família (FWER); 'bh' controla a taxa de
+    falsas descobertas (FDR). Valores NaN ficam fora da família e permanecem NaN.
+    """
+    p = np.asarray(p_values, dtype=float)
+    adjusted = np.full(p.shape, np.nan)
+    valid = ~np.isnan(p)
+    m = int(valid.sum())
+    if m == 0:
+        return adjusted
+    
+    order = np.argsort(p[valid])
+    ranked = p[valid][order]
+    if method == 'holm':
+        scaled = np.maximum.accumulate((m - np.arange(m)) * ranked)
+    elif method == 'bh':
+        scaled = np.minimum.accumulate((m / np.arange(m, 0, -1)) * ranked[::-1])[::-1]
+    else:
+        raise ValueError(f"Método de correção desconhecido: {method}")
+    
+    result = np.empty(m)
+    result[order] = np.minimum(scaled, 1.0)
+    adjusted[valid] = result
+    return adjusted
+
+def scenario_matrix(paired, alpha=0.05, correction='holm', metrics=METRICS):
+    """
+    Efeito REST - GraphQL de cada célula (cenário, métrica) em uma passada agrupada.
+    
+    As diferenças pareadas são resumidas por cenário com um único groupby e o
+    teste t pareado, o IC (t de Student) e o Cohen's d são calculados de forma
+    vetorizada para todas as células. Os p-valores são corrigidos em conjunto
+    com `adjust_pvalues`, tratando todas as células como uma única família.
+    """
+    from scipy.stats import t as t_dist
+    
+    frames = []
+    for metric_col in metrics:
+        pairs = paired_samples(paired, metric_col)
+        differences = pairs['REST'] - pairs['GraphQL']
+        cells = differences.groupby(level='scenario', sort=True).agg(['count', 'mean', 'std'])
+        cells['metric'] = metric_col
+        frames.append(cells)
+    matrix = pd.concat(frames).rename_axis('scenario').reset_index()
+    matrix = matrix.rename(columns={'count': 'n', 'mean': 'diff_mean', 'std': 'diff_std'})
+    
+    n = matrix['n'].to_numpy(dtype=float)
+    mean = matrix['diff_mean'].to_numpy(dtype=float)
+    std = matrix['diff_std'].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        se = std / np.sqrt(n)
+        p_value = 2 * t_dist.sf(np.abs(mean / se), n - 1)
+        margin = t_dist.ppf(1 - alpha / 2, n - 1) * se
+        d = mean / std
+    
+    # Diferenças constantes (ex.: tamanhos determinísticos) não têm variância
+    constant = std == 0
+    p_value = np.where(constant, np.where(mean == 0, 1.0, 0.0), p_value)
+    d = np.where(constant & (mean == 0), 0.0, d)
+    p_value = np.where(n < 2, np.nan, p_value)
+    
+    matrix['ci_lower'] = mean - margin
+    matrix['ci_upper'] = mean + margin
+    matrix['cohens_d'] = d
+    matrix['d_interpretation'] = pd.cut(
+        np.abs(d), [0, 0.2, 0.5, 0.8, np.inf], right=False,
+        labels=["Desprezível", "Pequeno", "Médio", "Grande"]
+    ).astype(object)
+    matrix['p_value'] = p_value
+    matrix['p_adjusted'] = adjust_pvalues(p_value, correction)
+    matrix['significant'] = matrix['p_adjusted'] < alpha
+    return matrix[['scenario', 'metric', 'n', 'diff_mean', 'ci_lower', 'ci_upper', 'cohens_d',
+                   'd_interpretation', 'p_value', 'p_adjusted', 'significant']]
+
+# Efeito de ordem (posição de cada API dentro do passo pareado)
+PAIRED_DIFFERENCE = 'REST - GraphQL'
+
+def order_effect_test(df, metric_col='time_ms', alpha=0.05):
+    """
+    Testa se a posição de execução dentro do passo pareado altera a métrica.
+    
+    Para cada tipo de API, compara as medições feitas em primeiro lugar
+    (`position` 1) com as feitas depois, por um teste t de Welch. Para a
+    diferença pareada REST - GraphQL, compara os pares abertos pelo REST com os
+    abertos pelo GraphQL: sem efeito de ordem, a diferença não depende de quem
+    rodou primeiro. `effect` é média(primeiro) - média(depois). Retorna None se
+    o CSV não tem `position` ou se a ordem nunca variou (coleta com ordem fixa).
+    """
+    from scipy.stats import t as t_dist
+    
+    if 'position' not in df or df.groupby('type')['position'].nunique().max() < 2:
+        return None
+    
+    first = df['position'] == 1
+    groups = {}
+    for api_type in API_TYPES:
+        values = df.loc[df['type'] == api_type, metric_col].dropna()
+        groups[api_type] = (values[first], values[~first])
+    paired = build_paired_index(df, values=[metric_col, 'position'])
+    pairs = paired[metric_col].dropna()
+    positions = paired['position'].loc[pairs.index]
+    differences = pairs['REST'] - pairs['GraphQL']
+    rest_first = positions['REST'] < positions['GraphQL']
+    groups[PAIRED_DIFFERENCE] = (differences[rest_first], differences[~rest_first])
+    
+    table = pd.DataFrame([
+        {'group': group, 'n_first': len(a), 'n_later': len(b),
+         'mean_first': a.mean(), 'mean_later': b.mean(), 'var_first': a.var(), 'var_later': b.var()}
+        for group, (a, b) in groups.items()
+    ])
+    
+    n_first = table['n_first'].to_numpy(dtype=float)
+    n_later = table['n_later'].to_numpy(dtype=float)
+    effect = (table['mean_first'] - table['mean_later']).to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v_first = table['var_first'].to_numpy(dtype=float) / n_first
+        v_later = table['var_later'].to_numpy(dtype=float) / n_later
+        se = np.sqrt(v_first + v_later)
+        # Graus de liberdade de Welch-Satterthwaite
+        dof = (v_first + v_later) ** 2 / (v_first ** 2 / (n_first - 1) + v_later ** 2 / (n_later - 1))
+        p_value = 2 * t_dist.sf(np.abs(effect / se), dof)
+        margin = t_dist.ppf(1 - alpha / 2, dof) * se
+    
+    # Grupos sem variância (ex.: tamanhos determinísticos)
+    constant = se == 0
+    p_value = np.where(constant, np.where(effect == 0, 1.0, 0.0), p_value)
+    margin = np.where(constant, 0.0, margin)
+    p_value = np.where((n_first < 2) | (n_later < 2), np.nan, p_value)
+    
+    table['effect'] = effect
+    table['ci_lower'] = effect - margin
+    table['ci_upper'] = effect + margin
+    table['p_value'] = p_value
+    return table[['group', 'n_first', 'n_later', 'mean_first', 'mean_later', 'effect',
+                  'ci_lower', 'ci_upper', 'p_value']]
+
+# Outliers (filtro de Hampel por tipo de API e cenário)
+HAMPEL_WINDOW = 11        # Registros por janela móvel (centrada)
+HAMPEL_THRESHOLD = 3.0    # Afastamento, em MADs escalados, a partir do qual o registro é outlier
+MAD_SCALE = 1.4826        # Converte o MAD em desvio padrão sob normalidade
+
+def _outlier_groups(df):
+    return ['type', 'scenario'] if 'scenario' in df else ['type']
+
+def _collection_order(df):
+    """Registros na ordem de coleta: `started_at`, ou a ordem do arquivo."""
+    return df.sort_values('started_at', kind='stable') if 'started_at' in df else df
+
+def _grouped_rolling_median(values, keys, window):
+    rolled = values.groupby(keys, sort=False, observed=True).rolling(window, center=True, min_periods=1)
+    return rolled.median().droplevel(list(range(len(keys))))
+
+def hampel_flags(df, metric_col='time_ms', window=HAMPEL_WINDOW, threshold=HAMPEL_THRESHOLD):
+    """
+    Marca outliers com um filtro de Hampel vetorizado, sem remover registros.
+    
+    Em cada grupo (tipo de API e cenário), na ordem de coleta, calcula a mediana
+    móvel centrada de `window` registros e, como escala, a mediana móvel dos
+    desvios absolutos em relação a ela (aproximação do MAD de cada janela que
+    mantém o custo linear no número de registros). O registro é outlier quando
+    se afasta da mediana local mais que `threshold` MADs escalados; janelas com
+    MAD zero (valores constantes) não marcam nada.
+    
+    Retorna uma cópia de `df` com as colunas `rolling_median`, `outlier_score`
+    e `outlier`.
+    """
+    ordered = _collection_order(df)
+    keys = [ordered[column] for column in _outlier_groups(ordered)]
+    values = ordered[metric_col]
+    median = _grouped_rolling_median(values, keys, window)
+    deviation = (values - median).abs()
+    scale = MAD_SCALE * _grouped_rolling_median(deviation, keys, window)
+    score = deviation / scale.where(scale > 0)
+    return df.assign(rolling_median=median, outlier_score=score, outlier=score > threshold)
+
+def outlier_windows(flagged, metric_col='time_ms'):
+    """
+    Agrupa outliers consecutivos na ordem de coleta de cada grupo (tipo de API e
+    cenário) em janelas, com os IDs envolvidos, o maior score e, se o CSV tiver
+    `started_at`, o intervalo de tempo da janela.
+    """
+    ordered = _collection_order(flagged)
+    groups = _outlier_groups(ordered)
+    position = ordered.groupby(groups, sort=False, observed=True).cumcount()
+    hits = ordered[ordered['outlier']]
+    position = position[hits.index]
+    # Nova janela sempre que o outlier anterior do grupo não é o registro imediatamente anterior
+    window_id = (position.groupby([hits[column] for column in groups], sort=False, observed=True)
+                 .diff() != 1).cumsum().rename('window')
+    aggregations = {
+        'records': ('id', 'size'),
+        'ids': ('id', lambda ids: ', '.join(map(str, ids))),
+        'max_score': ('outlier_score', 'max'),
+        'max_value': (metric_col, 'max'),
+    }
+    if 'started_at' in hits:
+        aggregations['start'] = ('started_at', 'min')
+        aggregations['end'] = ('started_at', 'max')
+    windows = hits.groupby(groups + [window_id], sort=False, observed=True).agg(**aggregations)
+    return windows.reset_index().drop(columns='window').sort_values('max_score', ascending=False)
+
+def paired_without_outliers(flagged, metric_col='time_ms'):
+    """
+    Índice pareado de `metric_col` apenas com os pares em que nenhum dos lados foi
+    marcado como outlier. O pareamento é feito antes da exclusão, para que a
+    numeração das repetições não se desloque.
+    """
+    paired = build_paired_index(flagged.assign(outlier=flagged['outlier'].astype(float)),
+                                values=[metric_col, 'outlier'])
+    clean = paired['outlier'].max(axis=1).fillna(0) == 0
+    return paired.loc[clean, [metric_col]]
+
+# Comparação entre execuções (gate de regressão)
+REGRESSION_STATISTICS = ['mean', 'median', 'p99']
+BOOTSTRAP_RESAMPLES = 2_000
+PAIRING_MIN_OVERLAP = 0.9          # Fração mínima de IDs em comum para comparar pareado
+BOOTSTRAP_BLOCK_ELEMENTS = 5_000_000  # Limite de elementos por bloco de reamostragem
+
+def sample_statistic(values, statistic, axis=None):
+    """Média, mediana ou p99 de um vetor (ou ao longo de um eixo)."""
+    if statistic == 'mean':
+        return np.mean(values, axis=axis)
+    if statistic == 'median':
+        return np.median(values, axis=axis)
+    if statistic == 'p99':
+        return np.quantile(values, 0.99, axis=axis)
+    raise ValueError(f"Estatística desconhecida: {statistic}")
+
+def bootstrap_difference(x, y, statistic, paired, resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    """
+    Distribuição bootstrap de statistic(y) - statistic(x).
+    
+    Amostras pareadas são reamostradas com os mesmos índices. A reamostragem é
+    vetorizada em blocos para limitar a memória em execuções grandes.
+    """
+    rng = np.random.default_rng(seed)
+    deltas = np.empty(resamples)
+    block = max(1, BOOTSTRAP_BLOCK_ELEMENTS // max(len(x), len(y)))
+    for start in range(0, resamples, block):
+        size = min(block, resamples - start)
+        idx_x = rng.integers(0, len(x), (size, len(x)))
+        idx_y = idx_x if paired else rng.integers(0, len(y), (size, len(y)))
+        deltas[start:start + size] = (
+            sample_statistic(y[idx_y], statistic, axis=1) -
+            sample_statistic(x[idx_x], statistic, axis=1)
+        )
+    return deltas
+
+def align_runs(baseline, candidate, metric_col, allow_paired=True):
+    """
+    Extrai as amostras de duas execuções para uma métrica.
+    
+    As amostras são pareadas por ID quando cada ID aparece uma única vez em
+    cada execução e os conjuntos de IDs praticamente coincidem; caso contrário
+    são tratadas como independentes.
+    
+    Returns:
+        Tupla (amostra_baseline, amostra_candidata, pareado)
+    """
+    if allow_paired and baseline['id'].is_unique and candidate['id'].is_unique:
+        base = baseline.set_index('id')[metric_col]
+        cand = candidate.set_index('id')[metric_col]
+        shared = base.index.intersection(cand.index).sort_values()
+        if len(shared) >= 3 and len(shared) >= PAIRING_MIN_OVERLAP * max(len(base), len(cand)):
+            return base.loc[shared].values, cand.loc[shared].values, True
+    return baseline[metric_col].values, candidate[metric_col].values, False
+
+def compare_result_sets(baseline, candidate, tolerances, alpha=0.05, tail_tolerance=None,
+                        resamples=BOOTSTRAP_RESAMPLES, seed=0, allow_paired=True):
+    """
+    Compara uma execução candidata com a baseline por tipo de API e cenário (e
+    por operação, quando as duas execuções têm a coluna `operation`, para não
+    misturar operações diferentes de um cenário mix no mesmo grupo).
+    
+    Para cada métrica, calcula média, mediana e p99 das duas execuções. A média
+    usa o teste escolhido por `hypothesis_test`; mediana e p99 usam bootstrap
+    (pareado quando possível). Uma verificação é regressão quando a variação
+    relativa excede a tolerância da métrica e a diferença é significativa.
+    Grupos ausentes em uma das execuções, ou com menos de 3 registros, recebem
+    status 'insufficient' (inclusive os que só existem na candidata).
+    
+    Args:
+        tolerances: Tolerância relativa por métrica, ex. {'time_ms': 0.05}
+        tail_tolerance: Tolerância própria do p99 (padrão: a da métrica)
+        
+    Returns:
+        DataFrame com uma linha por (tipo, cenário[, operação], métrica, estatística)
+    """
+    baseline = baseline if 'scenario' in baseline else baseline.assign(scenario='default')
+    candidate = candidate if 'scenario' in candidate else candidate.assign(scenario='default')
+    groups = ['type', 'scenario']
+    if 'operation' in baseline and 'operation' in candidate:
+        groups.append('operation')
+    baseline_groups = dict(list(baseline.groupby(groups)))
+    candidate_groups = dict(list(candidate.groupby(groups)))
+    
+    rows = []
+    for key, base_group in baseline_groups.items():
+        labels = dict(zip(groups, key))
+        cand_group = candidate_groups.get(key)
+        for metric_col in METRICS:
+            tolerance = tolerances[metric_col]
+            if cand_group is None or len(base_group) < 3 or len(cand_group) < 3:
+                rows.append({**labels, 'metric': metric_col, 'statistic': None,
+                             'n_baseline': len(base_group),
+                             'n_candidate': 0 if cand_group is None else len(cand_group),
+                             'status': 'insufficient'})
+                continue
+            
+            x, y, paired = align_runs(base_group, cand_group, metric_col, allow_paired)
+            x, y = x.astype(float), y.astype(float)
+            test = hypothesis_test(x, y, paired=paired)
+            
+            for statistic in REGRESSION_STATISTICS:
+                base_value = sample_statistic(x, statistic)
+                cand_value = sample_statistic(y, statistic)
+                rel_change = (cand_value - base_value) / base_value if base_value else np.nan
+                deltas = bootstrap_difference(x, y, statistic, paired, resamples, seed)
+                
+                if statistic == 'mean':
+                    test_name, p_value = test['test_name'], float(test['test_p'])
+                else:
+                    test_name = "Bootstrap pareado" if paired else "Bootstrap independente"
+                    p_value = min(1.0, 2 * min((deltas <= 0).mean(), (deltas >= 0).mean()))
+                
+                limit = tail_tolerance if statistic == 'p99' and tail_tolerance is not None else tolerance
+                significant = p_value < alpha
+                if significant and rel_change > limit:
+                    status = 'regression'
+                elif significant and rel_change < -limit:
+                    status = 'improvement'
+                else:
+                    status = 'ok'
+                
+                rows.append({
+                    **labels,
+                    'metric': metric_col,
+                    'statistic': statistic,
+                    'baseline': float(base_value),
+                    'candidate': float(cand_value),
+                    'rel_change': float(rel_change),
+                    'tolerance': limit,
+                    'ci_lower': float(np.quantile(deltas, alpha / 2)),
+                    'ci_upper': float(np.quantile(deltas, 1 - alpha / 2)),
+                    'test': test_name,
+                    'p_value': p_value,
+                    'paired': paired,
+                    'n_baseline': len(x),
+                    'n_candidate': len(y),
+                    'status': status
+                })
+    
+    # Grupos que só existem na candidata (ex.: cenário novo) também precisam de baseline
+    for key in sorted(candidate_groups.keys() - baseline_groups.keys()):
+        for metric_col in METRICS:
+            rows.append({**dict(zip(groups, key)), 'metric': metric_col, 'statistic': None,
+                         'n_baseline': 0, 'n_candidate': len(candidate_groups[key]),
+                         'status': 'insufficient'})
+    return pd.DataFrame(rows)
+
+# Textos de interpretação
+def interpret_time_results(test_results, alpha=0.05):
+    """Texto (Markdown) com a interpretação do teste de tempo de resposta (RQ1)."""
+    diff = test_results['diff_mean']
+    interpretation = f"""
+**Hipótese Nula (H₀):** μ_GraphQL ≥ μ_REST  
+**Hipótese Alternativa (H₁):** μ_GraphQL < μ_REST
+
+- **Diferença média:** {diff:.2f} ms (REST - GraphQL)
+- **Teste utilizado:** {test_results['test_name']}
+- **Tamanho do efeito:** {test_results['cohens_d']:.3f} ({test_results['d_interpretation']})
+- **Intervalo de confiança 95%:** [{test_results['ci_lower']:.2f}, {test_results['ci_upper']:.2f}] ms
+
+"""
+    
+    if test_results['test_p'] < alpha:
+        if diff < 0:
+            interpretation += "**Conclusão:** Rejeitamos H₀. REST apresenta tempo de resposta **significativamente menor** que GraphQL."
+        else:
+            interpretation += "**Conclusão:** Rejeitamos H₀. GraphQL apresenta tempo de resposta **significativamente menor** que REST."
+    else:
+        interpretation += "**Conclusão:** Não rejeitamos H₀. Não há evidência suficiente de diferença significativa entre os tempos de resposta."
+    
+    return interpretation
+
+def interpret_size_results(test_results, reduction_pct, alpha=0.05):
+    """Texto (Markdown) com a interpretação do teste de tamanho da resposta (RQ2)."""
+    diff = test_results['diff_mean']
+    interpretation = f"""
+**Hipótese Nula (H₀):** μ_GraphQL ≥ μ_REST  
+**Hipótese Alternativa (H₁):** μ_GraphQL < μ_REST
+
+- **Diferença média:** {diff:.0f} bytes (REST - GraphQL)
+- **Redução percentual:** {reduction_pct:.1f}%
+- **Teste utilizado:** {test_results['test_name']}
+- **Tamanho do efeito:** {test_results['cohens_d']:.3f} ({test_results['d_interpretation']})
+- **Intervalo de confiança 95%:** [{test_results['ci_lower']:.0f}, {test_results['ci_upper']:.0f}] bytes
+
+"""
+    
+    if test_results['test_p'] < alpha:
+        if diff > 0:
+            interpretation += "**Conclusão:** Rejeitamos H₀. GraphQL retorna respostas **significativamente menores** que REST."
+        else:
+            interpretation += "**Conclusão:** Rejeitamos H₀. REST retorna respostas **significativamente menores** que GraphQL."
+    else:
+        interpretation += "**Conclusão:** Não rejeitamos H₀. Não há evidência suficiente de diferença significativa entre os tamanhos das respostas."
+    
+    return interpretation
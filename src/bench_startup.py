@@ -0,0 +1,129 @@
+"""
+Benchmark de Inicialização do Dashboard
+Disciplina: Laboratório de Experimentação de Software
+
+Mede, em processos Python novos (cache de import frio), o tempo de importação
+do script principal e de cada página, e a latência do primeiro render de cada
+página via `streamlit.testing`. Serve para acompanhar o custo de inicialização
+à medida que novas páginas são adicionadas.
+
+Uso:
+    python bench_startup.py --repeat 5
+    python bench_startup.py --repeat 3 --budget-ms 3000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from views import PAGES
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+DASHBOARD_PATH = os.path.join(SRC_DIR, 'dashboard.py')
+
+
+def measure_import(module_name: str) -> float:
+    """Tempo (ms) para importar um módulo em um processo recém-criado."""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module_name}; "
+        "print((time.perf_counter() - t) * 1000)"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def measure_first_render(page: str) -> dict:
+    """Executa o worker de render em um processo novo e devolve as latências (ms)."""
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', page],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def render_worker(page: str):
+    """
+    Mede o render inicial do dashboard (página padrão) e o primeiro render
+    da página pedida, imprimindo o resultado em JSON.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    start = time.perf_counter()
+    app = AppTest.from_file(DASHBOARD_PATH, default_timeout=120).run()
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    app.sidebar.radio[0].set_value(page).run()
+    page_ms = (time.perf_counter() - start) * 1000
+
+    errors = [str(e.value) for e in app.exception]
+    print(json.dumps({'cold_start_ms': cold_ms, 'page_ms': page_ms, 'errors': errors}))
+
+
+def main():
+    """
+    Função principal do benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark de inicialização do dashboard REST vs GraphQL'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Número de processos novos por medição (padrão: 3)'
+    )
+    parser.add_argument(
+        '--budget-ms',
+        type=float,
+        default=None,
+        help='Falhar (código 1) se a mediana do primeiro render de alguma página exceder este valor'
+    )
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker:
+        render_worker(args.worker)
+        return
+
+    print("=" * 70)
+    print("TEMPO DE IMPORTAÇÃO (ms, mediana de processos novos)")
+    print("=" * 70)
+    modules = ['streamlit', 'analysis', 'views.common'] + [f"views.{m}" for m in PAGES.values()]
+    for module_name in modules:
+        samples = [measure_import(module_name) for _ in range(args.repeat)]
+        print(f"{module_name:<28} {statistics.median(samples):>10.1f}")
+    print()
+
+    print("=" * 70)
+    print("PRIMEIRO RENDER (ms, mediana de processos novos)")
+    print("=" * 70)
+    print(f"{'Página':<28} {'Inicialização':>14} {'Página':>10}")
+    over_budget = []
+    for page in PAGES:
+        runs = [measure_first_render(page) for _ in range(args.repeat)]
+        errors = [e for run in runs for e in run['errors']]
+        cold = statistics.median(run['cold_start_ms'] for run in runs)
+        page_ms = statistics.median(run['page_ms'] for run in runs)
+        print(f"{page:<28} {cold:>14.1f} {page_ms:>10.1f}")
+        if errors:
+            print(f"  ⚠️  Erros durante o render: {errors[0]}")
+        if args.budget_ms is not None and page_ms > args.budget_ms:
+            over_budget.append(page)
+    print()
+
+    if over_budget:
+        print(f"❌ Acima do orçamento de {args.budget_ms:.0f} ms: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
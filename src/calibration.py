@@ -0,0 +1,144 @@
+"""
+Calibração do Harness de Medição
+Disciplina: Laboratório de Experimentação de Software
+
+Quantifica o custo do próprio instrumento de medição antes da coleta:
+resolução do relógio, custo do par de leituras que envolve cada requisição e
+tempo de ida e volta contra um endpoint HTTP nulo, servido no mesmo processo,
+para os caminhos de cliente REST (GET) e GraphQL (POST com JSON). A mediana do
+endpoint nulo é o piso do harness: a menor latência que o coletor consegue
+registrar, gravada junto com a execução para correção no dashboard.
+"""
+
+import json
+import os
+import platform
+import statistics
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+CALIBRATION_SAMPLES = 200
+CLOCK_SAMPLES = 100_000
+
+
+class _NullHandler(BaseHTTPRequestHandler):
+    """Responde qualquer GET com `{}` e qualquer POST com `{"data":{}}`, sem trabalho algum."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, body: bytes):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(b'{}')
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._reply(b'{"data":{}}')
+
+
+def clock_resolution() -> dict:
+    """Resolução declarada do perf_counter e o menor passo observado entre leituras."""
+    info = time.get_clock_info('perf_counter')
+    smallest = float('inf')
+    previous = time.perf_counter_ns()
+    for _ in range(CLOCK_SAMPLES):
+        now = time.perf_counter_ns()
+        if now != previous:
+            smallest = min(smallest, now - previous)
+            previous = now
+    return {
+        'clock': 'perf_counter',
+        'implementation': info.implementation,
+        'resolution_ns': info.resolution * 1e9,
+        'observed_step_ns': smallest,
+    }
+
+
+def timer_overhead_ns(samples: int = CLOCK_SAMPLES) -> float:
+    """Mediana do intervalo medido por duas leituras consecutivas (bloco vazio)."""
+    deltas = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        end = time.perf_counter()
+        deltas.append(end - start)
+    return statistics.median(deltas) * 1e9
+
+
+def _summary(samples_ms) -> dict:
+    ordered = sorted(samples_ms)
+    return {
+        'median_ms': statistics.median(ordered),
+        'mean_ms': statistics.fmean(ordered),
+        'min_ms': ordered[0],
+        'p95_ms': ordered[int(0.95 * (len(ordered) - 1))],
+    }
+
+
+def calibrate(rest_request: Callable[[str], float], graphql_request: Callable[[str], float],
+              samples: int = CALIBRATION_SAMPLES) -> dict:
+    """
+    Executa a calibração completa.
+
+    `rest_request(base_url)` e `graphql_request(base_url)` devem percorrer o mesmo
+    caminho de cliente usado na coleta e retornar o tempo medido (ms). Elas são
+    apontadas para o endpoint nulo, que roda em uma thread deste processo.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _NullHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        # Primeira chamada de cada caminho descartada (imports e conexão)
+        rest_request(base_url)
+        graphql_request(base_url)
+        rest = [rest_request(base_url) for _ in range(samples)]
+        graphql = [graphql_request(base_url) for _ in range(samples)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    null_rest, null_graphql = _summary(rest), _summary(graphql)
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'samples': samples,
+        **clock_resolution(),
+        'timer_overhead_ns': timer_overhead_ns(),
+        'null_rest': null_rest,
+        'null_graphql': null_graphql,
+        'floor_ms': {'REST': null_rest['median_ms'], 'GraphQL': null_graphql['median_ms']},
+    }
+
+
+def save_calibration(calibration: dict, results_path: str) -> str:
+    """Grava a calibração ao lado do CSV de resultados e retorna o caminho usado."""
+    path = calibration_path(results_path)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(calibration, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def calibration_path(results_path: str) -> str:
+    """Arquivo de calibração gravado ao lado do CSV de resultados."""
+    return os.path.splitext(results_path)[0] + '.calibration.json'
+
+
+def load_calibration(results_path: str) -> Optional[dict]:
+    """Calibração associada a um CSV de resultados, ou None se não houver."""
+    path = calibration_path(results_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
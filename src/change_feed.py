@@ -0,0 +1,622 @@
+"""
+Change Feed: Assinaturas GraphQL vs Polling REST
+Disciplina: Laboratório de Experimentação de Software
+
+Cenário de leitura contínua contra o servidor local: personagens são alterados
+a uma taxa configurável e cada cliente acompanha um personagem por um destes
+modos:
+
+- poll:         GET periódico em /api/character/<id> (intervalo fixo)
+- conditional:  GET periódico com If-None-Match (304 sem corpo se nada mudou)
+- subscription: assinatura GraphQL `characterUpdated` via WebSocket
+                (protocolo graphql-transport-ws)
+
+Para cada modo e número de clientes são medidos a latência de visibilidade
+(instante da alteração no servidor até o cliente vê-la), os bytes trafegados
+por alteração entregue e a CPU do processo cliente. Todos os clientes rodam em
+um único event loop asyncio; o servidor (asyncio, mesma implementação de
+dados e GraphQL de `local_server.py`) roda em um processo separado para que a
+CPU medida seja apenas a dos clientes.
+
+Uso:
+    python change_feed.py --clients 1,10,100,1000 --duration 20
+    python change_feed.py --modes subscription --clients 10000 --mutation-rate 20 --out feed.csv
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import resource
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from local_server import (GraphQLError, Store, _bind, character_etag, execute_batched,
+                          parse_and_validate, rest_character)
+
+MODES = ['poll', 'conditional', 'subscription']
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+WS_PROTOCOL = 'graphql-transport-ws'
+CONNECT_CONCURRENCY = 256     # Conexões abertas simultaneamente na rampa inicial
+LISTEN_BACKLOG = 16_384
+
+SUBSCRIPTION_QUERY = """
+subscription ($id: ID!) {
+  characterUpdated(id: $id) {
+    id
+    status
+    updated_at
+    location { name }
+  }
+}
+"""
+
+# Falhas de rede de um cliente: contadas em `errors`, sem interromper os demais
+CLIENT_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError)
+
+# Opcodes WebSocket (RFC 6455)
+OP_TEXT, OP_CLOSE, OP_PING, OP_PONG = 0x1, 0x8, 0x9, 0xA
+
+
+def raise_fd_limit(wanted: int):
+    """Eleva o limite de descritores abertos até o máximo permitido (>= wanted, se possível)."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = hard if hard == resource.RLIM_INFINITY else min(hard, max(soft, wanted))
+    if target > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+
+# WebSocket (RFC 6455), apenas frames completos (sem fragmentação)
+def ws_accept_key(key: str) -> str:
+    """Valor de Sec-WebSocket-Accept para a chave enviada pelo cliente."""
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+
+
+def _apply_mask(data: bytes, key: bytes) -> bytes:
+    n = len(data)
+    mask = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(mask, 'big')).to_bytes(n, 'big')
+
+
+def encode_frame(payload: bytes, opcode: int = OP_TEXT, mask: bool = False) -> bytes:
+    """Monta um frame final; clientes devem mascarar o payload."""
+    n = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if n < 126:
+        header = bytes([0x80 | opcode, mask_bit | n])
+    elif n < 65536:
+        header = bytes([0x80 | opcode, mask_bit | 126]) + n.to_bytes(2, 'big')
+    else:
+        header = bytes([0x80 | opcode, mask_bit | 127]) + n.to_bytes(8, 'big')
+    if mask:
+        key = os.urandom(4)
+        return header + key + _apply_mask(payload, key)
+    return header + payload
+
+
+async def read_frame(reader: asyncio.StreamReader):
+    """Lê um frame e retorna (opcode, payload, bytes_lidos)."""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    nbytes = 2
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), 'big')
+        nbytes += 2
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), 'big')
+        nbytes += 8
+    key = None
+    if second & 0x80:
+        key = await reader.readexactly(4)
+        nbytes += 4
+    payload = await reader.readexactly(length)
+    if key:
+        payload = _apply_mask(payload, key)
+    return first & 0x0F, payload, nbytes + length
+
+
+async def read_http_head(reader: asyncio.StreamReader):
+    """Lê linha inicial e cabeçalhos; retorna (linha, cabeçalhos em minúsculas, bytes)."""
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers, len(head)
+
+
+# Servidor
+Subscriber = namedtuple('Subscriber', ['writer', 'sub_id'])
+
+
+class FeedServer:
+    """
+    Servidor asyncio do change feed: REST com ETag, assinaturas GraphQL via
+    WebSocket e um mutador que altera personagens a `mutation_rate` por segundo.
+    """
+
+    def __init__(self, mutation_rate: float, watch_ids: int, seed: int = 0):
+        # Sem latência simulada: o armazenamento é lido dentro do event loop
+        self.store = Store(db_latency_ms=0.0, seed=seed)
+        self.rng = random.Random(seed)
+        self.mutation_rate = mutation_rate
+        self.watch_ids = watch_ids
+        self.mutations: Dict[int, List[float]] = {}
+        # id do personagem -> (query, variáveis) -> (documento, variáveis, assinantes)
+        self.subscriptions: Dict[int, dict] = {}
+
+    async def mutator(self):
+        """Altera personagens aleatórios entre 1 e watch_ids em ritmo constante."""
+        interval = 1.0 / self.mutation_rate
+        next_at = time.monotonic()
+        while True:
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+            character_id = self.rng.randint(1, self.watch_ids)
+            now = time.time()
+            self.store.mutate(character_id, self.rng, now)
+            self.mutations.setdefault(character_id, []).append(now)
+            self.publish(character_id)
+
+    def publish(self, character_id: int):
+        """Resolve cada assinatura distinta uma vez e envia o mesmo frame a todos os assinantes."""
+        for document, variables, subscribers in self.subscriptions.get(character_id, {}).values():
+            data = execute_batched(document, variables, self.store, root_type='Subscription')
+            frames = {}
+            for subscriber in list(subscribers):
+                if subscriber.writer.is_closing():
+                    subscribers.discard(subscriber)
+                    continue
+                frame = frames.get(subscriber.sub_id)
+                if frame is None:
+                    message = {'id': subscriber.sub_id, 'type': 'next', 'payload': {'data': data}}
+                    frame = frames[subscriber.sub_id] = encode_frame(
+                        json.dumps(message, separators=(',', ':')).encode()
+                    )
+                subscriber.writer.write(frame)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line, headers, _ = await read_http_head(reader)
+                method, path, _ = request_line.split(' ', 2)
+                if headers.get('upgrade', '').lower() == 'websocket' and path == '/graphql':
+                    await self.websocket_session(reader, writer, headers)
+                    return
+                if method == 'GET' and path == '/stats':
+                    self.send(writer, 200, json.dumps(self.mutations).encode())
+                else:
+                    self.rest(writer, path, headers)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def send(self, writer, status: int, content: bytes, extra: str = ''):
+        reason = {200: 'OK', 304: 'Not Modified', 404: 'Not Found'}[status]
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(content)}\r\n{extra}\r\n".encode() + content
+        )
+
+    def rest(self, writer, path: str, headers: dict):
+        match = re.fullmatch(r'/api/character/(\d+)/?', path)
+        character = self.store.tables['Character'].get(int(match.group(1))) if match else None
+        if character is None:
+            self.send(writer, 404, b'{"error":"There is nothing here"}')
+            return
+        etag = character_etag(character)
+        if headers.get('if-none-match') == etag:
+            self.send(writer, 304, b'', f"ETag: {etag}\r\n")
+            return
+        body = rest_character(character, f"http://{headers.get('host', 'localhost')}")
+        self.send(writer, 200, json.dumps(body, separators=(',', ':')).encode(), f"ETag: {etag}\r\n")
+
+    async def websocket_session(self, reader, writer, headers: dict):
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {ws_accept_key(headers['sec-websocket-key'])}\r\n"
+            f"Sec-WebSocket-Protocol: {WS_PROTOCOL}\r\n\r\n".encode()
+        )
+        registered = []
+        try:
+            while True:
+                opcode, payload, _ = await read_frame(reader)
+                if opcode == OP_CLOSE:
+                    writer.write(encode_frame(b'', OP_CLOSE))
+                    return
+                if opcode == OP_PING:
+                    writer.write(encode_frame(payload, OP_PONG))
+                    continue
+                message = json.loads(payload)
+                if message['type'] == 'connection_init':
+                    writer.write(encode_frame(b'{"type":"connection_ack"}'))
+                elif message['type'] == 'subscribe':
+                    registered.append(self.subscribe(writer, message))
+                elif message['type'] == 'complete':
+                    for subscribers, subscriber in registered:
+                        if subscriber.sub_id == message['id']:
+                            subscribers.discard(subscriber)
+                await writer.drain()
+        finally:
+            for subscribers, subscriber in registered:
+                subscribers.discard(subscriber)
+
+    def subscribe(self, writer, message: dict):
+        payload = message['payload']
+        query, variables = payload['query'], payload.get('variables') or {}
+        try:
+            document = parse_and_validate(query, 'subscription')
+            character_id = int(_bind(document[0].args, variables)['id'])
+        except (GraphQLError, KeyError, TypeError, ValueError) as e:
+            error = {'id': message['id'], 'type': 'error', 'payload': [{'message': str(e)}]}
+            writer.write(encode_frame(json.dumps(error).encode()))
+            return set(), None
+        key = (query, json.dumps(variables, sort_keys=True))
+        _, _, subscribers = self.subscriptions.setdefault(character_id, {}).setdefault(
+            key, (document, variables, set())
+        )
+        subscriber = Subscriber(writer, message['id'])
+        subscribers.add(subscriber)
+        return subscribers, subscriber
+
+
+async def serve(port: int, mutation_rate: float, watch_ids: int, seed: int):
+    server = FeedServer(mutation_rate, watch_ids, seed)
+    listener = await asyncio.start_server(server.handle, '127.0.0.1', port, backlog=LISTEN_BACKLOG)
+    print(f"READY {listener.sockets[0].getsockname()[1]}", flush=True)
+    async with listener:
+        await asyncio.gather(listener.serve_forever(), server.mutator())
+
+
+# Clientes
+class ClientStats:
+    """Contadores de um cliente dentro da janela de medição."""
+
+    def __init__(self, character_id: int):
+        self.character_id = character_id
+        self.latencies: List[float] = []
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.requests = 0
+        self.errors = 0
+
+
+def mark_ready(window: dict):
+    """Sinaliza que um cliente terminou a conexão inicial (com sucesso ou não)."""
+    window['pending'] -= 1
+    if window['pending'] == 0:
+        window['connected'].set()
+
+
+async def read_http_response(reader: asyncio.StreamReader):
+    """Retorna (status, cabeçalhos, corpo, bytes_recebidos) de uma resposta com Content-Length."""
+    status_line, headers, head_bytes = await read_http_head(reader)
+    body = await reader.readexactly(int(headers.get('content-length', 0)))
+    return int(status_line.split(' ')[1]), headers, body, head_bytes + len(body)
+
+
+async def poll_client(host, port, stats: ClientStats, interval: float, conditional: bool, window: dict,
+                      phase: float = 0.0):
+    """
+    Consulta o personagem a cada `interval` segundos pela mesma conexão keep-alive,
+    começando `phase` segundos após a abertura da janela.
+    """
+    try:
+        async with window['slots']:
+            reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        stats.errors += 1
+        return
+    finally:
+        mark_ready(window)
+    etag = None
+    last_seen = None
+    await window['go'].wait()
+    next_at = time.monotonic() + phase
+    try:
+        while True:
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+            if time.time() >= window['stop']:
+                break
+            next_at += interval
+            request = f"GET /api/character/{stats.character_id} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+            if conditional and etag:
+                request += f"If-None-Match: {etag}\r\n"
+            request = (request + "\r\n").encode()
+            writer.write(request)
+            status, headers, body, received = await read_http_response(reader)
+            seen_at = time.time()
+            stats.requests += 1
+            stats.bytes_out += len(request)
+            stats.bytes_in += received
+            if status == 304:
+                continue
+            if status != 200:
+                stats.errors += 1
+                continue
+            etag = headers.get('etag')
+            updated_at = json.loads(body).get('updated_at')
+            if updated_at != last_seen:
+                last_seen = updated_at
+                if updated_at is not None and updated_at >= window['start']:
+                    stats.latencies.append(seen_at - updated_at)
+    except CLIENT_ERRORS:
+        stats.errors += 1
+    finally:
+        writer.close()
+
+
+async def subscription_client(host, port, stats: ClientStats, window: dict):
+    """Mantém uma assinatura `characterUpdated` aberta durante a janela de medição."""
+    writer = None
+
+    def send(message):
+        frame = encode_frame(json.dumps(message, separators=(',', ':')).encode(), mask=True)
+        writer.write(frame)
+        return len(frame)
+
+    try:
+        async with window['slots']:
+            reader, writer = await asyncio.open_connection(host, port)
+            key = base64.b64encode(os.urandom(16)).decode()
+            writer.write(
+                f"GET /graphql HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n"
+                f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n"
+                f"Sec-WebSocket-Protocol: {WS_PROTOCOL}\r\n\r\n".encode()
+            )
+            status_line, headers, _ = await read_http_head(reader)
+            if ' 101 ' not in status_line or headers.get('sec-websocket-accept') != ws_accept_key(key):
+                raise ConnectionError(status_line)
+            send({'type': 'connection_init'})
+            await read_frame(reader)  # connection_ack
+            send({'id': '1', 'type': 'subscribe',
+                  'payload': {'query': SUBSCRIPTION_QUERY, 'variables': {'id': stats.character_id}}})
+            await writer.drain()
+    except CLIENT_ERRORS:
+        stats.errors += 1
+        if writer is not None:
+            writer.close()
+        return
+    finally:
+        mark_ready(window)
+    await window['go'].wait()
+    try:
+        while True:
+            remaining = window['stop'] - time.time()
+            if remaining <= 0:
+                break
+            try:
+                opcode, payload, received = await asyncio.wait_for(read_frame(reader), remaining)
+            except asyncio.TimeoutError:
+                break
+            seen_at = time.time()
+            if opcode != OP_TEXT:
+                continue
+            message = json.loads(payload)
+            if message.get('type') != 'next':
+                stats.errors += message.get('type') == 'error'
+                continue
+            updated_at = message['payload']['data']['characterUpdated']['updated_at']
+            if updated_at >= window['start']:
+                stats.bytes_in += received
+                stats.latencies.append(seen_at - updated_at)
+        stats.bytes_out += send({'id': '1', 'type': 'complete'})
+        writer.write(encode_frame(b'', OP_CLOSE, mask=True))
+    except CLIENT_ERRORS:
+        stats.errors += 1
+    finally:
+        writer.close()
+
+
+async def fetch_mutation_log(host, port) -> Dict[int, List[float]]:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /stats HTTP/1.1\r\nHost: {host}:{port}\r\n\r\n".encode())
+    _, _, body, _ = await read_http_response(reader)
+    writer.close()
+    return {int(k): v for k, v in json.loads(body).items()}
+
+
+async def drive_clients(host, port, mode: str, n_clients: int, watch_ids: int,
+                        duration: float, poll_interval: float, rng: random.Random) -> dict:
+    """
+    Executa `n_clients` clientes em um único event loop e resume a janela de medição.
+
+    `rng` sorteia a fase de cada cliente de polling, para que os clientes não
+    consultem todos no mesmo instante e a execução seja reproduzível.
+    """
+    stats = [ClientStats(i % watch_ids + 1) for i in range(n_clients)]
+    window = {
+        'slots': asyncio.Semaphore(CONNECT_CONCURRENCY),
+        'pending': n_clients,
+        'connected': asyncio.Event(),
+        'go': asyncio.Event(),
+        'start': None,
+        'stop': None,
+    }
+    if mode == 'subscription':
+        tasks = [asyncio.create_task(subscription_client(host, port, s, window)) for s in stats]
+    else:
+        phases = [rng.random() * poll_interval for _ in stats]
+        tasks = [asyncio.create_task(poll_client(host, port, s, poll_interval, mode == 'conditional',
+                                                 window, phase=phase))
+                 for s, phase in zip(stats, phases)]
+
+    # A janela só abre depois que todas as conexões (e assinaturas) foram feitas
+    await window['connected'].wait()
+    await asyncio.sleep(0.5)
+    window['start'] = time.time()
+    window['stop'] = window['start'] + duration
+    cpu_start = time.process_time()
+    window['go'].set()
+    await asyncio.gather(*tasks)
+    cpu_seconds = time.process_time() - cpu_start
+
+    log = await fetch_mutation_log(host, port)
+    expected = sum(
+        sum(1 for t in log.get(s.character_id, []) if window['start'] <= t < window['stop'])
+        for s in stats
+    )
+    latencies = np.array([lat for s in stats for lat in s.latencies]) * 1000
+    delivered = len(latencies)
+    total_bytes = sum(s.bytes_in + s.bytes_out for s in stats)
+    return {
+        'mode': mode,
+        'clients': n_clients,
+        'changes_expected': expected,
+        'changes_delivered': delivered,
+        'delivery_ratio': delivered / expected if expected else np.nan,
+        'latency_p50_ms': np.percentile(latencies, 50) if delivered else np.nan,
+        'latency_p95_ms': np.percentile(latencies, 95) if delivered else np.nan,
+        'latency_p99_ms': np.percentile(latencies, 99) if delivered else np.nan,
+        'requests': sum(s.requests for s in stats),
+        'bytes_total': total_bytes,
+        'bytes_per_change': total_bytes / delivered if delivered else np.nan,
+        'client_cpu_pct': cpu_seconds / duration * 100,
+        'client_cpu_ms_per_change': cpu_seconds * 1000 / delivered if delivered else np.nan,
+        'errors': sum(s.errors for s in stats),
+    }
+
+
+def start_server(mutation_rate: float, watch_ids: int, seed: int):
+    """Sobe o servidor do change feed em um processo separado e devolve (processo, porta)."""
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), '--serve',
+         '--mutation-rate', str(mutation_rate), '--watch-ids', str(watch_ids), '--seed', str(seed)],
+        stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline()
+    match = re.match(r'READY (\d+)', line)
+    if not match:
+        process.kill()
+        raise RuntimeError(f"Servidor do change feed não iniciou: {line!r}")
+    return process, int(match.group(1))
+
+
+def run_scenario(mode: str, n_clients: int, args) -> dict:
+    process, port = start_server(args.mutation_rate, args.watch_ids, args.seed)
+    try:
+        return asyncio.run(drive_clients('127.0.0.1', port, mode, n_clients, args.watch_ids,
+                                         args.duration, args.poll_interval, random.Random(args.seed)))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def display_results(results: pd.DataFrame):
+    """Exibe a tabela comparativa no console."""
+    print("=" * 70)
+    print("CHANGE FEED: RESULTADOS")
+    print("=" * 70)
+    print(f"{'Modo':<13} {'Clientes':>8} {'Entregues':>10} {'p50 ms':>9} {'p99 ms':>9} "
+          f"{'Bytes/alt.':>11} {'CPU %':>7}")
+    for row in results.itertuples(index=False):
+        print(f"{row.mode:<13} {row.clients:>8} {row.delivery_ratio:>9.0%} {row.latency_p50_ms:>9.1f} "
+              f"{row.latency_p99_ms:>9.1f} {row.bytes_per_change:>11.0f} {row.client_cpu_pct:>7.1f}")
+    print()
+
+
+def main():
+    """
+    Função principal do cenário de change feed.
+    """
+    parser = argparse.ArgumentParser(
+        description='Change feed: assinaturas GraphQL vs polling REST contra o servidor local'
+    )
+    parser.add_argument(
+        '--modes',
+        type=str,
+        default=','.join(MODES),
+        help=f"Modos separados por vírgula (padrão: {','.join(MODES)})"
+    )
+    parser.add_argument(
+        '--clients',
+        type=str,
+        default='1,10,100,1000',
+        help='Números de clientes simultâneos, separados por vírgula (padrão: 1,10,100,1000)'
+    )
+    parser.add_argument('--duration', type=float, default=20.0, help='Janela de medição em segundos (padrão: 20)')
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=1.0,
+        help='Intervalo entre consultas nos modos de polling (padrão: 1.0 s)'
+    )
+    parser.add_argument(
+        '--mutation-rate',
+        type=float,
+        default=5.0,
+        help='Alterações por segundo no servidor (padrão: 5)'
+    )
+    parser.add_argument(
+        '--watch-ids',
+        type=int,
+        default=50,
+        help='Personagens alterados/acompanhados; clientes são distribuídos entre eles (padrão: 50)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Semente dos dados, das alterações e das fases de polling (padrão: 0)'
+    )
+    parser.add_argument('--out', type=str, default=None, help='Gravar os resultados neste CSV')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.serve:
+        raise_fd_limit(LISTEN_BACKLOG * 2)
+        asyncio.run(serve(0, args.mutation_rate, args.watch_ids, args.seed))
+        return
+
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        print(f"Erro: modos desconhecidos: {', '.join(sorted(unknown))}")
+        return
+    client_counts = [int(c) for c in args.clients.split(',')]
+    fd_limit = raise_fd_limit(max(client_counts) + 64)
+    if max(client_counts) + 64 > fd_limit:
+        print(f"⚠️  Limite de arquivos abertos ({fd_limit}) menor que o número de clientes")
+
+    print("=" * 70)
+    print("CHANGE FEED: GraphQL SUBSCRIPTIONS vs POLLING REST")
+    print("=" * 70)
+    print(f"Alterações: {args.mutation_rate}/s em {args.watch_ids} personagens")
+    print(f"Polling a cada {args.poll_interval} s · janela de {args.duration} s por cenário")
+    print()
+
+    rows = []
+    for mode in modes:
+        for n_clients in client_counts:
+            print(f"Executando {mode} com {n_clients} cliente(s)...")
+            row = run_scenario(mode, n_clients, args)
+            print(f"  ✓ {row['changes_delivered']}/{row['changes_expected']} alterações entregues, "
+                  f"p50 {row['latency_p50_ms']:.1f} ms, {row['bytes_per_change']:.0f} bytes/alteração")
+            rows.append(row)
+    print()
+
+    results = pd.DataFrame(rows)
+    display_results(results)
+    if args.out:
+        results.to_csv(args.out, index=False, encoding='utf-8')
+        print(f"✓ Resultados salvos: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
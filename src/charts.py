@@ -0,0 +1,419 @@
+"""
+Gráficos do Dashboard: REST vs GraphQL
+Disciplina: Laboratório de Experimentação de Software
+
+Funções `create_*` que constroem as figuras Plotly do dashboard. Recebem
+DataFrames já carregados e não dependem do Streamlit, podendo ser reutilizadas
+fora do dashboard.
+"""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Cores consistentes para REST e GraphQL
+COLORS = {
+    'REST': '#1f77b4',      # Azul
+    'GraphQL': '#ff7f0e'    # Laranja
+}
+
+# Limiares de renderização para conjuntos de dados grandes
+WEBGL_THRESHOLD = 5_000           # A partir daqui os traces usam WebGL (Scattergl)
+AGGREGATION_THRESHOLD = 100_000   # A partir daqui os pontos são agregados no servidor
+LTTB_TARGET_POINTS = 2_000        # Pontos por série após downsampling LTTB
+DENSITY_BINS = 200                # Resolução da grade de densidade (bins por eixo)
+EFFECT_COLOR_LIMIT = 2.0          # |Cohen's d| em que a escala de cor do heatmap satura
+
+# Funções de renderização escalável
+def scatter_trace_class(n_points):
+    """Retorna Scattergl (WebGL) para séries grandes e Scatter (SVG) para as demais."""
+    return go.Scattergl if n_points >= WEBGL_THRESHOLD else go.Scatter
+
+def lttb_downsample(x, y, n_out):
+    """
+    Reduz uma série ordenada para n_out pontos com Largest-Triangle-Three-Buckets,
+    preservando picos e vales visuais da curva original.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    # n_out - 2 buckets entre o primeiro e o último ponto (sempre mantidos)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Área do triângulo formado pelo ponto anterior, candidato e média do próximo bucket
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) -
+            (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return x[selected], y[selected]
+
+def density_grid(x, y, bins=DENSITY_BINS):
+    """
+    Rasteriza pontos em uma grade 2D no servidor (estilo datashader).
+    Retorna centros dos bins em x e y e a matriz de contagens (linhas = y).
+    """
+    counts, x_edges, y_edges = np.histogram2d(
+        np.asarray(x, dtype=float), np.asarray(y, dtype=float), bins=bins
+    )
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+    return x_centers, y_centers, counts.T
+
+def create_comparison_boxplot(df, metric_col, metric_label):
+    """Cria box plot comparativo."""
+    fig = px.box(
+        df,
+        x='type',
+        y=metric_col,
+        color='type',
+        color_discrete_map=COLORS,
+        title=f'Distribuição de {metric_label}',
+        labels={metric_col: metric_label, 'type': 'Tipo de API'}
+    )
+    fig.update_layout(
+        showlegend=False,
+        height=400,
+        template='plotly_white'
+    )
+    return fig
+
+def create_histogram_comparison(df, metric_col, metric_label):
+    """Cria histograma comparativo."""
+    fig = go.Figure()
+    
+    for api_type in ['REST', 'GraphQL']:
+        data = df[df['type'] == api_type][metric_col]
+        fig.add_trace(go.Histogram(
+            x=data,
+            name=api_type,
+            marker_color=COLORS[api_type],
+            opacity=0.7,
+            nbinsx=20
+        ))
+    
+    fig.update_layout(
+        title=f'Distribuição de {metric_label}',
+        xaxis_title=metric_label,
+        yaxis_title='Frequência',
+        barmode='overlay',
+        height=400,
+        template='plotly_white',
+        legend=dict(x=0.7, y=0.95)
+    )
+    return fig
+
+def create_line_plot_by_id(df, metric_col, metric_label):
+    """Cria gráfico de linha mostrando valores por ID."""
+    fig = go.Figure()
+    
+    for api_type in ['REST', 'GraphQL']:
+        data = df[df['type'] == api_type].sort_values('id')
+        x, y = data['id'].values, data[metric_col].values
+        
+        # Séries muito grandes são reduzidas com LTTB antes de ir ao navegador
+        if len(x) > AGGREGATION_THRESHOLD:
+            x, y = lttb_downsample(x, y, LTTB_TARGET_POINTS)
+        
+        trace_cls = scatter_trace_class(len(data))
+        fig.add_trace(trace_cls(
+            x=x,
+            y=y,
+            mode='lines+markers' if len(x) < WEBGL_THRESHOLD else 'lines',
+            name=api_type,
+            line=dict(color=COLORS[api_type], width=2),
+            marker=dict(size=6)
+        ))
+    
+    fig.update_layout(
+        title=f'{metric_label} por ID do Personagem',
+        xaxis_title='ID do Personagem',
+        yaxis_title=metric_label,
+        height=400,
+        template='plotly_white',
+        hovermode='x unified'
+    )
+    return fig
+
+def create_scatter_comparison(paired, metric_col, metric_label):
+    """Cria scatter plot comparando REST vs GraphQL a partir do índice pareado."""
+    pairs = paired[metric_col].dropna()
+    ids = pairs.index.get_level_values('id')
+    
+    fig = go.Figure()
+    n_points = len(pairs)
+    
+    if n_points > AGGREGATION_THRESHOLD:
+        # Densidade agregada no servidor: apenas a grade de contagens vai ao navegador
+        x_centers, y_centers, counts = density_grid(pairs['REST'].values, pairs['GraphQL'].values)
+        fig.add_trace(go.Heatmap(
+            x=x_centers,
+            y=y_centers,
+            z=np.where(counts > 0, counts, np.nan),
+            colorscale='Viridis',
+            colorbar=dict(title='Contagem'),
+            hovertemplate='REST: %{x:.2f}<br>GraphQL: %{y:.2f}<br>Contagem: %{z}<extra></extra>',
+            name='Densidade'
+        ))
+    else:
+        trace_cls = scatter_trace_class(n_points)
+        fig.add_trace(trace_cls(
+            x=pairs['REST'],
+            y=pairs['GraphQL'],
+            mode='markers',
+            marker=dict(
+                size=10 if n_points < WEBGL_THRESHOLD else 4,
+                color=ids,
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title='ID')
+            ),
+            text=ids,
+            hovertemplate='ID: %{text}<br>REST: %{x:.2f}<br>GraphQL: %{y:.2f}<extra></extra>',
+            name='Comparação'
+        ))
+    
+    # Linha de igualdade
+    min_val = min(pairs['REST'].min(), pairs['GraphQL'].min())
+    max_val = max(pairs['REST'].max(), pairs['GraphQL'].max())
+    fig.add_trace(go.Scatter(
+        x=[min_val, max_val],
+        y=[min_val, max_val],
+        mode='lines',
+        line=dict(dash='dash', color='gray'),
+        name='Linha de Igualdade',
+        showlegend=False
+    ))
+    
+    fig.update_layout(
+        title=f'Comparação {metric_label}: REST vs GraphQL',
+        xaxis_title=f'REST - {metric_label}',
+        yaxis_title=f'GraphQL - {metric_label}',
+        height=500,
+        template='plotly_white'
+    )
+    return fig
+
+def create_correlation_scatter(df):
+    """
+    Cria scatter de correlação entre tempo e tamanho da resposta.
+    Acima do limiar de agregação, cada tipo de API é binado no servidor e
+    exibido como pontos proporcionais à contagem de cada célula.
+    """
+    labels = {'time_ms': 'Tempo de Resposta (ms)', 'size_bytes': 'Tamanho da Resposta (bytes)'}
+    title = 'Correlação entre Tempo de Resposta e Tamanho da Resposta'
+    
+    if len(df) <= AGGREGATION_THRESHOLD:
+        fig = px.scatter(
+            df,
+            x='time_ms',
+            y='size_bytes',
+            color='type',
+            color_discrete_map=COLORS,
+            size='id',
+            hover_data=['id'],
+            title=title,
+            labels=labels,
+            render_mode='webgl' if len(df) >= WEBGL_THRESHOLD else 'svg'
+        )
+        fig.update_layout(height=500, template='plotly_white')
+        return fig
+    
+    fig = go.Figure()
+    for api_type in ['REST', 'GraphQL']:
+        data = df[df['type'] == api_type]
+        if data.empty:
+            continue
+        x_centers, y_centers, counts = density_grid(data['time_ms'].values, data['size_bytes'].values)
+        y_idx, x_idx = np.nonzero(counts)
+        cell_counts = counts[y_idx, x_idx]
+        fig.add_trace(go.Scattergl(
+            x=x_centers[x_idx],
+            y=y_centers[y_idx],
+            mode='markers',
+            name=api_type,
+            marker=dict(
+                color=COLORS[api_type],
+                size=4 + 4 * np.log10(cell_counts),
+                opacity=0.7
+            ),
+            customdata=cell_counts,
+            hovertemplate='Tempo: %{x:.2f} ms<br>Tamanho: %{y:.0f} bytes<br>Contagem: %{customdata:.0f}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title=labels['time_ms'],
+        yaxis_title=labels['size_bytes'],
+        height=500,
+        template='plotly_white'
+    )
+    return fig
+
+def create_outlier_plot(flagged, metric_col, metric_label):
+    """
+    Série de cada tipo de API na ordem de coleta, com a mediana móvel do filtro
+    de Hampel e os outliers destacados (ver analysis.hampel_flags).
+    """
+    x_col = 'started_at' if 'started_at' in flagged else 'id'
+    fig = go.Figure()
+    
+    for api_type in ['REST', 'GraphQL']:
+        data = flagged[flagged['type'] == api_type].sort_values(x_col, kind='stable')
+        if data.empty:
+            continue
+        x = data[x_col].values
+        series = {'valor': data[metric_col].values, 'mediana móvel': data['rolling_median'].values}
+        for name, y in series.items():
+            if len(x) > AGGREGATION_THRESHOLD:
+                x_plot, y = lttb_downsample(x, y, LTTB_TARGET_POINTS)
+            else:
+                x_plot = x
+            fig.add_trace(scatter_trace_class(len(x_plot))(
+                x=x_plot,
+                y=y,
+                mode='lines',
+                name=f'{api_type} ({name})',
+                line=dict(color=COLORS[api_type], width=1 if name == 'valor' else 2,
+                          dash='solid' if name == 'valor' else 'dot'),
+                opacity=0.5 if name == 'valor' else 1.0
+            ))
+        
+        hits = data[data['outlier']]
+        fig.add_trace(scatter_trace_class(len(hits))(
+            x=hits[x_col].values,
+            y=hits[metric_col].values,
+            mode='markers',
+            name=f'{api_type} (outlier)',
+            marker=dict(color='#d62728', size=9, symbol='x', line=dict(color=COLORS[api_type], width=1)),
+            customdata=np.column_stack([hits['id'].values, hits['outlier_score'].values]),
+            hovertemplate='ID %{customdata[0]}<br>%{y:.2f}<br>Score: %{customdata[1]:.1f}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=f'{metric_label} na Ordem de Coleta (outliers de Hampel em destaque)',
+        xaxis_title='Início da requisição (época Unix, s)' if x_col == 'started_at' else 'ID do Personagem',
+        yaxis_title=metric_label,
+        height=450,
+        template='plotly_white'
+    )
+    return fig
+
+def create_bar_comparison(df, metric_col, metric_label):
+    """Cria gráfico de barras comparativo."""
+    summary = df.groupby('type')[metric_col].agg(['mean', 'median', 'std']).reset_index()
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=summary['type'],
+        y=summary['mean'],
+        name='Média',
+        marker_color=[COLORS[t] for t in summary['type']],
+        error_y=dict(type='data', array=summary['std']),
+        text=[f"{v:.2f}" for v in summary['mean']],
+        textposition='outside'
+    ))
+    
+    fig.update_layout(
+        title=f'Média de {metric_label} com Desvio Padrão',
+        xaxis_title='Tipo de API',
+        yaxis_title=metric_label,
+        height=400,
+        template='plotly_white',
+        showlegend=False
+    )
+    return fig
+
+def create_effect_heatmap(matrix, metric_labels):
+    """
+    Heatmap do Cohen's d por cenário (linhas) e métrica (colunas).
+    
+    Recebe a tabela de `analysis.scenario_matrix`; células significativas após
+    a correção para comparações múltiplas são marcadas com ★.
+    """
+    metrics = list(dict.fromkeys(matrix['metric']))
+    d = matrix.pivot(index='scenario', columns='metric', values='cohens_d')[metrics]
+    p_adjusted = matrix.pivot(index='scenario', columns='metric', values='p_adjusted')[metrics]
+    significant = matrix.pivot(index='scenario', columns='metric', values='significant')[metrics]
+    significant = significant.fillna(False).astype(bool)
+    
+    # A cor satura em |d| = EFFECT_COLOR_LIMIT para que efeitos enormes (ou infinitos,
+    # em diferenças constantes) não apaguem o contraste das demais células
+    bound = EFFECT_COLOR_LIMIT
+    z = d.clip(-bound, bound)
+    text = np.where(significant, '★ ', '') + d.map(lambda v: f"{v:.2f}").to_numpy()
+    
+    fig = go.Figure(go.Heatmap(
+        x=[metric_labels.get(col, col) for col in d.columns],
+        y=d.index.astype(str),
+        z=z.to_numpy(dtype=float),
+        zmin=-bound,
+        zmax=bound,
+        colorscale='RdBu',
+        colorbar=dict(title="Cohen's d"),
+        text=text,
+        texttemplate='%{text}',
+        customdata=p_adjusted.to_numpy(dtype=float),
+        hovertemplate='Cenário: %{y}<br>Métrica: %{x}<br>d: %{text}'
+                      '<br>p ajustado: %{customdata:.4f}<extra></extra>'
+    ))
+    fig.update_layout(
+        title="Tamanho do Efeito (REST - GraphQL) por Cenário",
+        xaxis_title='Métrica',
+        yaxis_title='Cenário',
+        height=max(400, 40 * len(d.index) + 150),
+        template='plotly_white'
+    )
+    return fig
+
+def create_field_bytes_bar(field_bytes):
+    """
+    Barras horizontais com os bytes médios por resposta de cada campo de nível
+    superior do REST (tabela de `field_bytes.FieldByteTable.to_frame`).
+    """
+    top = field_bytes[field_bytes['depth'] == 0].sort_values('bytes_per_response')
+    fig = go.Figure(go.Bar(
+        x=top['bytes_per_response'],
+        y=top['field'],
+        orientation='h',
+        marker_color=COLORS['REST'],
+        text=[f"{share:.1f}%" for share in top['share_pct']],
+        textposition='outside',
+        hovertemplate='%{y}: %{x:.0f} bytes/resposta<extra></extra>'
+    ))
+    fig.update_layout(
+        title='Bytes por Campo da Resposta REST',
+        xaxis_title='Bytes por resposta (média)',
+        yaxis_title='Campo',
+        height=max(350, 30 * len(top) + 150),
+        template='plotly_white'
+    )
+    return fig
+
+FIGURE_BUILDERS = {
+    'boxplot': create_comparison_boxplot,
+    'histogram': create_histogram_comparison,
+    'line': create_line_plot_by_id,
+    'scatter': create_scatter_comparison,
+    'bar': create_bar_comparison,
+    'correlation': create_correlation_scatter,
+}
+
+# Gráficos construídos a partir do índice pareado em vez das linhas brutas
+PAIRED_BUILDERS = {'scatter'}
@@ -0,0 +1,181 @@
+"""
+Gate de Regressão de Desempenho: Baseline vs Candidata
+Disciplina: Laboratório de Experimentação de Software
+
+Compara duas execuções do experimento (por exemplo, antes e depois de um
+deploy) por tipo de API e cenário. Para tempo e tamanho da resposta, testa
+média, mediana e p99 e falha (código de saída 1) quando alguma estatística
+piora além da tolerância configurada com significância estatística. Grupos
+sem amostras suficientes em uma das execuções (por exemplo, todas as chamadas
+GraphQL da candidata falharam) também reprovam o gate, com código de saída 2.
+
+Uso:
+    python compare.py baseline.csv candidata.csv
+    python compare.py baseline.csv candidata.csv --time-tolerance 0.10 --json veredito.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from analysis import BOOTSTRAP_RESAMPLES, compare_result_sets, load_results
+
+# Códigos de saída
+EXIT_PASS = 0
+EXIT_REGRESSION = 1
+EXIT_ERROR = 2
+
+
+def build_verdict(checks, args):
+    """
+    Monta o veredito legível por máquina a partir da tabela de verificações.
+
+    Grupos com amostras insuficientes (ausentes em uma das execuções ou com menos
+    de 3 registros) reprovam o gate, a menos que `--allow-insufficient` seja usado.
+    """
+    regressions = int((checks['status'] == 'regression').sum())
+    insufficient = int((checks['status'] == 'insufficient').sum())
+    failed = regressions or (insufficient and not args.allow_insufficient)
+    return {
+        'verdict': 'fail' if failed else 'pass',
+        'baseline': os.path.abspath(args.baseline),
+        'candidate': os.path.abspath(args.candidate),
+        'alpha': args.alpha,
+        'tolerances': {
+            'time_ms': args.time_tolerance,
+            'size_bytes': args.size_tolerance,
+            'p99': args.tail_tolerance,
+        },
+        'regressions': regressions,
+        'insufficient': insufficient,
+        'improvements': int((checks['status'] == 'improvement').sum()),
+        'checks': json.loads(checks.to_json(orient='records')),
+    }
+
+
+def display_checks(checks):
+    """Exibe a tabela de verificações no console."""
+    symbols = {'ok': '✓', 'regression': '✗', 'improvement': '↑', 'insufficient': '?'}
+    print("=" * 70)
+    print("COMPARAÇÃO BASELINE vs CANDIDATA")
+    print("=" * 70)
+    for row in checks.itertuples(index=False):
+        operation = f" {row.operation:<18}" if 'operation' in checks else ""
+        label = f"{row.type:<8} {row.scenario:<12}{operation} {row.metric:<11}"
+        if row.status == 'insufficient':
+            print(f"  {symbols[row.status]} {label} amostras insuficientes "
+                  f"(baseline {row.n_baseline:.0f}, candidata {row.n_candidate:.0f})")
+            continue
+        print(f"  {symbols[row.status]} {label} {row.statistic:<7}"
+              f"{row.baseline:>11.2f} → {row.candidate:>11.2f} "
+              f"({row.rel_change:+7.1%}, tol {row.tolerance:.0%}, p={row.p_value:.4f})")
+    print()
+
+
+def main():
+    """
+    Função principal do gate de regressão.
+    """
+    parser = argparse.ArgumentParser(
+        description='Gate de regressão: compara uma execução candidata com a baseline'
+    )
+    parser.add_argument('baseline', help='CSV de resultados da execução de referência')
+    parser.add_argument('candidate', help='CSV de resultados da execução candidata')
+    parser.add_argument(
+        '--time-tolerance',
+        type=float,
+        default=0.05,
+        help='Piora relativa tolerada no tempo de resposta (padrão: 0.05 = 5%%)'
+    )
+    parser.add_argument(
+        '--size-tolerance',
+        type=float,
+        default=0.01,
+        help='Piora relativa tolerada no tamanho da resposta (padrão: 0.01 = 1%%)'
+    )
+    parser.add_argument(
+        '--tail-tolerance',
+        type=float,
+        default=None,
+        help='Tolerância própria para o p99 (padrão: a mesma da métrica)'
+    )
+    parser.add_argument(
+        '--alpha',
+        type=float,
+        default=0.05,
+        help='Nível de significância dos testes (padrão: 0.05)'
+    )
+    parser.add_argument(
+        '--resamples',
+        type=int,
+        default=BOOTSTRAP_RESAMPLES,
+        help=f'Reamostragens bootstrap para mediana e p99 (padrão: {BOOTSTRAP_RESAMPLES})'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Semente do bootstrap (padrão: 0)'
+    )
+    parser.add_argument(
+        '--unpaired',
+        action='store_true',
+        help='Tratar as execuções como amostras independentes mesmo com IDs em comum'
+    )
+    parser.add_argument(
+        '--allow-insufficient',
+        action='store_true',
+        help='Não reprovar grupos com amostras insuficientes (ausentes em uma das execuções '
+             'ou com menos de 3 registros); por padrão eles reprovam o gate'
+    )
+    parser.add_argument(
+        '--json',
+        type=str,
+        default=None,
+        help='Gravar o veredito em JSON neste arquivo ("-" para a saída padrão)'
+    )
+
+    args = parser.parse_args()
+
+    for path in (args.baseline, args.candidate):
+        if not os.path.exists(path):
+            print(f"Erro: arquivo não encontrado: {path}", file=sys.stderr)
+            sys.exit(EXIT_ERROR)
+
+    checks = compare_result_sets(
+        load_results(args.baseline),
+        load_results(args.candidate),
+        tolerances={'time_ms': args.time_tolerance, 'size_bytes': args.size_tolerance},
+        alpha=args.alpha,
+        tail_tolerance=args.tail_tolerance,
+        resamples=args.resamples,
+        seed=args.seed,
+        allow_paired=not args.unpaired
+    )
+    verdict = build_verdict(checks, args)
+
+    if args.json == '-':
+        print(json.dumps(verdict, indent=2, ensure_ascii=False))
+    else:
+        display_checks(checks)
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(verdict, f, indent=2, ensure_ascii=False)
+            print(f"✓ Veredito salvo: {args.json}")
+        if verdict['regressions']:
+            print(f"❌ {verdict['regressions']} regressão(ões) significativa(s) detectada(s)")
+        if verdict['insufficient']:
+            blocking = "" if args.allow_insufficient else " (reprovam o gate; veja --allow-insufficient)"
+            print(f"{'⚠️ ' if args.allow_insufficient else '❌'} {verdict['insufficient']} "
+                  f"verificação(ões) sem amostras suficientes{blocking}")
+        if verdict['verdict'] == 'pass':
+            print("✓ Nenhuma regressão significativa")
+
+    if verdict['regressions']:
+        sys.exit(EXIT_REGRESSION)
+    sys.exit(EXIT_ERROR if verdict['verdict'] == 'fail' else EXIT_PASS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,494 @@
+"""
+Geração de Carga Distribuída: Coordenador e Agentes
+Disciplina: Laboratório de Experimentação de Software
+
+Vários agentes (em máquinas diferentes ou no mesmo host) executam a medição
+pareada do coletor (`experimet.measure_pair`) contra o mesmo alvo. O
+coordenador:
+
+1. aceita os agentes por TCP e estima o deslocamento do relógio de cada um
+   (troca ping/pong no estilo NTP; vale a amostra de menor ida e volta);
+2. distribui os IDs entre os agentes (intercalados, para que todos cubram o
+   intervalo inteiro) e libera o início sincronizado (barreira);
+3. recebe, durante a coleta, lotes de registros e o histograma acumulado de
+   latência de cada agente;
+4. repete a estimativa de relógio ao final, converte o `started_at` de cada
+   registro para o relógio do coordenador e grava uma linha do tempo única.
+
+Cada mensagem é um JSON comprimido com zlib, precedido pelo tamanho (4 bytes).
+
+Uso:
+    python distributed.py coordinator --agents 3 --start 1 --end 60 --out merged.csv
+    python distributed.py agent --coordinator 10.0.0.5:7070
+
+    # Teste local: o coordenador inicia 3 agentes neste host
+    python distributed.py coordinator --local-agents 3 --base-url http://127.0.0.1:8000 --skip-warmup
+"""
+
+import argparse
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from typing import List, Optional
+
+import pandas as pd
+
+import experimet
+from metrics import LATENCY_BUCKETS, CollectorMetrics, bucket_quantile
+from result_buffer import ResultBuffer
+
+DEFAULT_PORT = 7070
+SYNC_ROUNDS = 16          # Trocas ping/pong por estimativa de relógio
+START_LEAD_S = 1.0        # Antecedência da barreira de início
+BATCH_RECORDS = 50        # Registros por lote enviado ao coordenador
+BATCH_INTERVAL_S = 1.0    # Intervalo máximo entre lotes
+BATCH_TIMEOUT_S = 120.0   # Espera máxima do coordenador por um lote antes de desistir do agente
+
+_HEADER = struct.Struct('!I')
+
+
+def send_message(sock: socket.socket, message: dict):
+    payload = zlib.compress(json.dumps(message).encode('utf-8'))
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    data = bytearray()
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise ConnectionError("Conexão encerrada pelo outro lado")
+        data += chunk
+    return bytes(data)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    (length,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return json.loads(zlib.decompress(_recv_exact(sock, length)))
+
+
+def expect(sock: socket.socket, kind: str) -> dict:
+    message = recv_message(sock)
+    if message.get('kind') != kind:
+        raise ConnectionError(f"Mensagem '{kind}' esperada, recebida '{message.get('kind')}'")
+    return message
+
+
+# Agente
+def run_agent(host: str, port: int, name: str):
+    """Conecta ao coordenador e atende suas mensagens até receber 'bye'."""
+    sock = socket.create_connection((host, port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    send_message(sock, {'kind': 'hello', 'name': name, 'host': socket.gethostname(), 'pid': os.getpid()})
+    schedule = None
+
+    while True:
+        message = recv_message(sock)
+        kind = message['kind']
+        if kind == 'ping':
+            send_message(sock, {'kind': 'pong', 'time': time.time()})
+        elif kind == 'schedule':
+            schedule = message
+            if schedule['base_url']:
+                base_url = schedule['base_url'].rstrip('/')
+                experimet.REST_BASE_URL = f"{base_url}/api/character"
+                experimet.GRAPHQL_URL = f"{base_url}/graphql"
+            if schedule['warmup']:
+                experimet.warmup()
+            send_message(sock, {'kind': 'ready'})
+        elif kind == 'start':
+            # Barreira: start_at já vem convertido para o relógio deste agente
+            time.sleep(max(0.0, message['start_at'] - time.time()))
+            _measure(sock, schedule['ids'])
+        elif kind == 'bye':
+            sock.close()
+            return
+        else:
+            raise ConnectionError(f"Mensagem desconhecida: {kind}")
+
+
+def _measure(sock: socket.socket, ids: List[int]):
+    """Mede os IDs atribuídos, enviando lotes de registros e o histograma acumulado."""
+    results = ResultBuffer(experimet.RESULT_SCHEMA)
+    pending = []
+    last_flush = time.monotonic()
+    sent = 0
+
+    def flush(kind='batch'):
+        nonlocal pending, last_flush, sent
+        send_message(sock, {'kind': kind, 'records': pending, 'metrics': experimet.METRICS.snapshot()})
+        sent += len(pending)
+        pending = []
+        last_flush = time.monotonic()
+
+    for character_id in ids:
+        experimet.report(f"Processando ID {character_id}...")
+        pending.extend(record for record in experimet.measure_pair(character_id, results) if record)
+        if len(pending) >= BATCH_RECORDS or time.monotonic() - last_flush >= BATCH_INTERVAL_S:
+            flush()
+    flush('done')
+
+
+# Coordenador
+class AgentLink:
+    """Conexão do coordenador com um agente e o que foi recebido dele."""
+
+    def __init__(self, sock: socket.socket, hello: dict):
+        self.sock = sock
+        self.name = hello['name']
+        self.host = hello['host']
+        self.ids: List[int] = []
+        self.records: List[dict] = []
+        self.metrics: Optional[dict] = None
+        self.batches = 0
+        self.wire_bytes = 0
+        self.sync_start = None
+        self.sync_end = None
+        self.error = None
+
+    def sync_clock(self) -> dict:
+        """
+        Estima o deslocamento (relógio do agente - relógio do coordenador).
+
+        Para cada troca, o agente responde com seu horário; supondo ida e volta
+        simétricas, ele corresponde ao ponto médio do intervalo no coordenador.
+        A troca de menor ida e volta tem o menor erro possível (± rtt/2).
+        """
+        best = None
+        for _ in range(SYNC_ROUNDS):
+            t0 = time.time()
+            send_message(self.sock, {'kind': 'ping'})
+            agent_time = expect(self.sock, 'pong')['time']
+            t1 = time.time()
+            rtt = t1 - t0
+            if best is None or rtt < best['rtt']:
+                best = {'rtt': rtt, 'offset': agent_time - (t0 + t1) / 2, 'at': t1}
+        return best
+
+    @property
+    def offset(self) -> float:
+        """Deslocamento médio entre o início e o fim da coleta."""
+        if self.sync_end is None:
+            return self.sync_start['offset']
+        return (self.sync_start['offset'] + self.sync_end['offset']) / 2
+
+    def receive(self, idle_timeout: Optional[float] = None):
+        """
+        Recebe lotes até a mensagem 'done' (executado em uma thread por agente).
+
+        Um agente que passa `idle_timeout` segundos sem enviar lote (travado,
+        mas com a conexão aberta) é abandonado, com o motivo em `error`.
+        """
+        self.sock.settimeout(idle_timeout)
+        try:
+            while True:
+                (length,) = _HEADER.unpack(_recv_exact(self.sock, _HEADER.size))
+                message = json.loads(zlib.decompress(_recv_exact(self.sock, length)))
+                self.wire_bytes += _HEADER.size + length
+                self.records.extend(message['records'])
+                self.metrics = message['metrics']
+                self.batches += 1
+                if message['kind'] == 'done':
+                    return
+        except socket.timeout:
+            self.error = f"nenhum lote em {idle_timeout:g} s"
+        except (ConnectionError, OSError, ValueError) as e:
+            self.error = str(e)
+
+
+HANDSHAKE_ERRORS = (ConnectionError, OSError, ValueError)
+
+
+def close_links(links: List[AgentLink]):
+    for link in links:
+        try:
+            link.sock.close()
+        except OSError:
+            pass
+
+
+def accept_agents(listener: socket.socket, n_agents: int, timeout: float,
+                  expected: Optional[List[str]] = None) -> List[AgentLink]:
+    """
+    Aguarda os n_agents agentes e seus 'hello' dentro de timeout segundos.
+
+    Se faltar algum (prazo esgotado ou agente encerrado durante o handshake),
+    fecha as conexões já aceitas e levanta ConnectionError dizendo quem faltou.
+    """
+    links = []
+    deadline = time.monotonic() + timeout
+    while len(links) < n_agents:
+        try:
+            listener.settimeout(max(deadline - time.monotonic(), 0.1))
+            sock, address = listener.accept()
+        except OSError as e:
+            close_links(links)
+            connected = [link.name for link in links]
+            missing = [name for name in expected or [] if name not in connected]
+            raise ConnectionError(
+                f"{len(links)} de {n_agents} agente(s) conectado(s) em {timeout:g} s "
+                f"({', '.join(connected) or 'nenhum'}); "
+                f"faltam {', '.join(missing) if missing else n_agents - len(links)} ({e})"
+            ) from e
+        try:
+            sock.settimeout(max(deadline - time.monotonic(), 0.1))
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            link = AgentLink(sock, expect(sock, 'hello'))
+            sock.settimeout(None)
+        except HANDSHAKE_ERRORS as e:
+            # Conexão que não se apresentou: descartada, o agente conta como ausente
+            sock.close()
+            print(f"  ⚠️  Handshake falhou com {address[0]}: {e}")
+            continue
+        links.append(link)
+        print(f"  ✓ Agente {link.name} conectado ({address[0]})")
+    return links
+
+
+def spawn_local_agents(n_agents: int, port: int) -> List[subprocess.Popen]:
+    """Inicia agentes neste host (teste local); o progresso deles é descartado."""
+    return [
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), 'agent',
+             '--coordinator', f"127.0.0.1:{port}", '--name', f"local-{i}"],
+            stdout=subprocess.DEVNULL
+        )
+        for i in range(1, n_agents + 1)
+    ]
+
+
+def merge_timeline(links: List[AgentLink]) -> pd.DataFrame:
+    """Registros de todos os agentes no relógio do coordenador, em ordem de início."""
+    frames = []
+    for link in links:
+        if not link.records:
+            continue
+        frame = pd.DataFrame(link.records)
+        frame['started_at'] = frame['started_at'] - link.offset
+        frame['agent'] = link.name
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=experimet.RESULT_COLUMNS + ['agent'])
+    merged = pd.concat(frames, ignore_index=True)
+    return merged.sort_values('started_at', kind='stable', ignore_index=True)
+
+
+def agent_report(links: List[AgentLink]) -> pd.DataFrame:
+    rows = []
+    for link in links:
+        rows.append({
+            'agent': link.name,
+            'host': link.host,
+            'ids': len(link.ids),
+            'records': len(link.records),
+            'batches': link.batches,
+            'wire_bytes': link.wire_bytes,
+            'offset_ms': link.offset * 1000,
+            'offset_error_ms': link.sync_start['rtt'] / 2 * 1000,
+            'drift_ms': ((link.sync_end['offset'] - link.sync_start['offset']) * 1000
+                         if link.sync_end else float('nan')),
+            'error': link.error or '',
+        })
+    return pd.DataFrame(rows)
+
+
+def display_results(merged: pd.DataFrame, agents: pd.DataFrame, metrics: CollectorMetrics):
+    print("=" * 70)
+    print("AGENTES")
+    print("=" * 70)
+    for row in agents.itertuples(index=False):
+        status = f"⚠️  {row.error}" if row.error else "✓"
+        print(f"{status} {row.agent:<12} {row.records:>6} registros, {row.batches:>4} lotes, "
+              f"{row.wire_bytes / 1024:>8.1f} KiB · relógio {row.offset_ms:+.3f} ms "
+              f"(± {row.offset_error_ms:.3f} ms, deriva {row.drift_ms:+.3f} ms)")
+    print()
+
+    print("=" * 70)
+    print("HISTOGRAMA AGREGADO (todos os agentes)")
+    print("=" * 70)
+    for (api_type, scenario), counts in sorted(metrics.buckets.items()):
+        p50, p95, p99 = (bucket_quantile(counts, q) * 1000 for q in (0.5, 0.95, 0.99))
+        print(f"{api_type:<8} [{scenario}] {sum(counts):>6} req · "
+              f"p50 ≈ {p50:.1f} ms, p95 ≈ {p95:.1f} ms, p99 ≈ {p99:.1f} ms "
+              f"(buckets até {LATENCY_BUCKETS[-1]:g} s)")
+    print()
+
+    if len(merged):
+        span = merged['started_at'].max() - merged['started_at'].min()
+        print("=" * 70)
+        print("LINHA DO TEMPO UNIFICADA")
+        print("=" * 70)
+        print(f"✓ {len(merged)} registros em {span:.2f} s "
+              f"({len(merged) / max(span, 1e-9):.1f} requisições bem-sucedidas/s agregadas)")
+        print()
+
+
+def run_coordinator(args):
+    listener = socket.create_server((args.host, args.port))
+    port = listener.getsockname()[1]
+    ids = list(range(args.start, args.end + 1))
+    n_agents = args.local_agents or args.agents
+
+    print()
+    print("=" * 70)
+    print("COORDENADOR: REST vs GraphQL DISTRIBUÍDO")
+    print("=" * 70)
+    print(f"Escutando em {args.host}:{port} · aguardando {n_agents} agente(s)")
+    print(f"IDs {args.start} a {args.end} ({len(ids)} personagens, {len(ids) * 2} requisições)")
+    print()
+
+    processes = spawn_local_agents(args.local_agents, port) if args.local_agents else []
+    expected = [f"local-{i}" for i in range(1, args.local_agents + 1)] if args.local_agents else None
+    collected = False
+    try:
+        try:
+            links = accept_agents(listener, n_agents, args.accept_timeout, expected)
+        except ConnectionError as e:
+            print(f"\n❌ Erro: {e}")
+            return False
+        print()
+
+        # Relógios e distribuição dos IDs (intercalados)
+        link = None
+        try:
+            for i, link in enumerate(links):
+                link.sync_start = link.sync_clock()
+                link.ids = ids[i::len(links)]
+                send_message(link.sock, {
+                    'kind': 'schedule', 'ids': link.ids,
+                    'base_url': args.base_url, 'warmup': not args.skip_warmup,
+                })
+            for link in links:
+                expect(link.sock, 'ready')
+        except HANDSHAKE_ERRORS as e:
+            close_links(links)
+            print(f"\n❌ Erro: agente {link.name} falhou antes do início ({e}); coleta cancelada")
+            return False
+
+        # Barreira de início, convertida para o relógio de cada agente
+        start_at = time.time() + START_LEAD_S
+        for link in links:
+            send_message(link.sock, {'kind': 'start', 'start_at': start_at + link.sync_start['offset']})
+        print(f"🚦 Início sincronizado de {len(links)} agente(s)")
+
+        threads = [threading.Thread(target=link.receive, args=(args.batch_timeout,), daemon=True)
+                   for link in links]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Um agente que sai logo após 'done' não pode custar os dados já recebidos
+        for link in links:
+            if link.error is None:
+                try:
+                    link.sync_end = link.sync_clock()
+                    send_message(link.sock, {'kind': 'bye'})
+                except HANDSHAKE_ERRORS as e:
+                    link.error = f"falha ao encerrar: {e}"
+        close_links(links)
+        print(f"✓ Coleta concluída em {time.time() - start_at:.2f} s")
+        print()
+        collected = True
+    finally:
+        listener.close()
+        for process in processes:
+            try:
+                process.wait(timeout=10 if collected else 0)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    metrics = CollectorMetrics()
+    for link in links:
+        if link.metrics is not None:
+            metrics.merge(link.metrics)
+    merged = merge_timeline(links)
+    agents = agent_report(links)
+
+    merged.to_csv(args.out, index=False, encoding='utf-8')
+    agents_path = os.path.splitext(args.out)[0] + '.agents.csv'
+    agents.to_csv(agents_path, index=False, encoding='utf-8')
+    display_results(merged, agents, metrics)
+    print(f"✓ Linha do tempo salva em: {args.out}")
+    print(f"✓ Relógios e estatísticas dos agentes em: {agents_path}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Coleta REST vs GraphQL distribuída entre vários agentes'
+    )
+    roles = parser.add_subparsers(dest='role', required=True)
+
+    coordinator = roles.add_parser('coordinator', help='Distribui os IDs e agrega os resultados')
+    coordinator.add_argument('--host', type=str, default='0.0.0.0', help='Interface de escuta (padrão: 0.0.0.0)')
+    coordinator.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Porta TCP (padrão: {DEFAULT_PORT})')
+    coordinator.add_argument('--agents', type=int, default=2, help='Agentes esperados (padrão: 2)')
+    coordinator.add_argument(
+        '--local-agents',
+        type=int,
+        default=0,
+        help='Iniciar N agentes neste host (teste local; substitui --agents)'
+    )
+    coordinator.add_argument('--start', type=int, default=1, help='ID inicial (padrão: 1)')
+    coordinator.add_argument('--end', type=int, default=50, help='ID final (padrão: 50)')
+    coordinator.add_argument(
+        '--base-url',
+        type=str,
+        default=None,
+        help='Raiz de um servidor alternativo (ex.: local_server.py); padrão: API pública'
+    )
+    coordinator.add_argument('--skip-warmup', action='store_true', help='Pular o warm-up nos agentes')
+    coordinator.add_argument(
+        '--accept-timeout',
+        type=float,
+        default=60.0,
+        help='Tempo máximo de espera pelos agentes em segundos (padrão: 60)'
+    )
+    coordinator.add_argument(
+        '--batch-timeout',
+        type=float,
+        default=BATCH_TIMEOUT_S,
+        help=f'Tempo máximo sem lotes de um agente em segundos, durante a coleta (padrão: {BATCH_TIMEOUT_S:g})'
+    )
+    coordinator.add_argument(
+        '--out',
+        type=str,
+        default='distributed_results.csv',
+        help='CSV da linha do tempo unificada (padrão: distributed_results.csv)'
+    )
+
+    agent = roles.add_parser('agent', help='Executa a medição atribuída pelo coordenador')
+    agent.add_argument('--coordinator', type=str, required=True, help='Endereço HOST:PORTA do coordenador')
+    agent.add_argument(
+        '--name',
+        type=str,
+        default=None,
+        help='Nome do agente na linha do tempo (padrão: host-pid)'
+    )
+
+    args = parser.parse_args()
+
+    if args.role == 'agent':
+        host, _, port = args.coordinator.rpartition(':')
+        run_agent(host, int(port), args.name or f"{socket.gethostname()}-{os.getpid()}")
+        return
+
+    if args.start < 1 or args.end < args.start:
+        print("Erro: intervalo de IDs inválido (--start >= 1 e --end >= --start)")
+        return
+    if (args.local_agents or args.agents) < 1:
+        print("Erro: é necessário ao menos um agente")
+        return
+    if not run_coordinator(args):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,100 +8,307 @@ de APIs REST e GraphQL usando a Rick and Morty API.
 
 Uso:
     python experiment.py --start 1 --end 50 --out experiment_results.csv
+    python experiment.py --start 1 --end 5000 --out live.csv --stream
+    python experiment.py --start 1 --end 500 --adaptive --target-time-ms 20
+    python experiment.py --base-url http://127.0.0.1:8000 --skip-warmup  # servidor local
+    python experiment.py --start 1 --end 50 --field-bytes field_bytes.csv
+    python experiment.py --workload scenarios/mix_leitura.toml --base-url http://127.0.0.1:8000
+    python experiment.py --start 1 --end 50 --order latin --shuffle-ids --rounds 3 --seed 42
 """
 
 import requests
 import time
+import numpy as np
 import pandas as pd
 import argparse
+import csv
 import random
-from typing import Tuple, Optional
+import re
+import queue
+import threading
+from typing import Callable, Tuple, Optional, TextIO
+
+from calibration import CALIBRATION_SAMPLES, calibrate, save_calibration
+from field_bytes import FieldByteTable
+from metrics import CollectorMetrics, start_metrics_server
+from online_stats import RunningStats, confidence_sequence_halfwidth
+from profiler import DEFAULT_INTERVAL_MS, SamplingProfiler
+from result_buffer import CATEGORY, ResultBuffer
+from workload import (DEFAULT_PAIR, ORDERS, Operation, Workload, id_sampler, load_workload, operation_orders,
+                      paired_steps, paired_workload, run_manifest, save_run_manifest)
 
 # Configurações globais
 REST_BASE_URL = "https://rickandmortyapi.com/api/character"
 GRAPHQL_URL = "https://rickandmortyapi.com/graphql"
 
+# Tamanho de amostra (pares) em que a sequência de confiança adaptativa é otimizada
+CS_PLANNED_PAIRS = 50
+# Pares mínimos antes de parar: a sequência é assintótica e, com poucos pares,
+# o desvio padrão estimado ainda é instável demais para garantir a cobertura
+CS_MIN_PAIRS = 10
+
+# Espera entre requisições para evitar rate limiting (segundos)
+RATE_LIMIT_DELAY = 0.1
+
+# Esquema do buffer de resultados; a ordem das chaves é a ordem das colunas no CSV
+RESULT_SCHEMA = {
+    'id': np.int32,
+    'type': CATEGORY,
+    'time_ms': np.float64,
+    'size_bytes': np.int32,
+    'server_ms': np.float64,
+    'scenario': CATEGORY,
+    'operation': CATEGORY,
+    'pair': CATEGORY,
+    'round': np.int16,
+    'position': np.int8,
+    'started_at': np.float64,
+}
+RESULT_COLUMNS = list(RESULT_SCHEMA)
+
+# Cenário atribuído às medições da coleta pareada padrão
+DEFAULT_SCENARIO = 'default'
+
 # Query GraphQL solicitando apenas 3 campos específicos
-GRAPHQL_QUERY_TEMPLATE = """
-query {{
-  character(id: {id}) {{
+GRAPHQL_QUERY = """
+query ($id: ID!) {
+  character(id: $id) {
     name
     species
     status
-  }}
-}}
+  }
+}
 """
 
+# Operações da coleta pareada padrão (um REST e um GraphQL por ID)
+DEFAULT_OPERATION_SPECS = [
+    {'name': 'character_rest', 'kind': 'rest_single', 'pair': DEFAULT_PAIR},
+    {'name': 'character_graphql', 'kind': 'graphql', 'query': GRAPHQL_QUERY, 'pair': DEFAULT_PAIR},
+]
+DEFAULT_REST_OPERATION, DEFAULT_GRAPHQL_OPERATION = (Operation(spec) for spec in DEFAULT_OPERATION_SPECS)
+
+
+class ProgressReporter:
+    """
+    Imprime as mensagens de progresso em uma thread própria.
+    
+    Durante a coleta, o laço de medição apenas enfileira as mensagens; a escrita
+    no console (que pode bloquear) acontece fora do caminho das requisições.
+    Enquanto o reporter não estiver ativo, as mensagens são impressas direto.
+    """
+    
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+    
+    def _run(self):
+        while True:
+            message = self._queue.get()
+            if message is None:
+                break
+            print(message)
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='progress-reporter', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Esvazia a fila e encerra a thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+    
+    def report(self, message: str = ''):
+        if self._thread is None:
+            print(message)
+        else:
+            self._queue.put(message)
+
+
+REPORTER = ProgressReporter()
+
+# Métricas da coleta (expostas em /metrics com --metrics-port)
+METRICS = CollectorMetrics(RATE_LIMIT_DELAY)
+
+
+def report(message: str = ''):
+    """Envia uma mensagem de progresso ao reporter do coletor."""
+    REPORTER.report(message)
+
+
+def parse_server_timing(response: requests.Response) -> float:
+    """
+    Tempo gasto no servidor (ms) informado pela resposta, ou NaN se ausente.
+    
+    Usa `extensions.timing.resolve_ms` das respostas GraphQL do servidor local e,
+    na falta dele, a métrica `dur` do cabeçalho Server-Timing.
+    """
+    if 'application/json' in response.headers.get('Content-Type', ''):
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        timing = body.get('extensions', {}).get('timing', {}) if isinstance(body, dict) else {}
+        if 'resolve_ms' in timing:
+            return float(timing['resolve_ms'])
+    match = re.search(r'dur=([\d.]+)', response.headers.get('Server-Timing', ''))
+    return float(match.group(1)) if match else float('nan')
+
+
+def timed_request(method: str, url: str, field_bytes: Optional[FieldByteTable] = None,
+                  **kwargs) -> Tuple[float, int, float, requests.Response]:
+    """
+    Executa e cronometra uma requisição HTTP.
+    
+    Args:
+        method: Método HTTP ('GET' ou 'POST')
+        url: Endereço completo
+        field_bytes: Tabela que recebe a atribuição de bytes por campo do
+            corpo (opcional; processada fora da medição de tempo)
+        **kwargs: Repassados a requests.request (ex.: json=)
+        
+    Returns:
+        Tupla (tempo_ms, tamanho_bytes, servidor_ms, resposta)
+        
+    Raises:
+        requests.exceptions.RequestException: Falha de rede ou status HTTP de erro
+    """
+    # Medição do tempo
+    start_time = time.perf_counter()
+    response = requests.request(method, url, timeout=10, **kwargs)
+    end_time = time.perf_counter()
+    
+    # Verificar se a requisição foi bem-sucedida
+    response.raise_for_status()
+    
+    # Calcular métricas
+    time_ms = (end_time - start_time) * 1000  # Converter para ms
+    if field_bytes is not None:
+        field_bytes.add(response.content)
+    return time_ms, len(response.content), parse_server_timing(response), response
+
 
-def make_rest_request(character_id: int) -> Tuple[Optional[float], Optional[int], bool]:
+def make_rest_request(character_id: int, field_bytes: Optional[FieldByteTable] = None,
+                      base_url: Optional[str] = None
+                      ) -> Tuple[Optional[float], Optional[int], Optional[float], bool]:
     """
     Realiza requisição REST para obter dados de um personagem.
     
     Args:
         character_id: ID do personagem a ser consultado
+        field_bytes: Tabela que recebe a atribuição de bytes por campo do
+            corpo (opcional; processada fora da medição de tempo)
+        base_url: Raiz do recurso de personagens (padrão: REST_BASE_URL)
         
     Returns:
-        Tupla (tempo_ms, tamanho_bytes, sucesso)
+        Tupla (tempo_ms, tamanho_bytes, servidor_ms, sucesso)
         - tempo_ms: Tempo de resposta em milissegundos
         - tamanho_bytes: Tamanho da resposta em bytes
+        - servidor_ms: Tempo informado pelo servidor (NaN se não informado)
         - sucesso: True se a requisição foi bem-sucedida
     """
-    url = f"{REST_BASE_URL}/{character_id}"
-    
+    return rest_get(f"{base_url or REST_BASE_URL}/{character_id}", f"ID {character_id}", field_bytes)
+
+
+def rest_get(url: str, label: str, field_bytes: Optional[FieldByteTable] = None
+             ) -> Tuple[Optional[float], Optional[int], Optional[float], bool]:
+    """GET REST cronometrado; falhas são reportadas com `label` e retornam sucesso False."""
     try:
-        # Medição do tempo
-        start_time = time.time()
-        response = requests.get(url, timeout=10)
-        end_time = time.time()
-        
-        # Verificar se a requisição foi bem-sucedida
-        response.raise_for_status()
-        
-        # Calcular métricas
-        time_ms = (end_time - start_time) * 1000  # Converter para ms
-        size_bytes = len(response.content)
-        
-        return time_ms, size_bytes, True
+        time_ms, size_bytes, server_ms, _ = timed_request('GET', url, field_bytes)
+        return time_ms, size_bytes, server_ms, True
         
     except requests.exceptions.RequestException as e:
-        print(f"  ⚠️  Erro na requisição REST (ID {character_id}): {e}")
-        return None, None, False
+        report(f"  ⚠️  Erro na requisição REST ({label}): {e}")
+        return None, None, None, False
 
 
-def make_graphql_request(character_id: int) -> Tuple[Optional[float], Optional[int], bool]:
+def make_graphql_request(character_id: int, graphql_url: Optional[str] = None,
+                         query: str = GRAPHQL_QUERY, variables: Optional[dict] = None
+                         ) -> Tuple[Optional[float], Optional[int], Optional[float], bool]:
     """
     Realiza requisição GraphQL para obter dados específicos de um personagem.
     
     Args:
         character_id: ID do personagem a ser consultado
+        graphql_url: Endpoint GraphQL (padrão: GRAPHQL_URL)
+        query: Documento GraphQL (padrão: GRAPHQL_QUERY, com 3 campos)
+        variables: Variáveis da query (padrão: {"id": character_id})
         
     Returns:
-        Tupla (tempo_ms, tamanho_bytes, sucesso)
+        Tupla (tempo_ms, tamanho_bytes, servidor_ms, sucesso)
         - tempo_ms: Tempo de resposta em milissegundos
         - tamanho_bytes: Tamanho da resposta em bytes
+        - servidor_ms: Tempo informado pelo servidor (NaN se não informado)
         - sucesso: True se a requisição foi bem-sucedida
     """
-    query = GRAPHQL_QUERY_TEMPLATE.format(id=character_id)
-    payload = {"query": query}
+    payload = {"query": query, "variables": variables if variables is not None else {"id": character_id}}
     
     try:
-        # Medição do tempo
-        start_time = time.time()
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=10)
-        end_time = time.time()
-        
-        # Verificar se a requisição foi bem-sucedida
-        response.raise_for_status()
+        time_ms, size_bytes, server_ms, _ = timed_request('POST', graphql_url or GRAPHQL_URL, json=payload)
+        return time_ms, size_bytes, server_ms, True
         
-        # Calcular métricas
-        time_ms = (end_time - start_time) * 1000  # Converter para ms
-        size_bytes = len(response.content)
+    except requests.exceptions.RequestException as e:
+        report(f"  ⚠️  Erro na requisição GraphQL (ID {character_id}): {e}")
+        return None, None, None, False
+
+
+def make_nested_rest_request(character_id: int) -> Tuple[Optional[float], Optional[int], Optional[float], bool]:
+    """
+    Busca um personagem, sua localização e seus episódios pelo REST, seguindo
+    os links do corpo (três idas ao servidor; episódios em um único lote).
+    
+    Returns:
+        Tupla (tempo_ms, tamanho_bytes, servidor_ms, sucesso) somando as idas
+    """
+    try:
+        time_ms, size_bytes, server_ms, response = timed_request('GET', f"{REST_BASE_URL}/{character_id}")
+        character = response.json()
+        links = []
+        if character.get('location', {}).get('url'):
+            links.append(character['location']['url'])
+        if character.get('episode'):
+            root, _, _ = character['episode'][0].rpartition('/')
+            links.append(f"{root}/{','.join(url.rpartition('/')[2] for url in character['episode'])}")
+        for url in links:
+            link_ms, link_bytes, link_server_ms, _ = timed_request('GET', url)
+            time_ms += link_ms
+            size_bytes += link_bytes
+            server_ms += link_server_ms
+        return time_ms, size_bytes, server_ms, True
         
-        return time_ms, size_bytes, True
+    except (requests.exceptions.RequestException, ValueError) as e:
+        report(f"  ⚠️  Erro na requisição REST aninhada (ID {character_id}): {e}")
+        return None, None, None, False
+
+
+def execute_operation(operation: Operation, key: int, draw: Callable[[], int],
+                      field_bytes: Optional[FieldByteTable] = None
+                      ) -> Tuple[Optional[float], Optional[int], Optional[float], bool]:
+    """
+    Executa uma operação do cenário.
+    
+    Args:
+        operation: Operação (ver workload.OPERATION_KINDS)
+        key: ID sorteado (página, em rest_page e em queries com $page)
+        draw: Sorteador de IDs da operação, usado para completar os lotes
+        field_bytes: Tabela de bytes por campo (apenas rest_single)
         
-    except requests.exceptions.RequestException as e:
-        print(f"  ⚠️  Erro na requisição GraphQL (ID {character_id}): {e}")
-        return None, None, False
+    Returns:
+        Tupla (tempo_ms, tamanho_bytes, servidor_ms, sucesso)
+    """
+    batch = [key] + [draw() for _ in range(operation.batch_size - 1)]
+    if operation.kind == 'rest_single':
+        return make_rest_request(key, field_bytes)
+    if operation.kind == 'rest_batch':
+        return rest_get(f"{REST_BASE_URL}/{','.join(map(str, batch))}", f"lote a partir do ID {key}")
+    if operation.kind == 'rest_page':
+        return rest_get(f"{REST_BASE_URL}?page={key}", f"página {key}")
+    if operation.kind == 'rest_nested':
+        return make_nested_rest_request(key)
+    variables = {name: value for name, value in (('id', key), ('ids', batch), ('page', key))
+                 if name in operation.variables}
+    return make_graphql_request(key, query=operation.query, variables=variables)
 
 
 def warmup():
@@ -123,7 +330,7 @@ def warmup():
     # Warm-up REST
     print("Aquecimento REST:")
     for i, char_id in enumerate(warmup_ids, 1):
-        time_ms, size_bytes, success = make_rest_request(char_id)
+        time_ms, size_bytes, server_ms, success = make_rest_request(char_id)
         status = "✓" if success else "✗"
         print(f"  {status} Requisição {i}/5 - ID {char_id}")
     
@@ -132,7 +339,7 @@ def warmup():
     # Warm-up GraphQL
     print("Aquecimento GraphQL:")
     for i, char_id in enumerate(warmup_ids, 1):
-        time_ms, size_bytes, success = make_graphql_request(char_id)
+        time_ms, size_bytes, server_ms, success = make_graphql_request(char_id)
         status = "✓" if success else "✗"
         print(f"  {status} Requisição {i}/5 - ID {char_id}")
     
@@ -141,81 +348,350 @@ def warmup():
     print()
 
 
-def run_experiment(start_id: int, end_id: int) -> list:
+def calibrate_harness(samples: int = CALIBRATION_SAMPLES) -> dict:
+    """
+    Mede o piso do harness: resolução do relógio, custo do par de leituras e
+    latência contra um endpoint nulo local, percorrendo exatamente os mesmos
+    caminhos de cliente (make_rest_request / make_graphql_request) da coleta.
+    
+    Args:
+        samples: Requisições por caminho de cliente
+        
+    Returns:
+        Dicionário da calibração (ver calibration.calibrate)
+    """
+    print("=" * 70)
+    print("CALIBRAÇÃO DO HARNESS")
+    print("=" * 70)
+    print(f"Medindo o relógio e {samples} requisições por tipo contra um endpoint nulo local...")
+    print()
+    
+    calibration = calibrate(
+        lambda base: make_rest_request(1, base_url=f"{base}/api/character")[0],
+        lambda base: make_graphql_request(1, graphql_url=f"{base}/graphql")[0],
+        samples
+    )
+    
+    print(f"✓ Relógio: perf_counter ({calibration['implementation']}), "
+          f"resolução {calibration['resolution_ns']:.0f} ns, "
+          f"menor passo observado {calibration['observed_step_ns']:.0f} ns")
+    print(f"✓ Custo do par de leituras: {calibration['timer_overhead_ns']:.0f} ns")
+    print(f"✓ Endpoint nulo REST    : mediana {calibration['null_rest']['median_ms']:.3f} ms, "
+          f"p95 {calibration['null_rest']['p95_ms']:.3f} ms")
+    print(f"✓ Endpoint nulo GraphQL : mediana {calibration['null_graphql']['median_ms']:.3f} ms, "
+          f"p95 {calibration['null_graphql']['p95_ms']:.3f} ms")
+    print()
+    return calibration
+
+
+def open_result_stream(output_file: str) -> TextIO:
+    """
+    Abre o arquivo de saída para gravação incremental (modo ao vivo).
+    
+    O cabeçalho é gravado imediatamente, permitindo que o dashboard acompanhe
+    o arquivo enquanto a coleta ainda está em andamento.
+    
+    Args:
+        output_file: Nome do arquivo CSV de saída
+        
+    Returns:
+        Arquivo aberto em modo texto, posicionado após o cabeçalho
+    """
+    stream = open(output_file, 'w', encoding='utf-8', newline='')
+    csv.writer(stream, lineterminator='\n').writerow(RESULT_COLUMNS)
+    stream.flush()
+    return stream
+
+
+def record_result(results: ResultBuffer, record: dict, stream: Optional[TextIO] = None):
+    """
+    Armazena uma medição e, no modo ao vivo, a grava imediatamente no CSV.
+    
+    Args:
+        results: Buffer colunar de resultados em memória
+        record: Dicionário com as colunas de RESULT_COLUMNS
+        stream: Arquivo aberto por open_result_stream (opcional)
+    """
+    results.append(record)
+    if stream is not None:
+        # Nomes de cenário e operação são livres: campos com vírgula ou aspas vão entre aspas
+        csv.writer(stream, lineterminator='\n').writerow([record[col] for col in RESULT_COLUMNS])
+        stream.flush()
+
+
+def measure_operation(operation: Operation, key: int, draw: Callable[[], int], results: ResultBuffer,
+                      stream: Optional[TextIO] = None, field_bytes: Optional[FieldByteTable] = None,
+                      scenario: str = DEFAULT_SCENARIO, round_number: int = 1,
+                      position: int = 1) -> Optional[dict]:
+    """
+    Executa uma operação, registra as métricas e armazena o registro se bem-sucedida.
+    
+    Args:
+        operation: Operação a executar
+        key: ID sorteado para a operação
+        draw: Sorteador de IDs da operação (lotes)
+        results: Buffer colunar de resultados em memória
+        stream: Arquivo para gravação incremental dos resultados (opcional)
+        field_bytes: Tabela de bytes por campo das respostas REST (opcional)
+        scenario: Cenário gravado no registro
+        round_number: Rodada do cenário (1 na coleta sem repetições)
+        position: Posição da operação no passo (1 = executada primeiro)
+        
+    Returns:
+        Registro armazenado, ou None se a operação falhou
+    """
+    started_at = time.time()
+    METRICS.begin(operation.api_type)
+    time_ms, size_bytes, server_ms, success = execute_operation(operation, key, draw, field_bytes)
+    METRICS.observe(operation.api_type, scenario, time_ms, size_bytes, success)
+    
+    if not success:
+        report(f"  ✗ {operation.api_type:<8}: Falhou ({operation.name})")
+        return None
+    
+    record = {
+        'id': key,
+        'type': operation.api_type,
+        'time_ms': time_ms,
+        'size_bytes': size_bytes,
+        'server_ms': server_ms,
+        'scenario': scenario,
+        'operation': operation.name,
+        'pair': operation.pair or '',
+        'round': round_number,
+        'position': position,
+        'started_at': started_at
+    }
+    record_result(results, record, stream)
+    report(f"  ✓ {operation.api_type:<8}: {time_ms:.2f} ms, {size_bytes} bytes ({operation.name})")
+    return record
+
+
+def measure_pair(character_id: int, results: ResultBuffer, stream: Optional[TextIO] = None,
+                 field_bytes: Optional[FieldByteTable] = None,
+                 operations: Tuple[Operation, ...] = (DEFAULT_REST_OPERATION, DEFAULT_GRAPHQL_OPERATION)
+                 ) -> Tuple[Optional[dict], Optional[dict]]:
+    """
+    Mede REST e GraphQL (operações padrão) para um ID e armazena os registros bem-sucedidos.
+    
+    Args:
+        character_id: ID do personagem a ser consultado
+        results: Buffer colunar de resultados em memória
+        stream: Arquivo para gravação incremental dos resultados (opcional)
+        field_bytes: Tabela de bytes por campo das respostas REST (opcional)
+        operations: As duas operações padrão, na ordem de execução
+        
+    Returns:
+        Tupla (registro_rest, registro_graphql); None para requisições que falharam
+    """
+    def draw():
+        return character_id
+    
+    records = {}
+    for position, operation in enumerate(operations, 1):
+        records[operation.api_type] = measure_operation(operation, character_id, draw, results, stream,
+                                                        field_bytes, position=position)
+        # Pequeno delay para evitar rate limiting (também entre diferentes IDs)
+        METRICS.rate_limit_wait(RATE_LIMIT_DELAY)
+    
+    return records['REST'], records['GraphQL']
+
+
+def run_workload(workload: Workload, stream: Optional[TextIO] = None,
+                 field_bytes: Optional[FieldByteTable] = None) -> ResultBuffer:
+    """
+    Executa um cenário de carga (ver workload.py) a partir de um único agendador.
+    
+    - paired: cada passo sorteia um ID e executa todas as operações, em ordem;
+    - mix: cada passo sorteia uma operação pelos pesos, entre as que estão
+      dentro da taxa alvo; se nenhuma estiver, o agendador espera a primeira
+      liberar.
+    
+    Após cada operação o agendador aguarda o tempo de pensamento dela. Todos os
+    registros recebem o nome do cenário (`scenario`) e da operação (`operation`).
+    
+    Args:
+        workload: Cenário validado
+        stream: Arquivo para gravação incremental dos resultados (opcional)
+        field_bytes: Tabela de bytes por campo das respostas REST (opcional)
+        
+    Returns:
+        Buffer colunar com os resultados das medições
+    """
+    results = ResultBuffer(RESULT_SCHEMA)
+    rng = random.Random(workload.seed)
+    limit = workload.requests if workload.requests is not None else float('inf')
+    deadline = (time.monotonic() + workload.duration_s) if workload.duration_s is not None else float('inf')
+    
+    print("=" * 70)
+    print("COLETA EXPERIMENTAL")
+    print("=" * 70)
+    print(f"Cenário '{workload.name}' ({workload.mode}), semente {workload.seed}: "
+          f"{', '.join(operation.name for operation in workload.operations)}")
+    print()
+    
+    # Sorteadores por operação (no modo paired, completam apenas os lotes)
+    samplers = {operation.name: id_sampler(operation.ids, rng) for operation in workload.operations}
+    
+    if workload.mode == 'paired':
+        order_of = operation_orders(workload.operations, workload.order, rng)
+        for step, (round_number, key) in enumerate(paired_steps(workload, rng)):
+            if time.monotonic() >= deadline:
+                break
+            report(f"Processando ID {key} (rodada {round_number}, "
+                   f"{step % (workload.requests or step + 1) + 1}/{workload.requests or '∞'})...")
+            for position, operation in enumerate(order_of(step), 1):
+                measure_operation(operation, key, samplers[operation.name], results, stream,
+                                  field_bytes, workload.name, round_number, position)
+                METRICS.rate_limit_wait(operation.think_time(rng))
+            report()
+        return results
+    
+    # Operações com peso 0 nunca são sorteadas e não entram no agendamento
+    weighted = [operation for operation in workload.operations if operation.weight > 0]
+    next_allowed = {operation.name: 0.0 for operation in weighted}
+    executed = 0
+    while executed < limit and time.monotonic() < deadline:
+        now = time.monotonic()
+        eligible = [operation for operation in weighted if next_allowed[operation.name] <= now]
+        if not eligible:
+            METRICS.rate_limit_wait(max(0.0, min(next_allowed.values()) - now))
+            continue
+        operation = rng.choices(eligible, weights=[op.weight for op in eligible])[0]
+        if operation.rate:
+            next_allowed[operation.name] = now + 1 / operation.rate
+        draw = samplers[operation.name]
+        measure_operation(operation, draw(), draw, results, stream, field_bytes, workload.name)
+        executed += 1
+        METRICS.rate_limit_wait(operation.think_time(rng))
+    return results
+
+
+def run_experiment(start_id: int, end_id: int, stream: Optional[TextIO] = None,
+                   field_bytes: Optional[FieldByteTable] = None, **run) -> ResultBuffer:
     """
     Executa o experimento principal coletando dados para todos os IDs especificados.
     
-    Para cada ID, realiza:
+    Para cada ID, por padrão em ordem, realiza:
     1. Requisição REST
     2. Requisição GraphQL
     
+    É o cenário pareado padrão executado por run_workload; `run` aceita as
+    opções de randomização do [run] (order, shuffle_ids, rounds, seed).
+    
     Args:
         start_id: ID inicial do intervalo de personagens
         end_id: ID final do intervalo de personagens (inclusivo)
+        stream: Arquivo para gravação incremental dos resultados (opcional)
+        field_bytes: Tabela de bytes por campo das respostas REST (opcional)
+        
+    Returns:
+        Buffer colunar com os resultados das medições
+    """
+    workload = paired_workload(start_id, end_id, DEFAULT_OPERATION_SPECS, DEFAULT_SCENARIO, **run)
+    return run_workload(workload, stream, field_bytes)
+
+
+def run_adaptive_experiment(start_id: int, max_id: int, batch_size: int,
+                            target_time_ms: float, target_size_bytes: float,
+                            alpha: float = 0.05,
+                            stream: Optional[TextIO] = None,
+                            field_bytes: Optional[FieldByteTable] = None,
+                            order: str = 'fixed', seed: int = 0) -> Tuple[ResultBuffer, dict]:
+    """
+    Executa o experimento em lotes, parando quando a estimativa é precisa o suficiente.
+    
+    Após cada lote, atualiza a sequência de confiança das diferenças pareadas
+    (REST - GraphQL) de tempo e tamanho. A coleta termina quando as duas
+    meias-larguras atingem o alvo (com ao menos CS_MIN_PAIRS pares) ou quando
+    os IDs até `max_id` se esgotam.
+    Como a sequência de confiança vale para qualquer momento de parada, olhar
+    o intervalo a cada lote não infla a taxa de falsos positivos. O alpha é
+    dividido entre as duas métricas (Bonferroni).
+    
+    A ordem REST/GraphQL dentro de cada par segue `order` (ver ORDERS em
+    workload.py), sorteada a partir de `seed`.
+    
+    Args:
+        start_id: ID inicial do intervalo de personagens
+        max_id: Último ID que pode ser consultado (orçamento)
+        batch_size: Quantidade de IDs por lote
+        target_time_ms: Meia-largura alvo para a diferença de tempo (ms)
+        target_size_bytes: Meia-largura alvo para a diferença de tamanho (bytes)
+        alpha: Nível de significância da sequência de confiança
+        stream: Arquivo para gravação incremental dos resultados (opcional)
+        field_bytes: Tabela de bytes por campo das respostas REST (opcional)
+        order: Ordem das APIs em cada par ('fixed', 'random' ou 'latin')
+        seed: Semente do sorteio da ordem
         
     Returns:
-        Lista de dicionários com os resultados das medições
+        Tupla (buffer de resultados, resumo da parada)
     """
-    results = []
-    total_ids = end_id - start_id + 1
+    results = ResultBuffer(RESULT_SCHEMA)
+    order_of = operation_orders([DEFAULT_REST_OPERATION, DEFAULT_GRAPHQL_OPERATION], order,
+                                random.Random(seed))
+    diffs = {'time_ms': RunningStats(), 'size_bytes': RunningStats()}
+    targets = {'time_ms': target_time_ms, 'size_bytes': target_size_bytes}
+    halfwidths = {metric: float('inf') for metric in diffs}
+    metric_alpha = alpha / len(diffs)
     
     print("=" * 70)
-    print("COLETA EXPERIMENTAL")
+    print("COLETA EXPERIMENTAL ADAPTATIVA")
     print("=" * 70)
-    print(f"Coletando dados para {total_ids} personagens (IDs {start_id} a {end_id})")
+    print(f"Lotes de {batch_size} IDs a partir do ID {start_id} (orçamento até o ID {max_id})")
+    print(f"Alvo: ±{target_time_ms:.1f} ms no tempo, ±{target_size_bytes:.1f} bytes no tamanho")
     print()
     
-    for idx, character_id in enumerate(range(start_id, end_id + 1), 1):
-        print(f"Processando ID {character_id} ({idx}/{total_ids})...")
-        
-        # Requisição REST
-        time_rest, size_rest, success_rest = make_rest_request(character_id)
-        
-        if success_rest:
-            results.append({
-                'id': character_id,
-                'type': 'REST',
-                'time_ms': time_rest,
-                'size_bytes': size_rest
-            })
-            print(f"  ✓ REST    : {time_rest:.2f} ms, {size_rest} bytes")
-        else:
-            print(f"  ✗ REST    : Falhou")
-        
-        # Pequeno delay para evitar rate limiting
-        time.sleep(0.1)
+    stop_reason = 'budget'
+    next_id = start_id
+    while next_id <= max_id:
+        batch_end = min(next_id + batch_size - 1, max_id)
+        for character_id in range(next_id, batch_end + 1):
+            report(f"Processando ID {character_id}...")
+            rest_record, graphql_record = measure_pair(character_id, results, stream, field_bytes,
+                                                       order_of(character_id - start_id))
+            if rest_record and graphql_record:
+                for metric, stats in diffs.items():
+                    stats.add(rest_record[metric] - graphql_record[metric])
+            report()
+        next_id = batch_end + 1
         
-        # Requisição GraphQL
-        time_graphql, size_graphql, success_graphql = make_graphql_request(character_id)
+        halfwidths = {
+            metric: confidence_sequence_halfwidth(stats, metric_alpha, CS_PLANNED_PAIRS)
+            for metric, stats in diffs.items()
+        }
+        report(f"📐 {diffs['time_ms'].count} pares · "
+               f"tempo {diffs['time_ms'].mean:+.2f} ± {halfwidths['time_ms']:.2f} ms · "
+               f"tamanho {diffs['size_bytes'].mean:+.1f} ± {halfwidths['size_bytes']:.1f} bytes")
+        report()
         
-        if success_graphql:
-            results.append({
-                'id': character_id,
-                'type': 'GraphQL',
-                'time_ms': time_graphql,
-                'size_bytes': size_graphql
-            })
-            print(f"  ✓ GraphQL : {time_graphql:.2f} ms, {size_graphql} bytes")
-        else:
-            print(f"  ✗ GraphQL : Falhou")
-        
-        # Delay entre diferentes IDs
-        time.sleep(0.1)
-        print()
+        if (diffs['time_ms'].count >= CS_MIN_PAIRS and
+                all(halfwidths[metric] <= targets[metric] for metric in diffs)):
+            stop_reason = 'precision'
+            break
     
-    return results
+    summary = {
+        'pairs': diffs['time_ms'].count,
+        'last_id': next_id - 1,
+        'stop_reason': stop_reason,
+        **{f'diff_{metric}': stats.mean for metric, stats in diffs.items()},
+        **{f'halfwidth_{metric}': halfwidths[metric] for metric in diffs},
+    }
+    return results, summary
 
 
-def save_results(results: list, output_file: str):
+def save_results(df: pd.DataFrame, output_file: str, write_file: bool = True):
     """
     Salva os resultados do experimento em arquivo CSV.
     
     Args:
-        results: Lista de dicionários com os resultados
+        df: DataFrame com os resultados (ResultBuffer.to_frame)
         output_file: Nome do arquivo CSV de saída
+        write_file: Se False, o arquivo já foi gravado incrementalmente
+            (modo ao vivo) e apenas o resumo é exibido
     """
-    df = pd.DataFrame(results)
-    df.to_csv(output_file, index=False, encoding='utf-8')
+    if write_file:
+        df.to_csv(output_file, index=False, encoding='utf-8')
     print("=" * 70)
     print("RESULTADOS SALVOS")
     print("=" * 70)
@@ -226,15 +702,35 @@ def save_results(results: list, output_file: str):
     print()
 
 
-def display_summary(results: list):
+def save_field_bytes(field_bytes: FieldByteTable, output_file: str):
     """
-    Exibe um resumo estatístico básico dos resultados coletados.
+    Salva a tabela de bytes por campo das respostas REST e exibe os maiores campos.
     
     Args:
-        results: Lista de dicionários com os resultados
+        field_bytes: Tabela acumulada durante a coleta
+        output_file: Nome do arquivo CSV de saída
     """
-    df = pd.DataFrame(results)
+    table = field_bytes.to_frame()
+    table.to_csv(output_file, index=False, encoding='utf-8')
+    print("=" * 70)
+    print("BYTES POR CAMPO (REST)")
+    print("=" * 70)
+    print(f"✓ Arquivo salvo: {output_file}")
+    print(f"✓ Respostas analisadas: {field_bytes.responses}")
+    if field_bytes.failures:
+        print(f"⚠️  Respostas com JSON inválido ignoradas: {field_bytes.failures}")
+    for row in table[table['depth'] == 0].head(5).itertuples(index=False):
+        print(f"  {row.field:<14} {row.bytes_per_response:>8.0f} bytes/resposta ({row.share_pct:.1f}%)")
+    print()
+
+
+def display_summary(df: pd.DataFrame):
+    """
+    Exibe um resumo estatístico básico dos resultados coletados.
     
+    Args:
+        df: DataFrame com os resultados (ResultBuffer.to_frame)
+    """
     print("=" * 70)
     print("RESUMO ESTATÍSTICO PRELIMINAR")
     print("=" * 70)
@@ -277,6 +773,30 @@ def display_summary(results: list):
           f"({'GraphQL mais rápido' if diff_time > 0 else 'REST mais rápido'})")
     print(f"Tamanho médio : {diff_size:+.0f} bytes ({reduction_pct:.1f}% de redução)")
     print()
+    
+    # Tempo no servidor (apenas quando o alvo o informa, ex.: servidor local)
+    if df['server_ms'].notna().any():
+        print("TEMPO NO SERVIDOR vs REDE + CLIENTE (ms, média)")
+        print("-" * 70)
+        for api_type, type_df in (('REST', rest_df), ('GraphQL', graphql_df)):
+            outside = type_df['time_ms'] - type_df['server_ms']
+            print(f"{api_type:<8} - Servidor: {type_df['server_ms'].mean():.2f} ms, "
+                  f"Rede + cliente: {outside.mean():.2f} ms")
+        print()
+    
+    # Carga mista: resumo por operação
+    default_names = {spec['name'] for spec in DEFAULT_OPERATION_SPECS}
+    if not set(df['operation'].unique()) <= default_names:
+        print("POR OPERAÇÃO")
+        print("-" * 70)
+        by_operation = df.groupby('operation', observed=True).agg(
+            type=('type', 'first'), n=('time_ms', 'size'),
+            time_ms=('time_ms', 'median'), size_bytes=('size_bytes', 'mean')
+        )
+        for name, row in by_operation.iterrows():
+            print(f"{name:<20} {row['type']:<8} {row['n']:>6} req · mediana {row['time_ms']:.2f} ms · "
+                  f"{row['size_bytes']:.0f} bytes em média")
+        print()
 
 
 def main():
@@ -305,6 +825,121 @@ def main():
         default='experiment_results.csv',
         help='Nome do arquivo CSV de saída (padrão: experiment_results.csv)'
     )
+    parser.add_argument(
+        '--base-url',
+        type=str,
+        default=None,
+        help='Raiz de um servidor alternativo, ex.: http://127.0.0.1:8000 (local_server.py); '
+             'padrão: API pública'
+    )
+    parser.add_argument(
+        '--field-bytes',
+        type=str,
+        default=None,
+        help='Atribuir os bytes de cada resposta REST aos seus campos e salvar a tabela '
+             'neste CSV (ex.: field_bytes.csv)'
+    )
+    parser.add_argument(
+        '--workload',
+        type=str,
+        default=None,
+        help='Cenário de carga mista (.toml, ou .yaml com PyYAML); substitui --start/--end '
+             'e a coleta pareada padrão'
+    )
+    parser.add_argument(
+        '--order',
+        choices=ORDERS,
+        default=None,
+        help='Ordem das APIs em cada passo pareado: fixed (REST antes), random (sorteada por ID) '
+             'ou latin (quadrado latino balanceado); padrão: fixed ou a do cenário'
+    )
+    parser.add_argument(
+        '--shuffle-ids',
+        action='store_true',
+        help='Embaralhar a sequência de IDs de cada rodada'
+    )
+    parser.add_argument(
+        '--rounds',
+        type=int,
+        default=None,
+        help='Repetir a sequência de IDs este número de vezes (padrão: 1)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Semente dos sorteios (ordem e IDs); sem ela, uma semente é gerada e registrada'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Gravar cada medição no CSV assim que coletada (modo ao vivo do dashboard)'
+    )
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        help='Amostragem adaptativa: coletar em lotes até atingir a precisão alvo '
+             '(--end passa a ser o orçamento máximo de IDs)'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=10,
+        help='IDs por lote no modo adaptativo (padrão: 10)'
+    )
+    parser.add_argument(
+        '--target-time-ms',
+        type=float,
+        default=25.0,
+        help='Meia-largura alvo da diferença de tempo no modo adaptativo (padrão: 25 ms)'
+    )
+    parser.add_argument(
+        '--target-size-bytes',
+        type=float,
+        default=50.0,
+        help='Meia-largura alvo da diferença de tamanho no modo adaptativo (padrão: 50 bytes)'
+    )
+    parser.add_argument(
+        '--alpha',
+        type=float,
+        default=0.05,
+        help='Nível de significância da sequência de confiança adaptativa (padrão: 0.05)'
+    )
+    parser.add_argument(
+        '--calibration-samples',
+        type=int,
+        default=CALIBRATION_SAMPLES,
+        help=f'Requisições por tipo na calibração do harness (padrão: {CALIBRATION_SAMPLES})'
+    )
+    parser.add_argument(
+        '--skip-calibration',
+        action='store_true',
+        help='Pular a calibração do harness (o dashboard não poderá descontar o overhead)'
+    )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help='Expor métricas OpenMetrics/Prometheus da coleta em http://HOST:PORTA/metrics'
+    )
+    parser.add_argument(
+        '--metrics-host',
+        type=str,
+        default='127.0.0.1',
+        help='Interface do endpoint de métricas (padrão: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--profile',
+        type=str,
+        default=None,
+        help='Amostrar as pilhas do coletor e gravá-las no formato folded (flamegraph) neste arquivo'
+    )
+    parser.add_argument(
+        '--profile-interval-ms',
+        type=float,
+        default=DEFAULT_INTERVAL_MS,
+        help=f'Intervalo entre amostras do profiler (padrão: {DEFAULT_INTERVAL_MS:g} ms)'
+    )
     parser.add_argument(
         '--skip-warmup',
         action='store_true',
@@ -313,6 +948,12 @@ def main():
     
     args = parser.parse_args()
     
+    # Alvo alternativo (servidor local)
+    global REST_BASE_URL, GRAPHQL_URL
+    if args.base_url:
+        REST_BASE_URL = f"{args.base_url.rstrip('/')}/api/character"
+        GRAPHQL_URL = f"{args.base_url.rstrip('/')}/graphql"
+    
     # Validações
     if args.start < 1:
         print("Erro: --start deve ser >= 1")
@@ -320,7 +961,33 @@ def main():
     if args.end < args.start:
         print("Erro: --end deve ser >= --start")
         return
-    if args.end - args.start + 1 > 200:
+    if args.batch_size < 1:
+        print("Erro: --batch-size deve ser >= 1")
+        return
+    
+    # Randomização (opções da linha de comando substituem as do cenário)
+    run_options = {'order': args.order, 'shuffle_ids': args.shuffle_ids or None,
+                   'rounds': args.rounds, 'seed': args.seed}
+    run_options = {key: value for key, value in run_options.items() if value is not None}
+    if args.seed is None and not args.workload and (args.order == 'random' or args.shuffle_ids):
+        run_options['seed'] = random.randrange(2**31)
+    if args.adaptive and (args.shuffle_ids or (args.rounds or 1) > 1):
+        print("Erro: o modo adaptativo percorre os IDs em sequência, uma vez; "
+              "use apenas --order")
+        return
+    try:
+        if args.workload:
+            if args.adaptive:
+                print("Erro: --workload não pode ser combinado com --adaptive")
+                return
+            workload = load_workload(args.workload, **run_options)
+        else:
+            workload = paired_workload(args.start, args.end, DEFAULT_OPERATION_SPECS,
+                                       DEFAULT_SCENARIO, **run_options)
+    except (OSError, ValueError) as e:
+        print(f"Erro no cenário {args.workload or DEFAULT_SCENARIO}: {e}")
+        return
+    if not args.workload and args.end - args.start + 1 > 200:
         print("Aviso: Amostra muito grande pode causar rate limiting")
         response = input("Continuar mesmo assim? (s/n): ")
         if response.lower() != 's':
@@ -331,13 +998,52 @@ def main():
     print("=" * 70)
     print("EXPERIMENTO: REST vs GraphQL")
     print("=" * 70)
-    print(f"API: Rick and Morty API")
-    print(f"Intervalo de IDs: {args.start} a {args.end}")
-    print(f"Total de personagens: {args.end - args.start + 1}")
-    print(f"Total de requisições: {(args.end - args.start + 1) * 2}")
+    print(f"API: {args.base_url or 'Rick and Morty API'}")
+    if args.workload:
+        limits = [f"{workload.requests} {'passos' if workload.mode == 'paired' else 'operações'}"
+                  if workload.requests is not None else None,
+                  f"{workload.duration_s:g} s" if workload.duration_s is not None else None]
+        print(f"Cenário: {args.workload} ({workload.mode}, até {' / '.join(filter(None, limits))})")
+        for operation in workload.operations:
+            rate = f", até {operation.rate:g}/s" if operation.rate else ""
+            print(f"  - {operation.name:<20} {operation.kind:<12} peso {operation.weight:g}{rate}, "
+                  f"pensamento {operation.think_time_ms:g} ms")
+    elif args.adaptive:
+        print(f"Intervalo de IDs: {args.start} a {args.end}")
+        print(f"Modo adaptativo: até {args.end - args.start + 1} personagens, "
+              f"lotes de {args.batch_size}")
+    else:
+        print(f"Intervalo de IDs: {args.start} a {args.end}")
+        print(f"Total de personagens: {args.end - args.start + 1}")
+        print(f"Total de requisições: {(args.end - args.start + 1) * 2 * workload.rounds}")
+    if workload.mode == 'paired':
+        print(f"Ordem das operações: {workload.order} · "
+              f"IDs {'embaralhados' if workload.shuffle_ids else 'em sequência'} · "
+              f"{workload.rounds} rodada(s) · semente {workload.seed}")
     print(f"Arquivo de saída: {args.out}")
     print()
     
+    # Endpoint de métricas (ativo até o fim do processo)
+    if args.metrics_port is not None:
+        metrics_server = start_metrics_server(METRICS, args.metrics_port, args.metrics_host)
+        host, port = metrics_server.server_address[:2]
+        print(f"📡 Métricas em http://{host}:{port}/metrics")
+        print()
+    
+    # Manifesto da execução (parâmetros e semente, para reprodução)
+    manifest = run_manifest(workload)
+    if args.adaptive:
+        manifest['mode'] = 'adaptive'
+    print(f"✓ Manifesto da execução salvo: {save_run_manifest(manifest, args.out)}")
+    print()
+    
+    # Calibração do harness
+    calibration = None
+    if not args.skip_calibration:
+        calibration = calibrate_harness(args.calibration_samples)
+        print(f"✓ Calibração salva: {save_calibration(calibration, args.out)}")
+        print()
+    
     # Warm-up
     if not args.skip_warmup:
         warmup()
@@ -346,26 +1052,65 @@ def main():
         print()
     
     # Executar experimento
+    stream = open_result_stream(args.out) if args.stream else None
     start_time = time.time()
-    results = run_experiment(args.start, args.end)
+    adaptive_summary = None
+    field_bytes = FieldByteTable() if args.field_bytes else None
+    profiler = SamplingProfiler(args.profile, args.profile_interval_ms) if args.profile else None
+    REPORTER.start()
+    if profiler is not None:
+        profiler.start()
+    try:
+        if args.adaptive:
+            results, adaptive_summary = run_adaptive_experiment(
+                args.start, args.end, args.batch_size,
+                args.target_time_ms, args.target_size_bytes, args.alpha, stream, field_bytes,
+                workload.order, workload.seed
+            )
+        else:
+            results = run_workload(workload, stream, field_bytes)
+    finally:
+        REPORTER.stop()
+        if profiler is not None:
+            print(f"🔥 Pilhas do coletor ({profiler.stop()} amostras) salvas em: {args.profile}")
+        if stream is not None:
+            stream.close()
     end_time = time.time()
     
     # Verificar se obtivemos resultados
-    if not results:
+    if not len(results):
         print("❌ Nenhum resultado coletado. Verifique sua conexão de rede.")
         return
     
+    # Consolidar o buffer uma única vez; salvamento e resumo usam o mesmo DataFrame
+    df = results.to_frame()
+    
     # Salvar resultados
-    save_results(results, args.out)
+    save_results(df, args.out, write_file=not args.stream)
+    if field_bytes is not None:
+        save_field_bytes(field_bytes, args.field_bytes)
     
     # Exibir resumo
-    display_summary(results)
+    display_summary(df)
     
     # Estatísticas de execução
     print("=" * 70)
     print("ESTATÍSTICAS DE EXECUÇÃO")
     print("=" * 70)
     print(f"✓ Tempo total de execução: {(end_time - start_time):.2f} segundos")
+    if calibration is not None:
+        floor = calibration['floor_ms']
+        print(f"✓ Piso do harness: REST {floor['REST']:.3f} ms, GraphQL {floor['GraphQL']:.3f} ms "
+              f"(descontável no dashboard)")
+    if adaptive_summary is not None:
+        reason = ("precisão alvo atingida" if adaptive_summary['stop_reason'] == 'precision'
+                  else "orçamento de IDs esgotado")
+        print(f"✓ Amostragem adaptativa: {adaptive_summary['pairs']} pares "
+              f"(até o ID {adaptive_summary['last_id']}), parada por {reason}")
+        print(f"  Tempo   (REST - GraphQL): {adaptive_summary['diff_time_ms']:+.2f} "
+              f"± {adaptive_summary['halfwidth_time_ms']:.2f} ms")
+        print(f"  Tamanho (REST - GraphQL): {adaptive_summary['diff_size_bytes']:+.1f} "
+              f"± {adaptive_summary['halfwidth_size_bytes']:.1f} bytes")
     print(f"✓ Experimento concluído com sucesso!")
     print()
     print("Próximos passos:")
@@ -0,0 +1,140 @@
+"""
+Atribuição de Bytes por Campo (over-fetching do REST)
+Disciplina: Laboratório de Experimentação de Software
+
+Percorre o corpo JSON de cada resposta REST registrando o intervalo (span) de
+texto ocupado por cada campo, sem construir o objeto Python completo. Cada
+campo recebe os bytes de `"chave":valor` e da vírgula seguinte; campos
+aninhados aparecem com o caminho completo (`origin.url`) e elementos de listas
+com `[]` (`episode[]`). O que sobra (chaves e colchetes externos) é reportado
+como estrutura, de modo que os campos de nível superior somam 100% do corpo.
+
+Internamente cada caminho é uma tupla de chaves (com ITEM para elementos de
+lista), então chaves que contêm `.` ou `[` não se confundem com aninhamento.
+"""
+
+import json
+import re
+from collections import defaultdict
+from json.decoder import scanstring
+from typing import Dict, Tuple
+
+import pandas as pd
+
+STRUCTURE_FIELD = '(estrutura)'
+ITEM = None   # Componente do caminho que representa um elemento de lista
+
+Path = Tuple[object, ...]
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+def _skip(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
+
+
+def field_name(path: Path) -> str:
+    """Nome legível de um caminho; chaves com `.`, `[` ou `]` aparecem entre colchetes e aspas."""
+    name = ''
+    for key in path:
+        if key is ITEM:
+            name += '[]'
+        elif re.search(r'[.\[\]]', key):
+            name += f"[{json.dumps(key, ensure_ascii=False)}]"
+        else:
+            name += f".{key}" if name else key
+    return name
+
+
+def _walk(text: str, pos: int, path: Path, sizes: Dict[Path, int], byte_len) -> int:
+    """Percorre o valor que começa em `pos` e retorna a posição logo após ele."""
+    char = text[pos]
+    if char == '{':
+        pos = _skip(text, pos + 1)
+        while text[pos] != '}':
+            start = pos
+            key, pos = scanstring(text, pos + 1)
+            pos = _skip(text, pos)
+            if text[pos] != ':':
+                raise ValueError(f"':' esperado na posição {pos}")
+            child = path + (key,)
+            pos = _skip(text, _walk(text, _skip(text, pos + 1), child, sizes, byte_len))
+            if text[pos] == ',':
+                pos = _skip(text, pos + 1)
+            sizes[child] += byte_len(start, pos)
+        return pos + 1
+    if char == '[':
+        item = path + (ITEM,)
+        pos = _skip(text, pos + 1)
+        while text[pos] != ']':
+            start = pos
+            pos = _skip(text, _walk(text, pos, item, sizes, byte_len))
+            if text[pos] == ',':
+                pos = _skip(text, pos + 1)
+            sizes[item] += byte_len(start, pos)
+        return pos + 1
+    if char == '"':
+        return scanstring(text, pos + 1)[1]
+    return _DECODER.raw_decode(text, pos)[1]
+
+
+def field_byte_sizes(body: bytes) -> Dict[Path, int]:
+    """
+    Bytes ocupados por cada campo (em todos os níveis) de um corpo JSON, por caminho.
+
+    Levanta ValueError se o corpo não for JSON válido.
+    """
+    text = body.decode('utf-8')
+    if text.isascii():
+        def byte_len(start, end):
+            return end - start
+    else:
+        def byte_len(start, end):
+            return len(text[start:end].encode('utf-8'))
+
+    sizes: Dict[Path, int] = defaultdict(int)
+    try:
+        _walk(text, _skip(text, 0), (), sizes, byte_len)
+    except (IndexError, json.JSONDecodeError) as e:
+        raise ValueError(f"Corpo JSON inválido: {e}") from e
+    return dict(sizes)
+
+
+class FieldByteTable:
+    """Acumula a atribuição de bytes por campo ao longo de várias respostas."""
+
+    def __init__(self):
+        self.totals: Dict[Path, int] = defaultdict(int)
+        self.responses = 0
+        self.body_bytes = 0
+        self.failures = 0
+
+    def add(self, body: bytes):
+        try:
+            sizes = field_byte_sizes(body)
+        except ValueError:
+            self.failures += 1
+            return
+        for field, size in sizes.items():
+            self.totals[field] += size
+        self.responses += 1
+        self.body_bytes += len(body)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Tabela campo, profundidade, bytes totais, bytes por resposta e
+        participação (%) no total de bytes dos corpos.
+        """
+        top_level = sum(size for path, size in self.totals.items() if len(path) == 1 and path[0] is not ITEM)
+        # Profundidade: separadores no nome (um corpo que é lista já começa em `[]`, profundidade 1)
+        rows = [(field_name(path), len(path) - 1 + (path[0] is ITEM), size)
+                for path, size in self.totals.items()]
+        if self.responses:
+            rows.append((STRUCTURE_FIELD, 0, self.body_bytes - top_level))
+
+        table = pd.DataFrame(rows, columns=['field', 'depth', 'bytes_total'])
+        table['bytes_per_response'] = table['bytes_total'] / max(self.responses, 1)
+        table['share_pct'] = table['bytes_total'] / max(self.body_bytes, 1) * 100
+        table = table.sort_values(['depth', 'bytes_total'], ascending=[True, False], ignore_index=True)
+        return table[['field', 'depth', 'bytes_total', 'bytes_per_response', 'share_pct']]
@@ -0,0 +1,690 @@
+"""
+Servidor Local de Referência: REST e GraphQL
+Disciplina: Laboratório de Experimentação de Software
+
+Servidor HTTP (somente biblioteca padrão) que imita a Rick and Morty API com
+dados sintéticos, para experimentos em ambiente controlado. Expõe os mesmos
+caminhos usados pelo coletor (`/api/character/<id>` e `/graphql`), além de
+`/api/location/<id>`, `/api/episode/<id>` e das listagens paginadas
+(`/api/character?page=N`) usadas pelos cenários de carga mista.
+
+O endpoint GraphQL oferece estratégias de execução selecionáveis, cada uma
+acumulando a otimização da anterior:
+
+- naive:      documento analisado a cada requisição; cada referência a uma
+              entidade é resolvida com uma consulta própria ao armazenamento
+- dataloader: as referências são resolvidas nível a nível, agrupadas por tipo
+              e sem duplicatas (uma consulta em lote por tipo e nível)
+- cached:     além do lote, documentos já analisados e validados são
+              reaproveitados de um cache indexado pelo hash da query
+
+O tempo gasto no servidor volta em `extensions.timing` (GraphQL) e no cabeçalho
+`Server-Timing` (REST e GraphQL), permitindo ao coletor separá-lo da latência
+de rede e do cliente. Como a extensão aumenta o corpo das respostas GraphQL,
+`--no-timing-extension` a omite para medições de tamanho (RQ2).
+
+Uso:
+    python local_server.py --port 8000
+    python local_server.py --port 8000 --strategy naive --db-latency-ms 1.0
+    python experimet.py --base-url http://127.0.0.1:8000 --skip-warmup
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+STRATEGIES = ['naive', 'dataloader', 'cached']
+QUERY_CACHE_SIZE = 256
+
+# Tamanho do conjunto sintético (mesmas ordens de grandeza da API pública)
+N_CHARACTERS = 826
+N_LOCATIONS = 126
+N_EPISODES = 51
+
+
+# Dados sintéticos
+class Store:
+    """
+    Armazenamento em memória com latência simulada por consulta.
+
+    `load` faz uma ida ao "banco" por entidade; `load_many` busca um lote
+    inteiro em uma única ida, como faria um SELECT ... WHERE id IN (...).
+    """
+
+    def __init__(self, db_latency_ms: float = 0.5, seed: int = 0):
+        self.db_latency = db_latency_ms / 1000
+        rng = random.Random(seed)
+        self.tables = {'Location': {}, 'Episode': {}, 'Character': {}}
+
+        for i in range(1, N_LOCATIONS + 1):
+            self.tables['Location'][i] = {
+                'id': i,
+                'name': f"Location {i}",
+                'type': rng.choice(['Planet', 'Space station', 'Microverse', 'Dream']),
+                'dimension': f"Dimension C-{rng.randint(100, 999)}",
+                'resident_ids': [],
+                'created': "2017-11-10T12:42:04.162Z",
+            }
+        for i in range(1, N_EPISODES + 1):
+            self.tables['Episode'][i] = {
+                'id': i,
+                'name': f"Episode {i}",
+                'air_date': f"December {1 + i % 28}, 20{13 + i // 11}",
+                'episode': f"S{1 + i // 11:02d}E{1 + i % 11:02d}",
+                'character_ids': [],
+                'created': "2017-11-10T12:56:33.798Z",
+            }
+        for i in range(1, N_CHARACTERS + 1):
+            character = {
+                'id': i,
+                'name': f"Character {i}",
+                'status': rng.choice(['Alive', 'Dead', 'unknown']),
+                'species': rng.choice(['Human', 'Alien', 'Humanoid', 'Robot']),
+                'type': '',
+                'gender': rng.choice(['Female', 'Male', 'Genderless', 'unknown']),
+                'origin_id': rng.randint(1, N_LOCATIONS),
+                'location_id': rng.randint(1, N_LOCATIONS),
+                'episode_ids': sorted(rng.sample(range(1, N_EPISODES + 1), rng.randint(1, 12))),
+                'created': "2017-11-04T18:48:46.250Z",
+                'version': 0,
+            }
+            self.tables['Character'][i] = character
+            self.tables['Location'][character['location_id']]['resident_ids'].append(i)
+            for episode_id in character['episode_ids']:
+                self.tables['Episode'][episode_id]['character_ids'].append(i)
+
+    def mutate(self, character_id: int, rng: random.Random, timestamp: float) -> dict:
+        """
+        Altera status e localização de um personagem (cenário de change feed).
+
+        A versão é incrementada e `updated_at` recebe o instante da alteração
+        (epoch em segundos), exposto pelo REST e pelo campo GraphQL de mesmo nome.
+        """
+        character = self.tables['Character'][character_id]
+        locations = self.tables['Location']
+        locations[character['location_id']]['resident_ids'].remove(character_id)
+        character['status'] = rng.choice(['Alive', 'Dead', 'unknown'])
+        character['location_id'] = rng.randint(1, N_LOCATIONS)
+        locations[character['location_id']]['resident_ids'].append(character_id)
+        character['version'] += 1
+        character['updated_at'] = timestamp
+        return character
+
+    def _roundtrip(self):
+        if self.db_latency > 0:
+            time.sleep(self.db_latency)
+
+    def load(self, kind: str, key: int) -> Optional[dict]:
+        """Busca uma entidade (uma ida ao armazenamento)."""
+        self._roundtrip()
+        return self.tables[kind].get(key)
+
+    def load_many(self, kind: str, keys) -> Dict[int, dict]:
+        """Busca várias entidades em uma única ida ao armazenamento."""
+        self._roundtrip()
+        table = self.tables[kind]
+        return {key: table[key] for key in keys if key in table}
+
+
+def character_etag(character: dict) -> str:
+    """ETag forte de um personagem, derivado do id e da versão."""
+    return f'"{character["id"]}-{character["version"]}"'
+
+
+def rest_character(character: dict, base_url: str) -> dict:
+    """Representação REST de um personagem, no formato da API pública."""
+    def location_ref(location_id):
+        return {'name': f"Location {location_id}", 'url': f"{base_url}/api/location/{location_id}"}
+
+    body = {
+        'id': character['id'],
+        'name': character['name'],
+        'status': character['status'],
+        'species': character['species'],
+        'type': character['type'],
+        'gender': character['gender'],
+        'origin': location_ref(character['origin_id']),
+        'location': location_ref(character['location_id']),
+        'image': f"{base_url}/api/character/avatar/{character['id']}.jpeg",
+        'episode': [f"{base_url}/api/episode/{e}" for e in character['episode_ids']],
+        'url': f"{base_url}/api/character/{character['id']}",
+        'created': character['created'],
+    }
+    if 'updated_at' in character:
+        body['updated_at'] = character['updated_at']
+    return body
+
+
+def rest_location(location: dict, base_url: str) -> dict:
+    return {
+        'id': location['id'],
+        'name': location['name'],
+        'type': location['type'],
+        'dimension': location['dimension'],
+        'residents': [f"{base_url}/api/character/{c}" for c in location['resident_ids']],
+        'url': f"{base_url}/api/location/{location['id']}",
+        'created': location['created'],
+    }
+
+
+def rest_episode(episode: dict, base_url: str) -> dict:
+    return {
+        'id': episode['id'],
+        'name': episode['name'],
+        'air_date': episode['air_date'],
+        'episode': episode['episode'],
+        'characters': [f"{base_url}/api/character/{c}" for c in episode['character_ids']],
+        'url': f"{base_url}/api/episode/{episode['id']}",
+        'created': episode['created'],
+    }
+
+
+# Recursos REST: caminho -> (tabela do Store, representação)
+REST_RESOURCES = {
+    'character': ('Character', rest_character),
+    'location': ('Location', rest_location),
+    'episode': ('Episode', rest_episode),
+}
+REST_PAGE_SIZE = 20
+
+
+# Esquema GraphQL
+# ref: função (entidade, argumentos) -> id ou lista de ids da entidade referenciada
+Field = namedtuple('Field', ['type', 'many', 'args', 'ref'], defaults=[None, False, (), None])
+
+SCHEMA = {
+    'Query': {
+        'character': Field('Character', args=('id',), ref=lambda src, args: args['id']),
+        'characters': Field('Character', many=True, args=('ids',), ref=lambda src, args: args['ids']),
+        'location': Field('Location', args=('id',), ref=lambda src, args: args['id']),
+        'episode': Field('Episode', args=('id',), ref=lambda src, args: args['id']),
+    },
+    # Evento de alteração: o personagem é lido já com o estado novo
+    'Subscription': {
+        'characterUpdated': Field('Character', args=('id',), ref=lambda src, args: args['id']),
+    },
+    'Character': {
+        **{name: Field() for name in ['id', 'name', 'status', 'species', 'type', 'gender', 'created',
+                                      'updated_at']},
+        'origin': Field('Location', ref=lambda src, args: src['origin_id']),
+        'location': Field('Location', ref=lambda src, args: src['location_id']),
+        'episode': Field('Episode', many=True, ref=lambda src, args: src['episode_ids']),
+    },
+    'Location': {
+        **{name: Field() for name in ['id', 'name', 'type', 'dimension', 'created']},
+        'residents': Field('Character', many=True, ref=lambda src, args: src['resident_ids']),
+    },
+    'Episode': {
+        **{name: Field() for name in ['id', 'name', 'air_date', 'episode', 'created']},
+        'characters': Field('Character', many=True, ref=lambda src, args: src['character_ids']),
+    },
+}
+
+OPERATION_ROOTS = {'query': 'Query', 'subscription': 'Subscription'}
+
+
+class GraphQLError(Exception):
+    """Erro de sintaxe, validação ou execução devolvido em `errors`."""
+
+
+# Análise sintática (subconjunto: operações query, aliases, argumentos e variáveis)
+Selection = namedtuple('Selection', ['alias', 'name', 'args', 'selections'])
+
+_TOKEN_RE = re.compile(r'\s*(?:(#[^\n]*)|(\.\.\.)|([{}()\[\]:!$=,@])|("(?:[^"\\]|\\.)*")|'
+                       r'(-?\d+(?:\.\d+)?)|([_A-Za-z][_0-9A-Za-z]*))')
+
+
+def _tokenize(query: str) -> List[str]:
+    tokens, pos = [], 0
+    query = query.rstrip()
+    while pos < len(query):
+        match = _TOKEN_RE.match(query, pos)
+        if not match or match.end() == pos:
+            raise GraphQLError(f"Caractere inesperado na posição {pos}")
+        pos = match.end()
+        comment, spread, punct, string, number, name = match.groups()
+        if comment or punct == ',':
+            continue
+        if spread:
+            raise GraphQLError("Fragmentos não são suportados")
+        tokens.append(punct or string or number or name)
+    return tokens
+
+
+class _Parser:
+    def __init__(self, query: str):
+        self.tokens = _tokenize(query)
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise GraphQLError(f"Esperado {expected or 'token'}, encontrado {token}")
+        self.pos += 1
+        return token
+
+    def document(self) -> Tuple[str, List[Selection]]:
+        """Retorna (tipo da operação, seleções)."""
+        operation = 'query'
+        if self.peek() in OPERATION_ROOTS:
+            operation = self.take()
+            if self.peek() not in ('{', '('):
+                self.take()  # nome da operação
+            if self.peek() == '(':
+                # Definições de variáveis: tipos não são verificados
+                depth = 0
+                while True:
+                    token = self.take()
+                    depth += token == '('
+                    depth -= token == ')'
+                    if depth == 0:
+                        break
+        elif self.peek() == 'mutation':
+            raise GraphQLError("Operação mutation não suportada")
+        selections = self.selection_set()
+        if self.peek() is not None:
+            raise GraphQLError("Apenas uma operação por documento é suportada")
+        return operation, selections
+
+    def selection_set(self) -> List[Selection]:
+        self.take('{')
+        selections = []
+        while self.peek() != '}':
+            name = self.take()
+            alias = name
+            if self.peek() == ':':
+                self.take()
+                name = self.take()
+            args = self.arguments() if self.peek() == '(' else {}
+            children = self.selection_set() if self.peek() == '{' else None
+            selections.append(Selection(alias, name, args, children))
+        self.take('}')
+        return selections
+
+    def arguments(self) -> dict:
+        self.take('(')
+        args = {}
+        while self.peek() != ')':
+            name = self.take()
+            self.take(':')
+            args[name] = self.value()
+        self.take(')')
+        return args
+
+    def value(self):
+        token = self.take()
+        if token == '$':
+            return ('$', self.take())
+        if token == '[':
+            items = []
+            while self.peek() != ']':
+                items.append(self.value())
+            self.take(']')
+            return items
+        if token.startswith('"'):
+            return json.loads(token)
+        if re.fullmatch(r'-?\d+', token):
+            return int(token)
+        if re.fullmatch(r'-?\d+\.\d+', token):
+            return float(token)
+        return {'true': True, 'false': False, 'null': None}.get(token, token)
+
+
+def validate(selections: List[Selection], type_name: str = 'Query'):
+    """Verifica campos, argumentos e seleções contra SCHEMA."""
+    for selection in selections:
+        field = SCHEMA[type_name].get(selection.name)
+        if selection.name == '__typename':
+            continue
+        if field is None:
+            raise GraphQLError(f"Campo '{selection.name}' não existe em '{type_name}'")
+        missing = set(field.args) - set(selection.args)
+        if missing:
+            raise GraphQLError(f"Argumento obrigatório ausente em '{selection.name}': {', '.join(missing)}")
+        if field.ref is None and selection.selections is not None:
+            raise GraphQLError(f"Campo escalar '{selection.name}' não aceita seleção")
+        if field.ref is not None:
+            if selection.selections is None:
+                raise GraphQLError(f"Campo '{selection.name}' do tipo '{field.type}' exige seleção")
+            validate(selection.selections, field.type)
+
+
+def parse_and_validate(query: str, operation: str = 'query') -> List[Selection]:
+    """Analisa e valida um documento GraphQL, exigindo o tipo de operação dado."""
+    found, selections = _Parser(query).document()
+    if found != operation:
+        raise GraphQLError(f"Operação {found} não suportada neste endpoint")
+    validate(selections, OPERATION_ROOTS[operation])
+    return selections
+
+
+class QueryCache:
+    """Cache LRU de documentos já validados, indexado pelo SHA-256 da query."""
+
+    def __init__(self, maxsize: int = QUERY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, List[Selection]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_parse(self, query: str):
+        """Retorna (documento, acerto_no_cache)."""
+        key = hashlib.sha256(query.encode('utf-8')).hexdigest()
+        with self._lock:
+            document = self._entries.get(key)
+            if document is not None:
+                self._entries.move_to_end(key)
+                return document, True
+        document = parse_and_validate(query)
+        with self._lock:
+            self._entries[key] = document
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return document, False
+
+
+# Execução
+def _bind(args: dict, variables: dict) -> dict:
+    def resolve(value):
+        if isinstance(value, tuple) and value[0] == '$':
+            if value[1] not in variables:
+                raise GraphQLError(f"Variável ${value[1]} não informada")
+            return variables[value[1]]
+        if isinstance(value, list):
+            return [resolve(v) for v in value]
+        return value
+    return {name: resolve(value) for name, value in args.items()}
+
+
+def _ids(value, many: bool) -> List[int]:
+    try:
+        return [int(v) for v in value] if many else [int(value)]
+    except (TypeError, ValueError):
+        raise GraphQLError(f"ID inválido: {value!r}")
+
+
+def _resolve_object(type_name, source, selections, variables, on_ref):
+    """
+    Resolve os campos escalares de um objeto e entrega cada referência a
+    `on_ref(tipo, ids, many, seleções, destino, chave)`, que decide quando
+    (e em quantas idas ao armazenamento) a entidade é carregada.
+    """
+    result = {}
+    for selection in selections:
+        if selection.name == '__typename':
+            result[selection.alias] = type_name
+            continue
+        field = SCHEMA[type_name][selection.name]
+        if field.ref is None:
+            result[selection.alias] = source.get(selection.name)
+            continue
+        args = _bind(selection.args, variables)
+        ids = _ids(field.ref(source, args), field.many)
+        result[selection.alias] = None
+        on_ref(field.type, ids, field.many, selection.selections, result, selection.alias)
+    return result
+
+
+def execute_naive(document, variables, store: Store, root_type: str = 'Query') -> dict:
+    """Resolve em profundidade, com uma ida ao armazenamento por entidade referenciada."""
+    def on_ref(type_name, ids, many, selections, target, key):
+        values = []
+        for entity_id in ids:
+            entity = store.load(type_name, entity_id)
+            if entity is not None:
+                values.append(_resolve_object(type_name, entity, selections, variables, on_ref))
+        target[key] = values if many else (values[0] if values else None)
+
+    return _resolve_object(root_type, None, document, variables, on_ref)
+
+
+def execute_batched(document, variables, store: Store, root_type: str = 'Query') -> dict:
+    """
+    Resolve nível a nível (DataLoader): as referências de um nível são
+    agrupadas por tipo, deduplicadas e carregadas com um único `load_many`.
+    """
+    queue = []
+
+    def on_ref(*ref):
+        queue.append(ref)
+
+    data = _resolve_object(root_type, None, document, variables, on_ref)
+    while queue:
+        level, queue = queue, []
+        wanted: Dict[str, set] = {}
+        for type_name, ids, *_ in level:
+            wanted.setdefault(type_name, set()).update(ids)
+        loaded = {type_name: store.load_many(type_name, sorted(ids)) for type_name, ids in wanted.items()}
+        for type_name, ids, many, selections, target, key in level:
+            values = [
+                _resolve_object(type_name, loaded[type_name][entity_id], selections, variables, on_ref)
+                for entity_id in ids if entity_id in loaded[type_name]
+            ]
+            target[key] = values if many else (values[0] if values else None)
+    return data
+
+
+class _CountingStore:
+    """Envoltório que conta as idas ao armazenamento de uma requisição."""
+
+    def __init__(self, store: Store):
+        self.store = store
+        self.calls = 0
+
+    def load(self, kind, key):
+        self.calls += 1
+        return self.store.load(kind, key)
+
+    def load_many(self, kind, keys):
+        self.calls += 1
+        return self.store.load_many(kind, keys)
+
+
+def execute_graphql(payload: dict, store: Store, strategy: str, cache: QueryCache) -> dict:
+    """Executa uma requisição GraphQL e devolve o corpo da resposta com as medições."""
+    start = time.perf_counter()
+    query = payload.get('query') or ''
+    variables = payload.get('variables') or {}
+    counting = _CountingStore(store)
+    cache_hit = False
+    parsed = None
+    try:
+        if strategy == 'cached':
+            document, cache_hit = cache.get_or_parse(query)
+        else:
+            document = parse_and_validate(query)
+        parsed = time.perf_counter()
+        executor = execute_naive if strategy == 'naive' else execute_batched
+        body = {'data': executor(document, variables, counting)}
+    except GraphQLError as e:
+        parsed = parsed or time.perf_counter()
+        body = {'errors': [{'message': str(e)}], 'data': None}
+    end = time.perf_counter()
+
+    body['extensions'] = {'timing': {
+        'strategy': strategy,
+        'parse_ms': (parsed - start) * 1000,
+        'execute_ms': (end - parsed) * 1000,
+        'resolve_ms': (end - start) * 1000,
+        'store_calls': counting.calls,
+        'cache_hit': cache_hit,
+    }}
+    return body
+
+
+# Servidor HTTP
+class RequestHandler(BaseHTTPRequestHandler):
+    """
+    Atende `/api/{character,location,episode}/<id>[,<id>...]` (GET, com
+    ETag/If-None-Match para um único personagem), a listagem paginada
+    `/api/<recurso>?page=N` e `/graphql` (POST).
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'LocalBenchServer/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status: int, body, server_ms: float, etag: Optional[str] = None):
+        content = json.dumps(body, separators=(',', ':')).encode('utf-8') if status != 304 else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Server-Timing', f"app;dur={server_ms:.3f}")
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        start = time.perf_counter()
+        path, _, query = self.path.partition('?')
+        match = re.fullmatch(r'/api/(character|location|episode)(?:/(\d+(?:,\d+)*))?/?', path)
+        if not match:
+            self.send_json(404, {'error': 'There is nothing here'}, 0.0)
+            return
+        base_url = f"http://{self.headers.get('Host', 'localhost')}"
+        resource = match.group(1)
+        kind, represent = REST_RESOURCES[resource]
+        etag = None
+        if match.group(2) is None:
+            status, body = self.rest_page(resource, query, base_url)
+        else:
+            ids = [int(i) for i in match.group(2).split(',')]
+            if len(ids) == 1:
+                entity = self.server.store.load(kind, ids[0])
+                if entity is None:
+                    status, body = 404, {'error': f"{kind} not found"}
+                elif kind == 'Character':
+                    # GET condicional: 304 sem corpo se o cliente já tem a versão atual
+                    etag = character_etag(entity)
+                    status = 304 if self.headers.get('If-None-Match') == etag else 200
+                    body = represent(entity, base_url)
+                else:
+                    status, body = 200, represent(entity, base_url)
+            else:
+                loaded = self.server.store.load_many(kind, ids)
+                status, body = 200, [represent(loaded[i], base_url) for i in ids if i in loaded]
+        self.send_json(status, body, (time.perf_counter() - start) * 1000, etag)
+
+    def rest_page(self, resource: str, query: str, base_url: str):
+        """Listagem paginada (`?page=N`), no formato `info` + `results` da API pública."""
+        kind, represent = REST_RESOURCES[resource]
+        count = len(self.server.store.tables[kind])
+        pages = -(-count // REST_PAGE_SIZE)
+        page = re.search(r'(?:^|&)page=(\d+)', query)
+        page = int(page.group(1)) if page else 1
+        if not 1 <= page <= pages:
+            return 404, {'error': 'There is nothing here'}
+        first = (page - 1) * REST_PAGE_SIZE + 1
+        loaded = self.server.store.load_many(kind, range(first, min(first + REST_PAGE_SIZE, count + 1)))
+        url = f"{base_url}/api/{resource}"
+        return 200, {
+            'info': {
+                'count': count,
+                'pages': pages,
+                'next': f"{url}?page={page + 1}" if page < pages else None,
+                'prev': f"{url}?page={page - 1}" if page > 1 else None,
+            },
+            'results': [represent(entity, base_url) for entity in loaded.values()],
+        }
+
+    def do_POST(self):
+        if self.path.split('?')[0].rstrip('/') != '/graphql':
+            self.send_json(404, {'error': 'There is nothing here'}, 0.0)
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError:
+            self.send_json(400, {'errors': [{'message': 'JSON inválido'}]}, 0.0)
+            return
+        # Estratégia por requisição (cabeçalho) ou a padrão do servidor
+        strategy = self.headers.get('X-GraphQL-Strategy', self.server.strategy)
+        if strategy not in STRATEGIES:
+            self.send_json(400, {'errors': [{'message': f"Estratégia desconhecida: {strategy}"}]}, 0.0)
+            return
+        body = execute_graphql(payload, self.server.store, strategy, self.server.query_cache)
+        status = 400 if body['data'] is None else 200
+        server_ms = body['extensions']['timing']['resolve_ms']
+        if not self.server.timing_extension:
+            del body['extensions']
+        self.send_json(status, body, server_ms)
+
+
+def build_server(host: str = '127.0.0.1', port: int = 8000, strategy: str = 'cached',
+                 db_latency_ms: float = 0.5, seed: int = 0, timing_extension: bool = True,
+                 verbose: bool = False) -> ThreadingHTTPServer:
+    """Cria o servidor (sem iniciá-lo); útil para subir em uma thread em testes."""
+    server = ThreadingHTTPServer((host, port), RequestHandler)
+    server.daemon_threads = True
+    server.store = Store(db_latency_ms, seed)
+    server.strategy = strategy
+    server.query_cache = QueryCache()
+    server.timing_extension = timing_extension
+    server.verbose = verbose
+    return server
+
+
+def main():
+    """
+    Função principal do servidor local.
+    """
+    parser = argparse.ArgumentParser(
+        description='Servidor local REST + GraphQL com dados sintéticos para o experimento'
+    )
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Endereço (padrão: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Porta (padrão: 8000)')
+    parser.add_argument(
+        '--strategy',
+        choices=STRATEGIES,
+        default='cached',
+        help='Estratégia padrão de execução GraphQL (padrão: cached); '
+             'o cabeçalho X-GraphQL-Strategy a substitui por requisição'
+    )
+    parser.add_argument(
+        '--db-latency-ms',
+        type=float,
+        default=0.5,
+        help='Latência simulada por ida ao armazenamento (padrão: 0.5 ms)'
+    )
+    parser.add_argument('--seed', type=int, default=0, help='Semente dos dados sintéticos (padrão: 0)')
+    parser.add_argument(
+        '--no-timing-extension',
+        action='store_true',
+        help='Omitir extensions.timing das respostas GraphQL (o tempo segue no Server-Timing)'
+    )
+    parser.add_argument('--verbose', action='store_true', help='Registrar cada requisição no console')
+
+    args = parser.parse_args()
+
+    server = build_server(args.host, args.port, args.strategy, args.db_latency_ms, args.seed,
+                          not args.no_timing_extension, args.verbose)
+    print("=" * 70)
+    print("SERVIDOR LOCAL REST + GraphQL")
+    print("=" * 70)
+    print(f"REST    : http://{args.host}:{args.port}/api/character/<id>")
+    print(f"GraphQL : http://{args.host}:{args.port}/graphql (estratégia: {args.strategy})")
+    print(f"Latência simulada do armazenamento: {args.db_latency_ms} ms por consulta")
+    print()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ Servidor encerrado")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Métricas do Coletor (OpenMetrics)
+Disciplina: Laboratório de Experimentação de Software
+
+Contadores, gauges e histogramas do coletor expostos em formato OpenMetrics
+(compatível com o scrape do Prometheus) por um servidor HTTP local. O registro
+é feito fora da janela cronometrada de cada requisição; o custo no laço de
+medição é um lock e algumas somas.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+# Limites superiores (segundos) dos buckets de latência
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def bucket_quantile(counts, q: float) -> float:
+    """
+    Quantil aproximado (segundos) a partir das contagens não cumulativas dos
+    buckets de LATENCY_BUCKETS, com interpolação linear dentro do bucket.
+    """
+    total = sum(counts)
+    if not total:
+        return float('nan')
+    rank = q * total
+    cumulative = 0
+    lower = 0.0
+    for bound, count in zip(LATENCY_BUCKETS, counts):
+        if count and cumulative + count >= rank:
+            return lower + (bound - lower) * (rank - cumulative) / count
+        cumulative += count
+        lower = bound
+    return LATENCY_BUCKETS[-1]
+
+
+class CollectorMetrics:
+    """
+    Estado observável do coletor.
+
+    - requisições concluídas por tipo de API, cenário e resultado;
+    - requisições em andamento por tipo de API;
+    - histograma de latência e bytes recebidos por tipo de API e cenário;
+    - erros por tipo de API e cenário;
+    - estado do limitador de taxa (o delay entre requisições).
+    """
+
+    def __init__(self, rate_limit_delay: float = 0.0):
+        self._lock = threading.Lock()
+        self.requests: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.in_flight: Dict[str, int] = defaultdict(int)
+        self.response_bytes: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.buckets: Dict[Tuple[str, str], list] = {}
+        self.latency_sum: Dict[Tuple[str, str], float] = defaultdict(float)
+        self.rate_limit_delay = rate_limit_delay
+        self.rate_limit_waiting = 0
+        self.rate_limit_waits = 0
+        self.rate_limit_wait_seconds = 0.0
+        self.start_time = time.time()
+
+    def begin(self, api_type: str):
+        """Marca o início de uma requisição (gauge de requisições em andamento)."""
+        with self._lock:
+            self.in_flight[api_type] += 1
+
+    def observe(self, api_type: str, scenario: str, time_ms: Optional[float],
+                size_bytes: Optional[int], success: bool):
+        """Registra o término de uma requisição iniciada com `begin`."""
+        with self._lock:
+            self.in_flight[api_type] -= 1
+            key = (api_type, scenario)
+            if not success:
+                self.requests[(api_type, scenario, 'error')] += 1
+                self.errors[key] += 1
+                return
+            self.requests[(api_type, scenario, 'success')] += 1
+            seconds = time_ms / 1000
+            counts = self.buckets.get(key)
+            if counts is None:
+                counts = self.buckets[key] = [0] * (len(LATENCY_BUCKETS) + 1)
+            counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            self.latency_sum[key] += seconds
+            self.response_bytes[key] += size_bytes
+
+    def rate_limit_wait(self, seconds: float):
+        """Dorme `seconds` segundos expondo a espera no estado do limitador."""
+        with self._lock:
+            self.rate_limit_waiting += 1
+        try:
+            time.sleep(seconds)
+        finally:
+            with self._lock:
+                self.rate_limit_waiting -= 1
+                self.rate_limit_waits += 1
+                self.rate_limit_wait_seconds += seconds
+
+    def snapshot(self) -> dict:
+        """Contadores e histogramas acumulados, em estrutura serializável (JSON)."""
+        with self._lock:
+            return {
+                'requests': [[*key, value] for key, value in self.requests.items()],
+                'errors': [[*key, value] for key, value in self.errors.items()],
+                'response_bytes': [[*key, value] for key, value in self.response_bytes.items()],
+                'buckets': [[*key, list(counts)] for key, counts in self.buckets.items()],
+                'latency_sum': [[*key, value] for key, value in self.latency_sum.items()],
+                'rate_limit_waits': self.rate_limit_waits,
+                'rate_limit_wait_seconds': self.rate_limit_wait_seconds,
+            }
+
+    def merge(self, snapshot: dict):
+        """Soma um `snapshot` (de outro processo) a estas métricas."""
+        with self._lock:
+            for *key, value in snapshot['requests']:
+                self.requests[tuple(key)] += value
+            for *key, value in snapshot['errors']:
+                self.errors[tuple(key)] += value
+            for *key, value in snapshot['response_bytes']:
+                self.response_bytes[tuple(key)] += value
+            for *key, counts in snapshot['buckets']:
+                merged = self.buckets.setdefault(tuple(key), [0] * (len(LATENCY_BUCKETS) + 1))
+                for i, count in enumerate(counts):
+                    merged[i] += count
+            for *key, value in snapshot['latency_sum']:
+                self.latency_sum[tuple(key)] += value
+            self.rate_limit_waits += snapshot['rate_limit_waits']
+            self.rate_limit_wait_seconds += snapshot['rate_limit_wait_seconds']
+
+    def render(self) -> str:
+        """Exposição completa em formato OpenMetrics (termina com `# EOF`)."""
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"# HELP {name} {help_text}")
+
+        with self._lock:
+            family('collector_requests', 'counter', 'Requisições concluídas por tipo de API, cenário e resultado.')
+            for (api_type, scenario, outcome), value in sorted(self.requests.items()):
+                lines.append(f"collector_requests_total{_labels(type=api_type, scenario=scenario, outcome=outcome)} {value}")
+
+            family('collector_errors', 'counter', 'Requisições que falharam (exceção ou status HTTP de erro).')
+            for (api_type, scenario), value in sorted(self.errors.items()):
+                lines.append(f"collector_errors_total{_labels(type=api_type, scenario=scenario)} {value}")
+
+            family('collector_in_flight_requests', 'gauge', 'Requisições em andamento.')
+            for api_type, value in sorted(self.in_flight.items()):
+                lines.append(f"collector_in_flight_requests{_labels(type=api_type)} {value}")
+
+            family('collector_request_duration_seconds', 'histogram',
+                   'Tempo de resposta medido pelo cliente.')
+            for (api_type, scenario), counts in sorted(self.buckets.items()):
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), counts):
+                    cumulative += count
+                    labels = _labels(type=api_type, scenario=scenario, le=_number(bound))
+                    lines.append(f"collector_request_duration_seconds_bucket{labels} {cumulative}")
+                labels = _labels(type=api_type, scenario=scenario)
+                lines.append(f"collector_request_duration_seconds_count{labels} {cumulative}")
+                lines.append(f"collector_request_duration_seconds_sum{labels} {_number(self.latency_sum[(api_type, scenario)])}")
+
+            family('collector_response_bytes', 'counter', 'Bytes de corpo recebidos.')
+            for (api_type, scenario), value in sorted(self.response_bytes.items()):
+                lines.append(f"collector_response_bytes_total{_labels(type=api_type, scenario=scenario)} {value}")
+
+            family('collector_rate_limiter_delay_seconds', 'gauge', 'Espera configurada entre requisições.')
+            lines.append(f"collector_rate_limiter_delay_seconds {_number(self.rate_limit_delay)}")
+            family('collector_rate_limiter_waiting', 'gauge', 'Laços de medição parados no limitador agora.')
+            lines.append(f"collector_rate_limiter_waiting {self.rate_limit_waiting}")
+            family('collector_rate_limiter_waits', 'counter', 'Esperas concluídas no limitador.')
+            lines.append(f"collector_rate_limiter_waits_total {self.rate_limit_waits}")
+            family('collector_rate_limiter_wait_seconds', 'counter', 'Tempo total parado no limitador.')
+            lines.append(f"collector_rate_limiter_wait_seconds_total {_number(self.rate_limit_wait_seconds)}")
+
+        family('process_cpu_seconds', 'counter', 'CPU (usuário + sistema) consumida pelo processo coletor.')
+        lines.append(f"process_cpu_seconds_total {_number(time.process_time())}")
+        family('process_start_time_seconds', 'gauge', 'Início do coletor (época Unix).')
+        lines.append(f"process_start_time_seconds {_number(self.start_time)}")
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    metrics: CollectorMetrics = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.metrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_metrics_server(metrics: CollectorMetrics, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Serve `/metrics` em uma thread daemon; encerre com `server.shutdown()`."""
+    handler = type('MetricsHandler', (_MetricsHandler,), {'metrics': metrics})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    return server
@@ -0,0 +1,249 @@
+"""
+Estatísticas Online para Monitoramento ao Vivo
+Disciplina: Laboratório de Experimentação de Software
+
+Acumuladores incrementais usados pelo modo ao vivo do dashboard: contagem,
+média e variância pelo algoritmo de Welford, quantis pelo algoritmo P² de
+Jain & Chlamtac (memória constante) e leitura incremental ("tail") do CSV
+que o coletor grava durante a execução. Inclui também a sequência de
+confiança usada pela amostragem adaptativa do coletor.
+"""
+
+import csv
+import math
+import os
+from typing import Dict, List, Optional, Tuple
+
+
+class RunningStats:
+    """Média, variância, mínimo e máximo atualizados a cada observação (Welford)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def merge(self, other: "RunningStats"):
+        """Combina outro acumulador neste (fórmula paralela de Chan et al.)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta ** 2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Variância amostral (ddof=1), como em pandas.Series.var()."""
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.count > 1 else math.nan
+
+
+def confidence_sequence_halfwidth(stats: RunningStats, alpha: float = 0.05,
+                                  planned_n: int = 50) -> float:
+    """
+    Meia-largura da sequência de confiança assintótica para a média
+    (Waudby-Smith et al., 2021, "Time-uniform central limit theory").
+
+    Diferente de um IC fixo, a cobertura 1 - alpha vale simultaneamente para
+    todos os tamanhos de amostra, então é válido olhar o intervalo após cada
+    lote e parar assim que ele for estreito o suficiente. `planned_n` é o
+    tamanho de amostra em que a largura é otimizada.
+    """
+    n = stats.count
+    if n < 2 or not stats.std > 0:
+        return math.inf if n < 2 else 0.0
+    rho2 = (-2 * math.log(alpha) + math.log(-2 * math.log(alpha) + 1)) / planned_n
+    return stats.std * math.sqrt(
+        2 * (n * rho2 + 1) / (n ** 2 * rho2) * math.log(math.sqrt(n * rho2 + 1) / alpha)
+    )
+
+
+class P2Quantile:
+    """
+    Estimador de quantil P² (Jain & Chlamtac, 1985).
+
+    Mantém apenas cinco marcadores, ajustados por interpolação parabólica a
+    cada nova observação, independentemente do número de amostras.
+    """
+
+    def __init__(self, p: float):
+        if not 0 < p < 1:
+            raise ValueError("p deve estar no intervalo (0, 1)")
+        self.p = p
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._positions: List[float] = []
+        self._desired: List[float] = []
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float):
+        if not self._heights:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._heights = sorted(self._initial)
+                self._positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+                self._desired = [0.0, 2 * self.p, 4 * self.p, 2 + 2 * self.p, 4.0]
+            return
+
+        q, n = self._heights, self._positions
+
+        # Localizar a célula da nova observação, estendendo os extremos se preciso
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Ajustar os marcadores centrais que se afastaram da posição desejada
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        if self._heights:
+            return self._heights[2]
+        if not self._initial:
+            return math.nan
+        # Menos de cinco amostras: quantil exato pelo posto mais próximo
+        ordered = sorted(self._initial)
+        return ordered[min(len(ordered) - 1, int(round(self.p * (len(ordered) - 1))))]
+
+
+class StreamSummary:
+    """Resumo online de uma métrica: momentos via Welford e quantis via P²."""
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self):
+        self.stats = RunningStats()
+        self.quantiles = {p: P2Quantile(p) for p in self.QUANTILES}
+
+    def add(self, x: float):
+        self.stats.add(x)
+        for estimator in self.quantiles.values():
+            estimator.add(x)
+
+    def as_dict(self) -> Dict[str, float]:
+        summary = {
+            'n': self.stats.count,
+            'mean': self.stats.mean if self.stats.count else math.nan,
+            'std': self.stats.std,
+            'min': self.stats.min if self.stats.count else math.nan,
+            'max': self.stats.max if self.stats.count else math.nan,
+        }
+        for p, estimator in self.quantiles.items():
+            summary[f'p{int(p * 100)}'] = estimator.value
+        return summary
+
+
+def _coerce(value: str):
+    """Converte um campo do CSV para int ou float quando possível."""
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            continue
+    return value
+
+
+class CsvTail:
+    """
+    Lê incrementalmente um CSV que está sendo escrito por outro processo.
+
+    Guarda o offset em bytes já consumido e devolve apenas as linhas completas
+    adicionadas desde a última leitura. Se o arquivo for truncado ou substituído,
+    a leitura recomeça do início e `read_new` sinaliza o reset.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.offset = 0
+        self.header: Optional[List[str]] = None
+        self._inode = None
+        self._pending = b''
+
+    def _reset(self):
+        self.offset = 0
+        self.header = None
+        self._pending = b''
+
+    def read_new(self) -> Tuple[List[dict], bool]:
+        """
+        Retorna (novos_registros, houve_reset).
+
+        Registros são dicionários com os valores já convertidos para número.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return [], False
+
+        reset = False
+        if (self._inode is not None and stat.st_ino != self._inode) or stat.st_size < self.offset:
+            self._reset()
+            reset = True
+        self._inode = stat.st_ino
+
+        if stat.st_size == self.offset:
+            return [], reset
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            chunk = f.read(stat.st_size - self.offset)
+        self.offset += len(chunk)
+
+        # Linhas incompletas ficam pendentes até a próxima leitura
+        data = self._pending + chunk
+        complete, _, self._pending = data.rpartition(b'\n')
+        if not complete:
+            return [], reset
+
+        lines = complete.decode('utf-8').splitlines()
+        rows = list(csv.reader(lines))
+        if self.header is None and rows:
+            self.header = rows.pop(0)
+
+        records = [
+            {col: _coerce(value) for col, value in zip(self.header, row)}
+            for row in rows if row
+        ]
+        return records, reset
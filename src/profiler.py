@@ -0,0 +1,75 @@
+"""
+Profiler por Amostragem do Coletor
+Disciplina: Laboratório de Experimentação de Software
+
+Uma thread amostra periodicamente a pilha de todas as outras threads do
+processo (`sys._current_frames`) e acumula as pilhas no formato "folded"
+(`thread;frame;frame... contagem`), lido diretamente por flamegraph.pl,
+speedscope e inferno. Se a maior parte das amostras da thread principal estiver
+fora da espera de rede (montagem de registros, JSON, impressão), o gargalo é o
+próprio cliente.
+"""
+
+import os
+import sys
+import threading
+from collections import Counter
+
+DEFAULT_INTERVAL_MS = 10.0
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Amostrador de pilhas com intervalo fixo.
+
+    Args:
+        path: Arquivo de saída das pilhas folded (gravado em `stop`)
+        interval_ms: Intervalo entre amostras
+    """
+
+    def __init__(self, path: str, interval_ms: float = DEFAULT_INTERVAL_MS):
+        self.path = path
+        self.interval = interval_ms / 1000
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[';'.join(reversed(stack))] += 1
+        self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> int:
+        """Encerra a amostragem, grava as pilhas e retorna o número de amostras."""
+        if self._thread is None:
+            return self.samples
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        with open(self.path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return self.samples
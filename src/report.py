@@ -0,0 +1,331 @@
+"""
+Gerador de Relatórios Estáticos: REST vs GraphQL
+Disciplina: Laboratório de Experimentação de Software
+
+Gera, sem abrir o Streamlit, um relatório HTML (e opcionalmente PNG) com as
+mesmas análises das quatro páginas do dashboard: box plots, histogramas,
+testes estatísticos e interpretação dos resultados. As figuras e os testes de
+cada conjunto de resultados são calculados em paralelo em processos separados,
+reutilizando as funções `create_*` de charts.py e `perform_statistical_test`
+de analysis.py.
+
+Uso:
+    python report.py experiment_results.csv
+    python report.py noite_1.csv noite_2.csv --out-dir relatorios --png --workers 4
+"""
+
+import argparse
+import html
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from analysis import (
+    API_TYPES, NO_PAIRS_MESSAGE, build_paired_index, interpret_size_results,
+    interpret_time_results, load_results, paired_samples, pairing_report,
+    perform_statistical_test, summary_table
+)
+
+# Seções do relatório, na mesma ordem das páginas do dashboard
+SECTIONS = ["Visão Geral", "Análise de Tempo (RQ1)", "Análise de Tamanho (RQ2)", "Análise Detalhada"]
+
+# (seção, gráfico, métrica, rótulo) — gráficos exibidos em cada página
+REPORT_FIGURES = [
+    ("Visão Geral", 'boxplot', 'time_ms', 'Tempo de Resposta (ms)'),
+    ("Visão Geral", 'boxplot', 'size_bytes', 'Tamanho da Resposta (bytes)'),
+    ("Análise de Tempo (RQ1)", 'histogram', 'time_ms', 'Tempo de Resposta (ms)'),
+    ("Análise de Tempo (RQ1)", 'boxplot', 'time_ms', 'Tempo de Resposta (ms)'),
+    ("Análise de Tempo (RQ1)", 'line', 'time_ms', 'Tempo de Resposta (ms)'),
+    ("Análise de Tamanho (RQ2)", 'histogram', 'size_bytes', 'Tamanho da Resposta (bytes)'),
+    ("Análise de Tamanho (RQ2)", 'bar', 'size_bytes', 'Tamanho da Resposta (bytes)'),
+    ("Análise de Tamanho (RQ2)", 'scatter', 'size_bytes', 'Tamanho (bytes)'),
+    ("Análise Detalhada", 'correlation', None, None),
+]
+
+# Testes estatísticos exibidos em cada página
+REPORT_TESTS = [
+    ("Análise de Tempo (RQ1)", 'time_ms'),
+    ("Análise de Tamanho (RQ2)", 'size_bytes'),
+]
+
+PLOTLY_CDN = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+
+
+# Tarefas executadas nos processos de trabalho
+@lru_cache(maxsize=None)
+def load_result_set(path):
+    """Carrega o CSV e o índice pareado uma única vez por processo de trabalho."""
+    df = load_results(path)
+    return df, build_paired_index(df)
+
+
+def render_figure_task(path, builder_name, metric_col, metric_label, png_path=None):
+    """
+    Constrói uma figura com as funções do dashboard e devolve o fragmento HTML.
+
+    Returns:
+        Tupla (html, png_path) — png_path é None se a exportação não foi pedida
+        ou se o kaleido não estiver instalado
+    """
+    from charts import FIGURE_BUILDERS, PAIRED_BUILDERS
+
+    df, paired = load_result_set(path)
+    data = paired if builder_name in PAIRED_BUILDERS else df
+    builder = FIGURE_BUILDERS[builder_name]
+    fig = builder(data) if metric_col is None else builder(data, metric_col, metric_label)
+
+    fragment = fig.to_html(full_html=False, include_plotlyjs=False)
+    if png_path is not None:
+        try:
+            fig.write_image(png_path)
+        except (ImportError, ValueError, RuntimeError) as e:
+            print(f"  ⚠️  PNG não gerado ({os.path.basename(png_path)}): {e}", file=sys.stderr)
+            png_path = None
+    return fragment, png_path
+
+
+def statistics_task(path, metric_col):
+    """
+    Executa o teste pareado de uma métrica e monta o texto de interpretação.
+    Sem pares (dados do modo mix), devolve (None, mensagem).
+    """
+    _, paired = load_result_set(path)
+    pairs = paired_samples(paired, metric_col)
+    if pairs.empty:
+        return None, NO_PAIRS_MESSAGE
+    rest_paired = pairs['REST'].values
+    graphql_paired = pairs['GraphQL'].values
+
+    test_results = perform_statistical_test(rest_paired, graphql_paired)
+    if metric_col == 'time_ms':
+        interpretation = interpret_time_results(test_results)
+    else:
+        reduction_pct = (test_results['diff_mean'] / rest_paired.mean()) * 100
+        interpretation = interpret_size_results(test_results, reduction_pct)
+    return test_results, interpretation
+
+
+def overview_task(path):
+    """Tabela resumo, contagem de pares e correlações tempo x tamanho por tipo."""
+    df, paired = load_result_set(path)
+    correlations = {
+        api_type: df[df['type'] == api_type][['time_ms', 'size_bytes']].corr().iloc[0, 1]
+        for api_type in API_TYPES
+    }
+    return summary_table(df), pairing_report(paired), correlations
+
+
+# Montagem do HTML
+def markdown_to_html(text):
+    """Converte o subconjunto de Markdown usado nas interpretações (negrito e listas)."""
+    parts = []
+    in_list = False
+    for line in text.strip().splitlines():
+        stripped = line.strip()
+        content = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html.escape(stripped.lstrip('- ')))
+        if stripped.startswith('- '):
+            if not in_list:
+                parts.append("<ul>")
+                in_list = True
+            parts.append(f"<li>{content}</li>")
+            continue
+        if in_list:
+            parts.append("</ul>")
+            in_list = False
+        if stripped:
+            parts.append(f"<p>{content}</p>")
+    if in_list:
+        parts.append("</ul>")
+    return "\n".join(parts)
+
+
+def test_results_html(test_results):
+    """Tabela com os resultados do teste de normalidade e do teste de hipótese."""
+    rows = [
+        ("Shapiro-Wilk (estatística)", f"{test_results['shapiro_stat']:.4f}"),
+        ("Shapiro-Wilk (p-valor)", f"{test_results['shapiro_p']:.4f}"),
+        ("Teste utilizado", test_results['test_name']),
+        ("Estatística do teste", f"{test_results['test_stat']:.4f}"),
+        ("p-valor", f"{test_results['test_p']:.4g}"),
+        ("Cohen's d", f"{test_results['cohens_d']:.3f} ({test_results['d_interpretation']})"),
+        ("IC 95% da diferença", f"[{test_results['ci_lower']:.2f}, {test_results['ci_upper']:.2f}]"),
+    ]
+    body = "\n".join(f"<tr><th>{html.escape(k)}</th><td>{html.escape(v)}</td></tr>" for k, v in rows)
+    return f"<table class='stats'>{body}</table>"
+
+
+def build_report_html(title, sections, plotly_js):
+    """Documento HTML completo a partir dos fragmentos de cada seção."""
+    body = []
+    for section in SECTIONS:
+        body.append(f"<h2>{html.escape(section)}</h2>")
+        body.extend(sections.get(section, []))
+    return f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+{plotly_js}
+<style>
+body {{ font-family: sans-serif; max-width: 1200px; margin: auto; padding: 1em; }}
+table {{ border-collapse: collapse; margin: 1em 0; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 10px; text-align: left; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(title)}</h1>
+{chr(10).join(body)}
+</body>
+</html>
+"""
+
+
+def report_name(path, used):
+    """Nome base do relatório, sem colidir com outros conjuntos de resultados."""
+    base = os.path.splitext(os.path.basename(path))[0]
+    name, suffix = base, 2
+    while name in used:
+        name = f"{base}_{suffix}"
+        suffix += 1
+    used.add(name)
+    return name
+
+
+def generate_reports(paths, out_dir, workers=None, png=False, inline_js=False):
+    """
+    Gera um relatório por conjunto de resultados, distribuindo figuras e testes
+    entre processos de trabalho.
+
+    Returns:
+        Lista com os caminhos dos arquivos HTML gerados
+    """
+    if png:
+        try:
+            import kaleido  # noqa: F401
+        except ImportError:
+            print("⚠️  kaleido não instalado; exportação PNG desativada (pip install kaleido)")
+            png = False
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = list(dict.fromkeys(paths))
+    used = set()
+    names = {path: report_name(path, used) for path in paths}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Submeter todas as tarefas antes de aguardar qualquer resultado
+        figure_futures = {}
+        for path in paths:
+            png_dir = os.path.join(out_dir, f"{names[path]}_png") if png else None
+            if png_dir:
+                os.makedirs(png_dir, exist_ok=True)
+            for idx, (section, builder_name, metric_col, metric_label) in enumerate(REPORT_FIGURES):
+                png_path = (os.path.join(png_dir, f"{idx:02d}_{builder_name}_{metric_col or 'time_size'}.png")
+                            if png_dir else None)
+                figure_futures[(path, idx)] = pool.submit(
+                    render_figure_task, path, builder_name, metric_col, metric_label, png_path
+                )
+        stats_futures = {
+            (path, metric_col): pool.submit(statistics_task, path, metric_col)
+            for path in paths for _, metric_col in REPORT_TESTS
+        }
+        overview_futures = {path: pool.submit(overview_task, path) for path in paths}
+
+        if inline_js:
+            from plotly.offline import get_plotlyjs
+            plotly_js = f"<script>{get_plotlyjs()}</script>"
+        else:
+            plotly_js = f"<script src=\"{PLOTLY_CDN}\"></script>"
+
+        outputs = []
+        for path in paths:
+            sections = {section: [] for section in SECTIONS}
+            summary_df, pairing, correlations = overview_futures[path].result()
+            sections["Visão Geral"].append(
+                f"<p>Pares completos: {pairing['complete']} · sem REST: {pairing['missing_rest']} · "
+                f"sem GraphQL: {pairing['missing_graphql']}</p>"
+            )
+            sections["Visão Geral"].append(summary_df.to_html(index=False, float_format=lambda v: f"{v:.2f}"))
+
+            for idx, (section, *_rest) in enumerate(REPORT_FIGURES):
+                fragment, _png = figure_futures[(path, idx)].result()
+                sections[section].append(fragment)
+
+            for section, metric_col in REPORT_TESTS:
+                test_results, interpretation = stats_futures[(path, metric_col)].result()
+                if test_results is None:
+                    sections[section].append(f"<p>{html.escape(interpretation)}</p>")
+                    continue
+                sections[section].append("<h3>Resultados dos Testes Estatísticos</h3>")
+                sections[section].append(test_results_html(test_results))
+                sections[section].append("<h3>Interpretação dos Resultados</h3>")
+                sections[section].append(markdown_to_html(interpretation))
+
+            sections["Análise Detalhada"].append(
+                "<p>" + " · ".join(f"Correlação {api_type}: {value:.3f}"
+                                   for api_type, value in correlations.items()) + "</p>"
+            )
+
+            output_file = os.path.join(out_dir, f"{names[path]}.html")
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(build_report_html(f"REST vs GraphQL — {names[path]}", sections, plotly_js))
+            outputs.append(output_file)
+            print(f"✓ Relatório gerado: {output_file}")
+
+    return outputs
+
+
+def main():
+    """
+    Função principal do gerador de relatórios.
+    """
+    parser = argparse.ArgumentParser(
+        description='Relatório estático REST vs GraphQL (mesmas análises do dashboard)'
+    )
+    parser.add_argument(
+        'results',
+        nargs='+',
+        help='Um ou mais arquivos CSV de resultados do experimento'
+    )
+    parser.add_argument(
+        '--out-dir',
+        type=str,
+        default='reports',
+        help='Diretório de saída dos relatórios (padrão: reports)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Número de processos de trabalho (padrão: número de CPUs)'
+    )
+    parser.add_argument(
+        '--png',
+        action='store_true',
+        help='Exportar também cada figura em PNG (requer kaleido)'
+    )
+    parser.add_argument(
+        '--inline-js',
+        action='store_true',
+        help='Embutir o plotly.js no HTML para visualização offline'
+    )
+
+    args = parser.parse_args()
+
+    missing = [path for path in args.results if not os.path.exists(path)]
+    if missing:
+        print(f"Erro: arquivo(s) não encontrado(s): {', '.join(missing)}")
+        sys.exit(1)
+
+    generate_reports(
+        [os.path.abspath(path) for path in args.results],
+        args.out_dir,
+        workers=args.workers,
+        png=args.png,
+        inline_js=args.inline_js
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Buffer Colunar de Resultados
+Disciplina: Laboratório de Experimentação de Software
+
+Armazena as medições do coletor em colunas NumPy tipadas, pré-alocadas em
+blocos, em vez de um dicionário Python por registro. Colunas categóricas
+(tipo de API, cenário) guardam apenas códigos inteiros. Ao final da coleta os
+blocos são consolidados uma única vez e entregues ao pandas (ou ao Arrow) sem
+nova cópia dos dados.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+CATEGORY = 'category'
+CHUNK_SIZE = 65_536
+CODE_DTYPE = np.int16
+
+
+class ResultBuffer:
+    """
+    Buffer colunar com esquema fixo.
+
+    Args:
+        schema: Mapeamento coluna -> dtype NumPy, ou CATEGORY para colunas
+            categóricas codificadas
+        chunk_size: Registros pré-alocados por bloco
+    """
+
+    def __init__(self, schema: Dict[str, object], chunk_size: int = CHUNK_SIZE):
+        self.schema = dict(schema)
+        self.chunk_size = chunk_size
+        self._categories: Dict[str, List[str]] = {
+            col: [] for col, dtype in self.schema.items() if dtype == CATEGORY
+        }
+        self._codes: Dict[str, Dict[str, int]] = {col: {} for col in self._categories}
+        self._chunks: List[Dict[str, np.ndarray]] = []
+        self._lengths: List[int] = []
+        self._capacities: List[int] = []
+
+    def _new_chunk(self):
+        self._chunks.append({
+            col: np.empty(self.chunk_size, dtype=CODE_DTYPE if dtype == CATEGORY else dtype)
+            for col, dtype in self.schema.items()
+        })
+        self._lengths.append(0)
+        self._capacities.append(self.chunk_size)
+
+    def _encode(self, col: str, value) -> int:
+        code = self._codes[col].get(value)
+        if code is None:
+            code = len(self._categories[col])
+            self._codes[col][value] = code
+            self._categories[col].append(value)
+        return code
+
+    def append(self, record: dict):
+        """Adiciona um registro (dicionário com todas as colunas do esquema)."""
+        if not self._chunks or self._lengths[-1] == self._capacities[-1]:
+            self._new_chunk()
+        chunk, i = self._chunks[-1], self._lengths[-1]
+        for col in self.schema:
+            value = record[col]
+            chunk[col][i] = self._encode(col, value) if col in self._categories else value
+        self._lengths[-1] = i + 1
+
+    def __len__(self) -> int:
+        return sum(self._lengths)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Consolida os blocos em um único array por coluna e o retorna.
+
+        A concatenação ocorre uma só vez; o bloco consolidado substitui os
+        anteriores, então chamadas seguintes não copiam os dados novamente.
+        """
+        if len(self._chunks) > 1 or (self._chunks and self._lengths[0] < self._capacities[0]):
+            merged = {
+                col: np.concatenate([chunk[col][:n] for chunk, n in zip(self._chunks, self._lengths)])
+                for col in self.schema
+            }
+            self._chunks = [merged]
+            self._lengths = [len(self)]
+            self._capacities = [len(self)]
+        if not self._chunks:
+            return {
+                col: np.empty(0, dtype=CODE_DTYPE if dtype == CATEGORY else dtype)
+                for col, dtype in self.schema.items()
+            }
+        return self._chunks[0]
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame que referencia as colunas consolidadas, sem copiá-las."""
+        columns = self.columns()
+        data = {}
+        for col in self.schema:
+            if col in self._categories:
+                data[col] = pd.Categorical.from_codes(columns[col], categories=self._categories[col])
+            else:
+                data[col] = columns[col]
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self):
+        """
+        Tabela Arrow sobre as mesmas colunas (requer pyarrow).
+
+        Colunas numéricas sem nulos são compartilhadas com o NumPy; categóricas
+        viram DictionaryArray com os códigos já calculados.
+        """
+        import pyarrow as pa
+
+        columns = self.columns()
+        arrays = {}
+        for col in self.schema:
+            if col in self._categories:
+                arrays[col] = pa.DictionaryArray.from_arrays(
+                    pa.array(columns[col]), pa.array(self._categories[col], type=pa.string())
+                )
+            else:
+                arrays[col] = pa.array(columns[col])
+        return pa.table(arrays)
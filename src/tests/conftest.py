@@ -0,0 +1,6 @@
+"""Torna os módulos de src/ importáveis pelos testes (o projeto não é um pacote)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,259 @@
+"""Testes do pareamento REST x GraphQL e das análises derivadas (analysis.py)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scipy import stats
+
+from analysis import (PAIR_KEYS, PAIRED_DIFFERENCE, adjust_pvalues, build_paired_index, cohens_d,
+                      hampel_flags, hypothesis_test, interpret_cohens_d, order_effect_test,
+                      outlier_windows, paired_samples, paired_without_outliers, scenario_matrix,
+                      unpaired_records)
+
+
+def records(rows, columns=('type', 'id', 'time_ms', 'size_bytes')):
+    return pd.DataFrame(rows, columns=list(columns))
+
+
+def test_paired_index_defaults_missing_key_columns():
+    df = records([('REST', 1, 10.0, 100), ('GraphQL', 1, 8.0, 40),
+                  ('REST', 1, 12.0, 100), ('GraphQL', 1, 9.0, 40)])
+    paired = build_paired_index(df)
+    assert list(paired.index.names) == PAIR_KEYS
+    # Repetições numeradas pela ordem de ocorrência de cada (id, tipo)
+    assert paired[('time_ms', 'REST')].tolist() == [10.0, 12.0]
+    assert paired[('time_ms', 'GraphQL')].tolist() == [8.0, 9.0]
+
+
+def test_paired_index_pairs_only_declared_counterparts():
+    df = records([
+        ('REST', 1, 10.0, 'detalhe'), ('GraphQL', 1, 8.0, 'detalhe'),
+        ('REST', 1, 50.0, 'lista'), ('GraphQL', 1, 30.0, 'lista'),
+        ('REST', 1, 99.0, ''), ('GraphQL', 1, 77.0, np.nan),
+    ], columns=('type', 'id', 'time_ms', 'pair'))
+    assert unpaired_records(df).tolist() == [False] * 4 + [True] * 2
+
+    paired = build_paired_index(df, values=['time_ms'])
+    assert len(paired) == 2
+    detail = paired.xs('detalhe', level='pair')['time_ms']
+    assert detail[['REST', 'GraphQL']].values.tolist() == [[10.0, 8.0]]
+    listing = paired.xs('lista', level='pair')['time_ms']
+    assert listing[['REST', 'GraphQL']].values.tolist() == [[50.0, 30.0]]
+
+
+def test_paired_index_keeps_incomplete_pairs_as_nan():
+    df = records([('REST', 1, 10.0, 100), ('GraphQL', 1, 8.0, 40), ('REST', 2, 11.0, 100)])
+    paired = build_paired_index(df)
+    assert paired[('time_ms', 'GraphQL')].isna().tolist() == [False, True]
+
+
+def test_failed_request_in_one_round_does_not_shift_later_rounds():
+    # REST do ID 1 falhou na rodada 1 (requisições com erro não são registradas)
+    df = records([('GraphQL', 1, 10.0, 1), ('REST', 1, 200.0, 2), ('GraphQL', 1, 12.0, 2)],
+                 columns=('type', 'id', 'time_ms', 'round'))
+    paired = build_paired_index(df, values=['time_ms'])['time_ms']
+    round_2 = paired.xs(2, level='round')
+    assert round_2[['REST', 'GraphQL']].values.tolist() == [[200.0, 12.0]]
+    round_1 = paired.xs(1, level='round')
+    assert round_1['REST'].isna().all() and round_1['GraphQL'].tolist() == [10.0]
+
+
+def test_mix_data_has_no_pairs():
+    df = records([('REST', 1, 10.0, ''), ('GraphQL', 1, 8.0, '')],
+                 columns=('type', 'id', 'time_ms', 'pair'))
+    assert build_paired_index(df, values=['time_ms']).empty
+
+
+def order_run(n=200, first_penalty=0.0, seed=0):
+    """Coleta pareada com ordem alternada; quem roda primeiro paga `first_penalty` ms."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(1, n + 1):
+        rest_first = i % 2 == 0
+        for api_type, base in (('REST', 100.0), ('GraphQL', 80.0)):
+            position = 1 if (api_type == 'REST') == rest_first else 2
+            time_ms = base + rng.normal(0, 3.0) + (first_penalty if position == 1 else 0.0)
+            rows.append((api_type, i, time_ms, position))
+    return records(rows, columns=('type', 'id', 'time_ms', 'position'))
+
+
+def test_order_effect_requires_varying_positions():
+    df = order_run()
+    assert order_effect_test(df.drop(columns='position')) is None
+    assert order_effect_test(df.assign(position=np.where(df['type'] == 'REST', 1, 2))) is None
+
+
+def test_order_effect_absent_when_position_does_not_matter():
+    table = order_effect_test(order_run()).set_index('group')
+    assert list(table.index) == ['REST', 'GraphQL', PAIRED_DIFFERENCE]
+    assert (table['n_first'] == 100).all() and (table['n_later'] == 100).all()
+    assert (table['p_value'] > 0.01).all()
+    assert ((table['ci_lower'] <= 0) & (table['ci_upper'] >= 0)).all()
+
+
+def test_order_effect_detects_first_position_penalty():
+    table = order_effect_test(order_run(first_penalty=10.0)).set_index('group')
+    for api_type in ('REST', 'GraphQL'):
+        assert table.loc[api_type, 'effect'] == pytest.approx(10.0, abs=1.5)
+        assert table.loc[api_type, 'p_value'] < 0.001
+    # REST primeiro: REST +10; GraphQL primeiro: GraphQL +10 → diferença de 20 ms
+    assert table.loc[PAIRED_DIFFERENCE, 'effect'] == pytest.approx(20.0, abs=2.0)
+    assert table.loc[PAIRED_DIFFERENCE, 'p_value'] < 0.001
+
+
+# Com janelas de 11 registros, o ruído gaussiano ainda passa de 3 MADs às vezes;
+# os picos de 10x ficam centenas de MADs acima da mediana local
+SPIKE_THRESHOLD = 10.0
+
+
+def spiky_run(n=100, spikes=(30, 31, 70), seed=0):
+    """Coleta pareada com picos de 10x no REST nos IDs de `spikes`."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(1, n + 1):
+        for api_type, base in (('REST', 100.0), ('GraphQL', 80.0)):
+            time_ms = base + rng.normal(0, 2.0)
+            if api_type == 'REST' and i in spikes:
+                time_ms *= 10
+            rows.append((api_type, i, time_ms, float(i)))
+    return records(rows, columns=('type', 'id', 'time_ms', 'started_at'))
+
+
+def test_hampel_flags_isolated_spikes_only():
+    flagged = hampel_flags(spiky_run(), threshold=SPIKE_THRESHOLD)
+    assert {'rolling_median', 'outlier_score', 'outlier'} <= set(flagged)
+    assert len(flagged) == 200
+    assert sorted(flagged.loc[flagged['outlier'], 'id']) == [30, 31, 70]
+    assert (flagged.loc[flagged['outlier'], 'type'] == 'REST').all()
+    # A mediana local não é arrastada pelos picos
+    assert flagged.loc[flagged['outlier'], 'rolling_median'].between(90, 110).all()
+
+
+def test_hampel_respects_collection_order_and_groups():
+    df = spiky_run().sample(frac=1.0, random_state=1)
+    flagged = hampel_flags(df, threshold=SPIKE_THRESHOLD)
+    assert flagged.index.equals(df.index)
+    assert sorted(flagged.loc[flagged['outlier'], 'id']) == [30, 31, 70]
+
+
+def test_hampel_ignores_constant_windows():
+    df = records([('REST', i, 100.0, 500) for i in range(1, 30)])
+    flagged = hampel_flags(df)
+    assert not flagged['outlier'].any()
+    assert flagged['outlier_score'].isna().all()
+
+
+def test_hampel_threshold_controls_sensitivity():
+    df = spiky_run(spikes=())
+    assert hampel_flags(df, threshold=0.5)['outlier'].sum() > hampel_flags(df)['outlier'].sum()
+
+
+def test_outlier_windows_group_consecutive_records():
+    windows = outlier_windows(hampel_flags(spiky_run(), threshold=SPIKE_THRESHOLD))
+    assert len(windows) == 2
+    by_ids = windows.set_index('ids')
+    assert by_ids.loc['30, 31', 'records'] == 2
+    assert (by_ids.loc['30, 31', 'start'], by_ids.loc['30, 31', 'end']) == (30.0, 31.0)
+    assert by_ids.loc['70', 'records'] == 1
+    assert windows['max_score'].is_monotonic_decreasing
+
+
+def test_paired_without_outliers_drops_whole_pairs():
+    clean = paired_without_outliers(hampel_flags(spiky_run(), threshold=SPIKE_THRESHOLD))
+    ids = clean.index.get_level_values('id')
+    assert len(clean) == 97
+    assert not set(ids) & {30, 31, 70}
+    assert clean[('time_ms', 'REST')].max() < 200
+
+
+@pytest.mark.parametrize('method, expected', [
+    ('holm', [0.03, 0.06, 0.06, 0.02]),
+    ('bh', [0.02, 0.04, 0.04, 0.02]),
+])
+def test_adjust_pvalues_hand_computed(method, expected):
+    np.testing.assert_allclose(adjust_pvalues([0.01, 0.04, 0.03, 0.005], method), expected)
+
+
+@pytest.mark.parametrize('method, expected', [('holm', 0.06), ('bh', 0.03)])
+def test_adjust_pvalues_gives_ties_the_same_value(method, expected):
+    adjusted = adjust_pvalues([0.02, 0.5, 0.02], method)
+    np.testing.assert_allclose(adjusted[[0, 2]], [expected, expected])
+
+
+@pytest.mark.parametrize('method', ['holm', 'bh'])
+def test_adjust_pvalues_leaves_nan_out_of_the_family(method):
+    adjusted = adjust_pvalues([0.01, np.nan, 0.04], method)
+    assert np.isnan(adjusted[1])
+    np.testing.assert_allclose(adjusted[[0, 2]], [0.02, 0.04])
+    assert np.isnan(adjust_pvalues([np.nan, np.nan], method)).all()
+
+
+@pytest.mark.parametrize('method', ['holm', 'bh'])
+def test_adjust_pvalues_is_monotone_and_bounded(method):
+    p = np.random.default_rng(0).uniform(0, 0.2, 40)
+    adjusted = adjust_pvalues(p, method)
+    order = np.argsort(p)
+    assert np.all(np.diff(adjusted[order]) >= 0)
+    assert np.all(adjusted >= p) and np.all(adjusted <= 1.0)
+    np.testing.assert_allclose(adjust_pvalues([0.6, 0.7], method), [1.0, 1.0] if method == 'holm' else [0.7, 0.7])
+
+
+def test_holm_is_more_conservative_than_bh_and_bh_matches_scipy():
+    p = np.random.default_rng(1).uniform(0, 0.1, 25)
+    assert np.all(adjust_pvalues(p, 'holm') >= adjust_pvalues(p, 'bh'))
+    if hasattr(stats, 'false_discovery_control'):
+        np.testing.assert_allclose(adjust_pvalues(p, 'bh'), stats.false_discovery_control(p, method='bh'))
+
+
+def test_adjust_pvalues_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        adjust_pvalues([0.01], 'bonferroni-ish')
+
+
+def scenario_run(seed=0):
+    """Três cenários pareados com efeitos diferentes e um cenário com um único par."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for scenario, effect in (('leve', 0.5), ('medio', 5.0), ('pesado', 20.0)):
+        for i in range(1, 41):
+            base = rng.normal(100, 10)
+            rows.append(('REST', i, base + effect + rng.normal(0, 4), 900, scenario))
+            rows.append(('GraphQL', i, base + rng.normal(0, 4), 400, scenario))
+    rows += [('REST', 1, 50.0, 900, 'unico'), ('GraphQL', 1, 40.0, 400, 'unico')]
+    return records(rows, columns=('type', 'id', 'time_ms', 'size_bytes', 'scenario'))
+
+
+def test_scenario_matrix_matches_per_scenario_tests():
+    paired = build_paired_index(scenario_run())
+    matrix = scenario_matrix(paired, alpha=0.05, correction='holm').set_index(['scenario', 'metric'])
+    assert len(matrix) == 8
+
+    pairs = paired_samples(paired, 'time_ms')
+    for scenario in ('leve', 'medio', 'pesado'):
+        cell = matrix.loc[(scenario, 'time_ms')]
+        group = pairs.xs(scenario, level='scenario')
+        rest, graphql = group['REST'].to_numpy(), group['GraphQL'].to_numpy()
+        test = hypothesis_test(rest, graphql, paired=True)
+        assert test['test_name'] == "Teste t pareado"
+        assert cell['p_value'] == pytest.approx(test['test_p'])
+        assert cell['n'] == 40
+        assert cell['diff_mean'] == pytest.approx((rest - graphql).mean())
+        assert cell['cohens_d'] == pytest.approx(cohens_d(group['REST'], group['GraphQL']))
+        assert cell['d_interpretation'] == interpret_cohens_d(cell['cohens_d'])
+        ci = stats.t.interval(0.95, 39, loc=(rest - graphql).mean(), scale=stats.sem(rest - graphql))
+        assert (cell['ci_lower'], cell['ci_upper']) == pytest.approx(ci)
+
+    # Tamanhos determinísticos: diferença constante, efeito certo
+    sizes = matrix.xs('size_bytes', level='metric')
+    assert (sizes.loc[['leve', 'medio', 'pesado'], 'p_value'] == 0.0).all()
+    assert (sizes.loc[['leve', 'medio', 'pesado'], 'diff_mean'] == 500).all()
+
+    # Um único par não permite teste e fica fora da família da correção
+    assert np.isnan(matrix.loc[('unico', 'time_ms'), 'p_value'])
+    assert np.isnan(matrix.loc[('unico', 'time_ms'), 'p_adjusted'])
+    valid = matrix['p_value'].notna()
+    np.testing.assert_allclose(matrix.loc[valid, 'p_adjusted'],
+                               adjust_pvalues(matrix.loc[valid, 'p_value'], 'holm'))
+    assert matrix.loc[('pesado', 'time_ms'), 'significant']
+    assert matrix['significant'].equals(matrix['p_adjusted'] < 0.05)
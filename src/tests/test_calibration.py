@@ -0,0 +1,115 @@
+"""Testes da calibração do harness (calibration.py) e da correção do piso (analysis.py)."""
+
+import json
+import urllib.request
+
+import pandas as pd
+import pytest
+
+import experimet
+from analysis import apply_overhead_correction
+from calibration import calibrate, calibration_path, load_calibration, save_calibration
+
+REST_OVERHEAD_MS = 1.5
+GRAPHQL_OVERHEAD_MS = 4.0
+WARMUP_MS = 1000.0
+
+
+class FakeClient:
+    """Caminho de cliente falso: toca o endpoint nulo e devolve um overhead conhecido."""
+
+    def __init__(self, overhead_ms, method='GET'):
+        self.overhead_ms = overhead_ms
+        self.method = method
+        self.calls = 0
+        self.bodies = []
+
+    def __call__(self, base_url):
+        data = b'{"query":"{}"}' if self.method == 'POST' else None
+        with urllib.request.urlopen(urllib.request.Request(base_url, data=data, method=self.method)) as response:
+            self.bodies.append(json.loads(response.read()))
+        self.calls += 1
+        # A primeira chamada (aquecimento) é descartada pela calibração
+        return WARMUP_MS if self.calls == 1 else self.overhead_ms + (self.calls % 3) * 0.1
+
+
+@pytest.fixture(scope='module')
+def calibration():
+    rest, graphql = FakeClient(REST_OVERHEAD_MS), FakeClient(GRAPHQL_OVERHEAD_MS, 'POST')
+    result = calibrate(rest, graphql, samples=30)
+    return result, rest, graphql
+
+
+def test_floor_is_the_median_of_each_client_path(calibration):
+    result, _, _ = calibration
+    assert result['floor_ms']['REST'] == pytest.approx(REST_OVERHEAD_MS + 0.1)
+    assert result['floor_ms']['GraphQL'] == pytest.approx(GRAPHQL_OVERHEAD_MS + 0.1)
+    assert result['null_rest']['min_ms'] == pytest.approx(REST_OVERHEAD_MS)
+    assert result['null_graphql']['p95_ms'] == pytest.approx(GRAPHQL_OVERHEAD_MS + 0.2)
+
+
+def test_warmup_call_is_discarded(calibration):
+    result, rest, graphql = calibration
+    assert rest.calls == graphql.calls == result['samples'] + 1
+    assert result['null_rest']['mean_ms'] < WARMUP_MS / 100
+    assert result['null_graphql']['mean_ms'] < WARMUP_MS / 100
+
+
+def test_clients_hit_a_live_null_endpoint(calibration):
+    _, rest, graphql = calibration
+    assert rest.bodies and all(body == {} for body in rest.bodies)
+    assert graphql.bodies and all(body == {'data': {}} for body in graphql.bodies)
+
+
+def test_clock_fields_are_reported(calibration):
+    result, _, _ = calibration
+    assert result['clock'] == 'perf_counter'
+    assert result['resolution_ns'] > 0
+    assert 0 < result['observed_step_ns'] < float('inf')
+    assert result['timer_overhead_ns'] >= 0
+
+
+def test_overhead_correction_subtracts_the_floor_per_type(calibration):
+    result, _, _ = calibration
+    df = pd.DataFrame({'type': ['REST', 'GraphQL', 'REST', 'Outro'], 'time_ms': [10.0, 20.0, 1.6, 5.0]})
+    corrected = apply_overhead_correction(df, result)
+    assert corrected['time_ms'].tolist() == pytest.approx([
+        10.0 - (REST_OVERHEAD_MS + 0.1), 20.0 - (GRAPHQL_OVERHEAD_MS + 0.1), 0.0, 5.0])
+    assert df['time_ms'].tolist() == [10.0, 20.0, 1.6, 5.0]
+
+
+def test_calibration_round_trips_next_to_the_results(tmp_path, calibration):
+    result, _, _ = calibration
+    results_path = str(tmp_path / 'run.csv')
+    assert load_calibration(results_path) is None
+    assert save_calibration(result, results_path) == calibration_path(results_path)
+    assert calibration_path(results_path).endswith('run.calibration.json')
+    assert load_calibration(results_path) == result
+
+
+def test_calibrate_harness_uses_the_collector_client_paths(monkeypatch):
+    urls = {'REST': [], 'GraphQL': []}
+
+    def fake_rest(character_id, base_url=None):
+        urls['REST'].append(base_url)
+        return REST_OVERHEAD_MS, 2, float('nan'), True
+
+    def fake_graphql(character_id, graphql_url=None):
+        urls['GraphQL'].append(graphql_url)
+        return GRAPHQL_OVERHEAD_MS, 11, float('nan'), True
+
+    monkeypatch.setattr(experimet, 'make_rest_request', fake_rest)
+    monkeypatch.setattr(experimet, 'make_graphql_request', fake_graphql)
+    result = experimet.calibrate_harness(samples=5)
+
+    assert result['floor_ms'] == {'REST': REST_OVERHEAD_MS, 'GraphQL': GRAPHQL_OVERHEAD_MS}
+    assert len(urls['REST']) == len(urls['GraphQL']) == 6
+    assert all(url.startswith('http://127.0.0.1:') and url.endswith('/api/character') for url in urls['REST'])
+    assert all(url.endswith('/graphql') for url in urls['GraphQL'])
+
+
+def test_calibrate_harness_measures_a_real_floor():
+    result = experimet.calibrate_harness(samples=10)
+    for api in ('REST', 'GraphQL'):
+        assert 0 < result['floor_ms'][api] < 1000
+    assert result['null_rest']['min_ms'] <= result['null_rest']['median_ms'] <= result['null_rest']['p95_ms']
@@ -0,0 +1,142 @@
+"""Testes do cenário de change feed: WebSocket, clientes e servidor (change_feed.py)."""
+
+import argparse
+import asyncio
+import random
+import socket
+import time
+
+import pytest
+
+import change_feed
+from change_feed import (OP_CLOSE, OP_TEXT, ClientStats, encode_frame, read_frame, read_http_head,
+                         run_scenario, subscription_client, ws_accept_key)
+
+
+def test_ws_accept_key_matches_rfc_example():
+    # RFC 6455, seção 1.3
+    assert ws_accept_key('dGhlIHNhbXBsZSBub25jZQ==') == 's3pPLMBiTxaQ9kYGzzhZRbK+xOo='
+
+
+@pytest.mark.parametrize('size', [0, 5, 125, 126, 70_000])
+@pytest.mark.parametrize('mask', [False, True])
+def test_frame_round_trip(size, mask):
+    payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+
+    async def decode():
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_frame(payload, OP_TEXT, mask=mask))
+        reader.feed_eof()
+        return await read_frame(reader)
+
+    opcode, decoded, nbytes = asyncio.run(decode())
+    assert (opcode, decoded) == (OP_TEXT, payload)
+    assert nbytes == len(encode_frame(payload, OP_TEXT, mask=mask))
+
+
+def scenario_args(**overrides):
+    options = {'mutation_rate': 10.0, 'watch_ids': 3, 'seed': 1, 'duration': 1.5, 'poll_interval': 0.2}
+    options.update(overrides)
+    return argparse.Namespace(**options)
+
+
+@pytest.fixture(scope='module')
+def feed_results():
+    return {mode: run_scenario(mode, 3, scenario_args()) for mode in change_feed.MODES}
+
+
+def test_subscription_delivers_changes_against_local_server(feed_results):
+    row = feed_results['subscription']
+    assert row['errors'] == 0
+    assert row['changes_expected'] > 0
+    assert row['delivery_ratio'] >= 0.9
+    assert row['requests'] == 0
+    assert 0 <= row['latency_p50_ms'] < 100
+
+
+def test_conditional_polling_saves_bytes(feed_results):
+    poll, conditional = feed_results['poll'], feed_results['conditional']
+    assert poll['errors'] == conditional['errors'] == 0
+    assert poll['requests'] > 0 and conditional['requests'] > 0
+    assert 0 < conditional['changes_delivered'] <= conditional['changes_expected']
+    assert conditional['bytes_per_change'] < poll['bytes_per_change']
+
+
+def test_polling_phases_come_from_the_given_rng(monkeypatch):
+    phases = []
+    original = change_feed.poll_client
+
+    async def recording_poll_client(*args, phase=0.0, **kwargs):
+        phases.append(phase)
+        return await original(*args, phase=phase, **kwargs)
+
+    def forbidden():
+        raise AssertionError("o módulo random global não deve ser usado")
+
+    monkeypatch.setattr(change_feed, 'poll_client', recording_poll_client)
+    monkeypatch.setattr(change_feed.random, 'random', forbidden)
+    args = scenario_args(duration=0.3)
+    run_scenario('poll', 4, args)
+    run_scenario('poll', 4, args)
+    rng = random.Random(args.seed)
+    expected = [rng.random() * args.poll_interval for _ in range(4)]
+    assert phases == expected * 2
+
+
+def open_window(duration=2.0):
+    window = {
+        'slots': asyncio.Semaphore(1), 'pending': 1, 'connected': asyncio.Event(),
+        'go': asyncio.Event(), 'start': time.time(), 'stop': time.time() + duration,
+    }
+    window['go'].set()
+    return window
+
+
+def test_subscription_client_counts_refused_connection():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    stats = ClientStats(1)
+
+    async def run():
+        await subscription_client('127.0.0.1', port, stats, open_window())
+
+    asyncio.run(run())
+    assert stats.errors == 1
+
+
+def test_subscription_client_counts_server_dropping_the_socket():
+    stats = ClientStats(1)
+
+    async def drop_after_subscribe(reader, writer):
+        _, headers, _ = await read_http_head(reader)
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {ws_accept_key(headers['sec-websocket-key'])}\r\n\r\n".encode()
+        )
+        await read_frame(reader)  # connection_init
+        writer.write(encode_frame(b'{"type":"connection_ack"}'))
+        await read_frame(reader)  # subscribe
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(drop_after_subscribe, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            window = open_window()
+            await asyncio.wait_for(subscription_client('127.0.0.1', port, stats, window), 5)
+            assert window['connected'].is_set()
+
+    asyncio.run(run())
+    assert stats.errors == 1
+    assert stats.latencies == []
+
+
+def test_close_frame_is_understood():
+    async def decode():
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_frame(b'', OP_CLOSE, mask=True))
+        reader.feed_eof()
+        return await read_frame(reader)
+
+    assert asyncio.run(decode())[:2] == (OP_CLOSE, b'')
@@ -0,0 +1,50 @@
+"""Testes do downsampling LTTB e da grade de densidade (charts.py)."""
+
+import numpy as np
+
+from charts import density_grid, lttb_downsample
+
+
+def test_lttb_returns_series_unchanged_when_already_small():
+    x = np.arange(10)
+    y = np.arange(10) ** 2
+    out_x, out_y = lttb_downsample(x, y, 20)
+    np.testing.assert_array_equal(out_x, x)
+    np.testing.assert_array_equal(out_y, y)
+
+
+def test_lttb_keeps_endpoints_and_target_size():
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000)
+    y = rng.normal(size=x.size)
+    out_x, out_y = lttb_downsample(x, y, 500)
+    assert len(out_x) == len(out_y) == 500
+    assert out_x[0] == x[0] and out_x[-1] == x[-1]
+    assert np.all(np.diff(out_x) > 0)
+
+
+def test_lttb_preserves_isolated_peak():
+    x = np.arange(1_000)
+    y = np.zeros(1_000)
+    y[537] = 100.0
+    out_x, out_y = lttb_downsample(x, y, 50)
+    assert 537 in out_x
+    assert out_y.max() == 100.0
+
+
+def test_lttb_selected_points_belong_to_original_series():
+    x = np.linspace(0, 10, 3_000)
+    y = np.sin(x)
+    out_x, out_y = lttb_downsample(x, y, 100)
+    idx = np.searchsorted(x, out_x)
+    np.testing.assert_array_equal(x[idx], out_x)
+    np.testing.assert_array_equal(y[idx], out_y)
+
+
+def test_density_grid_counts_every_point():
+    rng = np.random.default_rng(1)
+    x, y = rng.normal(size=5_000), rng.normal(size=5_000)
+    x_centers, y_centers, counts = density_grid(x, y, bins=30)
+    assert counts.shape == (30, 30)
+    assert len(x_centers) == len(y_centers) == 30
+    assert counts.sum() == 5_000
@@ -0,0 +1,124 @@
+"""Testes do gate de regressão (analysis.compare_result_sets e compare.py)."""
+
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import compare
+from analysis import compare_result_sets
+
+TOLERANCES = {'time_ms': 0.05, 'size_bytes': 0.01}
+
+
+def make_run(n=40, time_scale=1.0, seed=0, types=('REST', 'GraphQL')):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for api_type in types:
+        base = 100.0 if api_type == 'REST' else 80.0
+        frames.append(pd.DataFrame({
+            'type': api_type,
+            'id': np.arange(1, n + 1),
+            'time_ms': base * time_scale + rng.normal(0, 2.0, n),
+            'size_bytes': 1_000 if api_type == 'REST' else 400,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def run_compare(baseline, candidate, **kwargs):
+    return compare_result_sets(baseline, candidate, TOLERANCES, resamples=500, **kwargs)
+
+
+def test_identical_runs_have_no_regression():
+    run = make_run()
+    checks = run_compare(run, run)
+    assert set(checks['status']) == {'ok'}
+    assert checks['paired'].all()
+    # 2 tipos x 2 métricas x 3 estatísticas
+    assert len(checks) == 12
+
+
+def test_slower_candidate_is_a_regression():
+    checks = run_compare(make_run(seed=0), make_run(time_scale=1.3, seed=1))
+    time_checks = checks[checks['metric'] == 'time_ms']
+    assert (time_checks['status'] == 'regression').all()
+    assert (checks.loc[checks['metric'] == 'size_bytes', 'status'] == 'ok').all()
+
+
+def test_faster_candidate_is_an_improvement():
+    checks = run_compare(make_run(seed=0), make_run(time_scale=0.7, seed=1))
+    assert (checks.loc[checks['metric'] == 'time_ms', 'status'] == 'improvement').all()
+
+
+def test_change_within_tolerance_is_ok():
+    checks = run_compare(make_run(seed=0), make_run(time_scale=1.02, seed=1))
+    assert 'regression' not in set(checks['status'])
+
+
+def test_missing_group_in_candidate_is_insufficient():
+    checks = run_compare(make_run(), make_run(types=('REST',)))
+    graphql = checks[checks['type'] == 'GraphQL']
+    assert (graphql['status'] == 'insufficient').all()
+    assert (graphql['n_candidate'] == 0).all()
+
+
+def test_candidate_only_group_is_insufficient():
+    checks = run_compare(make_run(types=('REST',)), make_run())
+    graphql = checks[checks['type'] == 'GraphQL']
+    assert len(graphql) == 2
+    assert (graphql['status'] == 'insufficient').all()
+    assert (graphql['n_baseline'] == 0).all()
+
+
+def test_undersized_group_is_insufficient():
+    candidate = make_run()
+    candidate = candidate[(candidate['type'] == 'REST') | (candidate['id'] <= 2)]
+    checks = run_compare(make_run(), candidate)
+    assert (checks.loc[checks['type'] == 'GraphQL', 'status'] == 'insufficient').all()
+
+
+def test_groups_split_by_operation_when_both_runs_have_it():
+    run = make_run()
+    run['operation'] = np.where(run['id'] % 2 == 0, 'character', 'episode')
+    checks = run_compare(run, run)
+    assert 'operation' in checks
+    assert set(checks['operation']) == {'character', 'episode'}
+
+
+def run_cli(monkeypatch, tmp_path, baseline, candidate, *flags):
+    baseline_path, candidate_path = tmp_path / 'baseline.csv', tmp_path / 'candidate.csv'
+    verdict_path = tmp_path / 'verdict.json'
+    baseline.to_csv(baseline_path, index=False)
+    candidate.to_csv(candidate_path, index=False)
+    monkeypatch.setattr(sys, 'argv', [
+        'compare.py', str(baseline_path), str(candidate_path),
+        '--resamples', '200', '--json', str(verdict_path), *flags,
+    ])
+    with pytest.raises(SystemExit) as exit_info:
+        compare.main()
+    return exit_info.value.code, json.loads(verdict_path.read_text(encoding='utf-8'))
+
+
+def test_cli_passes_identical_runs(monkeypatch, tmp_path):
+    code, verdict = run_cli(monkeypatch, tmp_path, make_run(), make_run())
+    assert code == compare.EXIT_PASS
+    assert verdict['verdict'] == 'pass'
+
+
+def test_cli_fails_on_regression(monkeypatch, tmp_path):
+    code, verdict = run_cli(monkeypatch, tmp_path, make_run(), make_run(time_scale=1.3, seed=1))
+    assert code == compare.EXIT_REGRESSION
+    assert verdict['regressions'] > 0
+
+
+def test_cli_fails_on_insufficient_groups_unless_allowed(monkeypatch, tmp_path):
+    baseline, candidate = make_run(), make_run(types=('REST',))
+    code, verdict = run_cli(monkeypatch, tmp_path, baseline, candidate)
+    assert code == compare.EXIT_ERROR
+    assert verdict['verdict'] == 'fail' and verdict['insufficient'] == 2
+
+    code, verdict = run_cli(monkeypatch, tmp_path, baseline, candidate, '--allow-insufficient')
+    assert code == compare.EXIT_PASS
+    assert verdict['verdict'] == 'pass'
@@ -0,0 +1,134 @@
+"""Testes da coleta distribuída com agentes neste host (distributed.py)."""
+
+import argparse
+import socket
+import threading
+
+import pandas as pd
+import pytest
+
+import distributed
+from distributed import expect, recv_message, run_coordinator, send_message
+from local_server import build_server
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    server = build_server(port=0, db_latency_ms=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def coordinator_args(tmp_path, **overrides):
+    options = {
+        'host': '127.0.0.1', 'port': 0, 'agents': 1, 'local_agents': 0,
+        'start': 1, 'end': 12, 'base_url': None, 'skip_warmup': True,
+        'accept_timeout': 30.0, 'batch_timeout': 30.0, 'out': str(tmp_path / 'merged.csv'),
+    }
+    options.update(overrides)
+    return argparse.Namespace(**options)
+
+
+def test_local_agents_split_ids_and_merge_timeline(tmp_path, base_url):
+    args = coordinator_args(tmp_path, local_agents=3, base_url=base_url)
+    assert run_coordinator(args)
+
+    merged = pd.read_csv(args.out)
+    agents = pd.read_csv(tmp_path / 'merged.agents.csv', keep_default_na=False)
+
+    # Cada ID medido uma vez por tipo de API, por um único agente
+    assert len(merged) == 24
+    assert sorted(merged.groupby('type')['id'].apply(sorted).tolist()) == [list(range(1, 13))] * 2
+    assert merged.groupby('id')['agent'].nunique().eq(1).all()
+    assert merged['started_at'].is_monotonic_increasing
+
+    # IDs intercalados na ordem em que os agentes se conectaram
+    split = {agent: sorted(ids) for agent, ids in merged.groupby('agent')['id'].unique().items()}
+    assert sorted(split) == ['local-1', 'local-2', 'local-3']
+    assert sorted(split.values()) == [list(range(1, 13))[i::3] for i in range(3)]
+
+    # Relógios do mesmo host: deslocamento desprezível e estimado com erro limitado
+    assert (agents['error'] == '').all()
+    assert agents['records'].tolist() == [8, 8, 8]
+    assert agents['offset_ms'].abs().max() < 50
+    assert agents['offset_error_ms'].between(0, 50).all()
+
+
+def test_missing_agents_fail_cleanly(tmp_path, capsys):
+    args = coordinator_args(tmp_path, agents=2, accept_timeout=0.2)
+    assert not run_coordinator(args)
+    assert "0 de 2 agente(s) conectado(s)" in capsys.readouterr().out
+
+
+def fake_agent(port, name, on_start):
+    """Agente mínimo que segue o protocolo até 'start' e então executa `on_start(sock)`."""
+    sock = socket.create_connection(('127.0.0.1', port))
+    send_message(sock, {'kind': 'hello', 'name': name, 'host': 'teste', 'pid': 0})
+    while True:
+        message = recv_message(sock)
+        if message['kind'] == 'ping':
+            send_message(sock, {'kind': 'pong', 'time': distributed.time.time()})
+        elif message['kind'] == 'schedule':
+            send_message(sock, {'kind': 'ready'})
+        elif message['kind'] == 'start':
+            on_start(sock, message)
+            return
+
+
+def run_with_fake_agent(tmp_path, monkeypatch, on_start, **overrides):
+    args = coordinator_args(tmp_path, **overrides)
+    listener = socket.create_server(('127.0.0.1', 0))
+    args.port = listener.getsockname()[1]
+    listener.close()
+    monkeypatch.setattr(distributed, 'START_LEAD_S', 0.05)
+    agent = threading.Thread(target=fake_agent, args=(args.port, 'falso', on_start), daemon=True)
+
+    # O agente só pode conectar depois que o coordenador estiver escutando
+    create_server = socket.create_server
+
+    def listen_then_start_agent(*a, **kw):
+        server = create_server(*a, **kw)
+        agent.start()
+        return server
+
+    monkeypatch.setattr(distributed.socket, 'create_server', listen_then_start_agent)
+    assert run_coordinator(args)
+    agent.join(timeout=10)
+    return pd.read_csv(args.out), pd.read_csv(tmp_path / 'merged.agents.csv', keep_default_na=False)
+
+
+def record(i):
+    return {'type': 'REST', 'id': i, 'time_ms': 10.0, 'size_bytes': 100, 'started_at': 1000.0 + i}
+
+
+def test_agent_exiting_after_done_keeps_collected_data(tmp_path, monkeypatch):
+    def send_and_exit(sock, message):
+        send_message(sock, {'kind': 'done', 'records': [record(1), record(2)], 'metrics': None})
+        sock.close()
+
+    merged, agents = run_with_fake_agent(tmp_path, monkeypatch, send_and_exit)
+    assert merged['id'].tolist() == [1, 2]
+    assert agents.loc[0, 'error'].startswith("falha ao encerrar")
+
+
+def test_hung_agent_is_abandoned_after_batch_timeout(tmp_path, monkeypatch):
+    def send_then_hang(sock, message):
+        send_message(sock, {'kind': 'batch', 'records': [record(1)], 'metrics': None})
+        # Conexão aberta e sem lotes até o coordenador desistir e fechá-la
+        sock.recv(1)
+        sock.close()
+
+    merged, agents = run_with_fake_agent(tmp_path, monkeypatch, send_then_hang, batch_timeout=0.5)
+    assert merged['id'].tolist() == [1]
+    assert agents.loc[0, 'error'] == "nenhum lote em 0.5 s"
+
+
+def test_expect_rejects_unexpected_message():
+    left, right = socket.socketpair()
+    with left, right:
+        send_message(left, {'kind': 'pong'})
+        with pytest.raises(ConnectionError, match="'hello' esperada"):
+            expect(right, 'hello')
@@ -0,0 +1,91 @@
+"""Testes do coletor (experimet.py)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import experimet
+from online_stats import CsvTail
+from result_buffer import ResultBuffer
+
+
+def make_record(i, **fields):
+    return {
+        'id': i, 'type': 'REST', 'time_ms': 10.5, 'size_bytes': 100, 'server_ms': float('nan'),
+        'scenario': 'default', 'operation': 'rest', 'pair': 'default', 'round': 1, 'position': 1,
+        'started_at': 1000.0 + i, **fields,
+    }
+
+
+def test_stream_quotes_free_form_names(tmp_path):
+    path = tmp_path / 'live.csv'
+    results = ResultBuffer(experimet.RESULT_SCHEMA)
+    records = [make_record(1, scenario='leitura, "pesada"', operation='lista,graphql'), make_record(2)]
+    stream = experimet.open_result_stream(str(path))
+    try:
+        for record in records:
+            experimet.record_result(results, record, stream)
+    finally:
+        stream.close()
+
+    tailed, _ = CsvTail(str(path)).read_new()
+    assert [list(row) for row in tailed] == [experimet.RESULT_COLUMNS] * 2
+    assert tailed[0]['scenario'] == 'leitura, "pesada"'
+    assert tailed[0]['operation'] == 'lista,graphql'
+    assert tailed[0]['time_ms'] == 10.5 and tailed[1]['id'] == 2
+
+    df = pd.read_csv(path)
+    assert df['scenario'].tolist() == ['leitura, "pesada"', 'default']
+    assert len(results) == 2
+
+
+@pytest.fixture
+def fake_pairs(monkeypatch):
+    """Substitui a medição por pares sintéticos: REST ~ N(100, 5), GraphQL ~ N(80, 5) ms."""
+    rng = np.random.default_rng(3)
+    measured, failing = [], set()
+
+    def measure_pair(character_id, results, stream=None, field_bytes=None, operations=()):
+        measured.append(character_id)
+        if character_id in failing:
+            return make_record(character_id), None
+        rest = make_record(character_id, time_ms=100 + rng.normal(0, 5), size_bytes=900)
+        graphql = make_record(character_id, type='GraphQL', time_ms=80 + rng.normal(0, 5), size_bytes=400)
+        return rest, graphql
+
+    monkeypatch.setattr(experimet, 'measure_pair', measure_pair)
+    monkeypatch.setattr(experimet, 'report', lambda *args, **kwargs: None)
+    return measured, failing
+
+
+def test_adaptive_stops_once_target_halfwidth_is_reached(fake_pairs):
+    measured, _ = fake_pairs
+    _, summary = experimet.run_adaptive_experiment(1, 500, 10, target_time_ms=5.0, target_size_bytes=1.0)
+    assert summary['stop_reason'] == 'precision'
+    assert summary['halfwidth_time_ms'] <= 5.0
+    assert summary['pairs'] == len(measured) == summary['last_id'] < 500
+    assert summary['pairs'] % 10 == 0
+    assert summary['diff_time_ms'] == pytest.approx(20.0, abs=summary['halfwidth_time_ms'])
+    assert summary['diff_size_bytes'] == 500
+
+
+def test_adaptive_needs_minimum_pairs_before_stopping(fake_pairs):
+    _, summary = experimet.run_adaptive_experiment(1, 500, 1, target_time_ms=1e6, target_size_bytes=1e6)
+    assert summary['stop_reason'] == 'precision'
+    assert summary['pairs'] == experimet.CS_MIN_PAIRS
+
+
+def test_adaptive_stops_at_budget(fake_pairs):
+    measured, _ = fake_pairs
+    _, summary = experimet.run_adaptive_experiment(5, 34, 8, target_time_ms=0.01, target_size_bytes=1.0)
+    assert summary['stop_reason'] == 'budget'
+    assert summary['last_id'] == 34
+    assert measured == list(range(5, 35))
+    assert summary['pairs'] == 30
+
+
+def test_adaptive_ignores_incomplete_pairs(fake_pairs):
+    _, failing = fake_pairs
+    failing.update({2, 3, 5})
+    _, summary = experimet.run_adaptive_experiment(1, 20, 10, target_time_ms=0.01, target_size_bytes=1.0)
+    assert summary['pairs'] == 17
@@ -0,0 +1,80 @@
+"""Testes da atribuição de bytes por campo (field_bytes.py)."""
+
+import json
+
+import pytest
+
+from field_bytes import ITEM, STRUCTURE_FIELD, FieldByteTable, field_byte_sizes, field_name
+from local_server import Store, rest_character
+
+
+def test_fields_are_charged_with_key_value_and_comma():
+    sizes = field_byte_sizes(b'{"id":1,"name":"Rick","episode":[1,22]}')
+    assert sizes[('id',)] == len('"id":1,')
+    assert sizes[('name',)] == len('"name":"Rick",')
+    assert sizes[('episode',)] == len('"episode":[1,22]')
+    assert sizes[('episode', ITEM)] == len('1,22')
+
+
+def test_nested_paths_are_tuples():
+    sizes = field_byte_sizes(b'{"origin":{"name":"Earth","url":""},"list":[{"x":1},{"x":2}]}')
+    assert sizes[('origin', 'name')] == len('"name":"Earth",')
+    assert sizes[('origin', 'url')] == len('"url":""')
+    assert sizes[('list', ITEM, 'x')] == 2 * len('"x":1')
+
+
+def test_keys_with_dots_are_not_mistaken_for_nesting():
+    body = b'{"a.b":1,"a":{"b":22}}'
+    sizes = field_byte_sizes(body)
+    assert sizes[('a.b',)] == len('"a.b":1,')
+    assert sizes[('a', 'b')] == len('"b":22')
+
+    table = FieldByteTable()
+    table.add(body)
+    frame = table.to_frame().set_index('field')
+    assert frame.loc['["a.b"]', 'depth'] == 0
+    assert frame.loc['a', 'depth'] == 0
+    assert frame.loc['a.b', 'depth'] == 1
+    assert frame.loc[STRUCTURE_FIELD, 'bytes_total'] == 2
+    top = frame[frame['depth'] == 0]
+    assert top['bytes_total'].sum() == len(body)
+
+
+def test_field_name_formats_paths():
+    assert field_name(('origin', 'url')) == 'origin.url'
+    assert field_name(('episode', ITEM)) == 'episode[]'
+    assert field_name((ITEM, 'id')) == '[].id'
+    assert field_name(('meta', 'v1.2')) == 'meta["v1.2"]'
+
+
+def test_whitespace_and_non_ascii_bytes():
+    body = '{\n  "name": "Ação",\n  "id": 7\n}'.encode('utf-8')
+    sizes = field_byte_sizes(body)
+    assert sizes[('name',)] == len('"name": "Ação",\n  '.encode('utf-8'))
+    assert sizes[('id',)] == len('"id": 7\n')
+    assert sum(sizes.values()) == len(body) - len(b'{\n  ') - len(b'}')
+
+
+def test_invalid_bodies_are_counted_as_failures():
+    with pytest.raises(ValueError):
+        field_byte_sizes(b'{"id":1')
+    table = FieldByteTable()
+    table.add(b'<html>')
+    table.add(b'{"id":1}')
+    assert (table.failures, table.responses) == (1, 1)
+
+
+def test_top_level_fields_and_structure_sum_to_body_bytes():
+    store = Store(db_latency_ms=0)
+    table = FieldByteTable()
+    for character_id in range(1, 21):
+        body = json.dumps(rest_character(store.tables['Character'][character_id], 'http://localhost'))
+        table.add(body.encode('utf-8'))
+
+    frame = table.to_frame()
+    top = frame[frame['depth'] == 0]
+    assert top['bytes_total'].sum() == table.body_bytes
+    assert top['share_pct'].sum() == pytest.approx(100.0)
+    assert frame['depth'].is_monotonic_increasing
+    assert {'episode', 'origin', 'origin.name', 'episode[]'} <= set(frame['field'])
+    assert frame.loc[frame['field'] == 'episode[]', 'depth'].item() == 1
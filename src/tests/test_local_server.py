@@ -0,0 +1,127 @@
+"""Testes do analisador e dos executores GraphQL do servidor local (local_server.py)."""
+
+import pytest
+
+from local_server import (GraphQLError, QueryCache, Store, execute_batched, execute_graphql,
+                          execute_naive, parse_and_validate)
+
+CHARACTER_QUERY = """
+query Character($id: ID!) {
+  character(id: $id) {
+    id
+    name
+    home: origin { name }
+    episode { id episode }
+  }
+}
+"""
+
+NESTED_QUERY = """
+{
+  characters(ids: [1, 2, 3]) {
+    id
+    episode { id characters { id } }
+  }
+}
+"""
+
+
+@pytest.fixture(scope='module')
+def store():
+    return Store(db_latency_ms=0)
+
+
+def test_parser_handles_aliases_variables_and_lists():
+    selections = parse_and_validate(CHARACTER_QUERY)
+    (character,) = selections
+    assert character.name == 'character'
+    assert character.args == {'id': ('$', 'id')}
+    assert [s.alias for s in character.selections] == ['id', 'name', 'home', 'episode']
+    assert character.selections[2].name == 'origin'
+
+    (characters,) = parse_and_validate('{ characters(ids: [1, 2]) { id } }')
+    assert characters.args == {'ids': [1, 2]}
+
+
+def test_parser_ignores_comments_and_commas():
+    (selection,) = parse_and_validate('{\n  # comentário\n  character(id: 1) { id, name }\n}')
+    assert [s.name for s in selection.selections] == ['id', 'name']
+
+
+@pytest.mark.parametrize('query, message', [
+    ('{ character(id: 1) { nope } }', "não existe"),
+    ('{ character { id } }', "Argumento obrigatório"),
+    ('{ character(id: 1) }', "exige seleção"),
+    ('{ character(id: 1) { name { id } } }', "não aceita seleção"),
+    ('{ character(id: 1) { ...F } }', "Fragmentos"),
+    ('mutation { character(id: 1) { id } }', "mutation"),
+    ('{ character(id: 1) { id } } { location(id: 1) { id } }', "Apenas uma operação"),
+    ('{ character(id: 1) { id }', "Esperado"),
+    ('{ character(id: 1) { id } } %', "Caractere inesperado"),
+])
+def test_parser_rejects_invalid_documents(query, message):
+    with pytest.raises(GraphQLError, match=message):
+        parse_and_validate(query)
+
+
+def test_subscription_requires_its_own_endpoint():
+    query = 'subscription { characterUpdated(id: 1) { id status } }'
+    assert parse_and_validate(query, 'subscription')[0].name == 'characterUpdated'
+    with pytest.raises(GraphQLError, match="não suportada"):
+        parse_and_validate(query)
+
+
+def test_naive_and_batched_executors_agree(store):
+    for query, variables in ((CHARACTER_QUERY, {'id': 7}), (NESTED_QUERY, {})):
+        document = parse_and_validate(query)
+        assert execute_naive(document, variables, store) == execute_batched(document, variables, store)
+
+
+def test_executor_resolves_references(store):
+    data = execute_batched(parse_and_validate(CHARACTER_QUERY), {'id': 7}, store)
+    character = store.tables['Character'][7]
+    assert data['character']['name'] == character['name']
+    assert data['character']['home'] == {'name': store.tables['Location'][character['origin_id']]['name']}
+    assert [e['id'] for e in data['character']['episode']] == character['episode_ids']
+
+
+def test_missing_entity_resolves_to_null(store):
+    data = execute_naive(parse_and_validate('{ character(id: 99999) { id } }'), {}, store)
+    assert data == {'character': None}
+
+
+def test_batched_execution_uses_one_store_call_per_level(store):
+    bodies = {
+        strategy: execute_graphql({'query': NESTED_QUERY}, store, strategy, QueryCache())
+        for strategy in ('naive', 'dataloader')
+    }
+    assert bodies['naive']['data'] == bodies['dataloader']['data']
+    # characters, episode, characters: três níveis de referências
+    assert bodies['dataloader']['extensions']['timing']['store_calls'] == 3
+    assert bodies['naive']['extensions']['timing']['store_calls'] > 3
+
+
+def test_execute_graphql_reports_errors_and_cache_hits(store):
+    cache = QueryCache()
+    payload = {'query': CHARACTER_QUERY, 'variables': {'id': 1}}
+    first = execute_graphql(payload, store, 'cached', cache)
+    second = execute_graphql(payload, store, 'cached', cache)
+    assert not first['extensions']['timing']['cache_hit']
+    assert second['extensions']['timing']['cache_hit']
+    assert first['data'] == second['data']
+
+    body = execute_graphql({'query': CHARACTER_QUERY}, store, 'naive', cache)
+    assert body['data'] is None
+    assert body['errors'][0]['message'] == "Variável $id não informada"
+
+    body = execute_graphql({'query': '{ character(id: "x") { id } }'}, store, 'naive', cache)
+    assert "ID inválido" in body['errors'][0]['message']
+
+
+def test_query_cache_evicts_least_recently_used():
+    cache = QueryCache(maxsize=2)
+    queries = [f'{{ character(id: {i}) {{ id }} }}' for i in range(3)]
+    for query in queries:
+        cache.get_or_parse(query)
+    assert cache.get_or_parse(queries[2])[1]
+    assert not cache.get_or_parse(queries[0])[1]
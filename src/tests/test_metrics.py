@@ -0,0 +1,157 @@
+"""Testes da exposição OpenMetrics do coletor (metrics.py)."""
+
+import math
+import re
+import urllib.error
+import urllib.request
+
+import pytest
+
+from metrics import CONTENT_TYPE, LATENCY_BUCKETS, CollectorMetrics, bucket_quantile, start_metrics_server
+
+SAMPLE_LINE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse(text):
+    """Famílias (TYPE/HELP, na ordem) e amostras (nome, rótulos, valor) de uma exposição."""
+    assert text.endswith('# EOF\n')
+    families, samples = {}, []
+    for line in text.splitlines()[:-1]:
+        if line.startswith('# TYPE '):
+            name, kind = line[len('# TYPE '):].split(' ', 1)
+            assert name not in families, f"família repetida: {name}"
+            families[name] = {'type': kind}
+        elif line.startswith('# HELP '):
+            name, help_text = line[len('# HELP '):].split(' ', 1)
+            assert list(families)[-1] == name, "HELP fora da sua família"
+            families[name]['help'] = help_text
+        else:
+            match = SAMPLE_LINE.match(line)
+            assert match, f"linha inválida: {line!r}"
+            name, labels, value = match.groups()
+            samples.append((name, dict(LABEL.findall(labels or '')), float(value)))
+    return families, samples
+
+
+def family_of(sample_name, families):
+    for suffix in ('_total', '_bucket', '_count', '_sum', ''):
+        if sample_name.endswith(suffix) and sample_name[:len(sample_name) - len(suffix)] in families:
+            return sample_name[:len(sample_name) - len(suffix)]
+    return None
+
+
+def histogram_series(text):
+    _, samples = parse(text)
+    return {(name, tuple(sorted(labels.items()))): value for name, labels, value in samples
+            if name.endswith(('_bucket', '_count'))}
+
+
+def observe(metrics, api_type, scenario, time_ms, size_bytes=100, success=True):
+    metrics.begin(api_type)
+    metrics.observe(api_type, scenario, time_ms, size_bytes, success)
+
+
+@pytest.fixture
+def metrics():
+    metrics = CollectorMetrics(rate_limit_delay=0.25)
+    for time_ms in (0.5, 3.0, 3.0, 40.0, 20_000.0):
+        observe(metrics, 'REST', 'default', time_ms)
+    observe(metrics, 'GraphQL', 'default', 7.0, size_bytes=50)
+    observe(metrics, 'GraphQL', 'default', None, None, success=False)
+    metrics.begin('REST')
+    return metrics
+
+
+def test_every_sample_belongs_to_a_declared_family(metrics):
+    families, samples = parse(metrics.render())
+    assert all(family.keys() == {'type', 'help'} for family in families.values())
+    assert families['collector_request_duration_seconds']['type'] == 'histogram'
+    assert families['collector_requests']['type'] == 'counter'
+    assert families['collector_in_flight_requests']['type'] == 'gauge'
+    for name, _, _ in samples:
+        family = family_of(name, families)
+        assert family, f"amostra sem família: {name}"
+        if families[family]['type'] == 'counter':
+            assert name.endswith('_total')
+
+
+def test_histogram_buckets_are_cumulative(metrics):
+    _, samples = parse(metrics.render())
+    rest = {'type': 'REST', 'scenario': 'default'}
+    buckets = [(labels['le'], value) for name, labels, value in samples
+               if name == 'collector_request_duration_seconds_bucket'
+               and all(labels[k] == v for k, v in rest.items())]
+    assert [le for le, _ in buckets] == [repr(bound) for bound in LATENCY_BUCKETS] + ['+Inf']
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)
+    assert dict(buckets)['0.001'] == 1
+    assert dict(buckets)['0.005'] == 3
+    assert dict(buckets)['0.05'] == 4
+    assert dict(buckets)['10.0'] == 4
+    assert dict(buckets)['+Inf'] == 5
+
+    series = {name: value for name, labels, value in samples if labels == rest}
+    assert series['collector_request_duration_seconds_count'] == 5
+    assert series['collector_request_duration_seconds_sum'] == pytest.approx((0.5 + 3 + 3 + 40 + 20_000) / 1000)
+    assert series['collector_response_bytes_total'] == 500
+
+
+def test_errors_and_gauges_are_exposed(metrics):
+    _, samples = parse(metrics.render())
+    values = {(name, tuple(sorted(labels.items()))): value for name, labels, value in samples}
+    graphql = (('scenario', 'default'), ('type', 'GraphQL'))
+    assert values[('collector_errors_total', graphql)] == 1
+    assert values[('collector_requests_total', (('outcome', 'error'),) + graphql)] == 1
+    assert values[('collector_requests_total', (('outcome', 'success'),) + graphql)] == 1
+    assert values[('collector_request_duration_seconds_count', graphql)] == 1
+    assert values[('collector_in_flight_requests', (('type', 'REST'),))] == 1
+    assert values[('collector_in_flight_requests', (('type', 'GraphQL'),))] == 0
+    assert values[('collector_rate_limiter_delay_seconds', ())] == 0.25
+
+
+def test_label_values_are_escaped():
+    metrics = CollectorMetrics()
+    observe(metrics, 'REST', 'leitura "pesada"\\lenta', 1.0)
+    text = metrics.render()
+    assert r'scenario="leitura \"pesada\"\\lenta"' in text
+    _, samples = parse(text)
+    assert any(labels.get('scenario') == r'leitura \"pesada\"\\lenta' for _, labels, _ in samples)
+
+
+def test_empty_metrics_still_render_a_valid_exposition():
+    families, samples = parse(CollectorMetrics().render())
+    assert 'collector_request_duration_seconds' in families
+    assert not any(name.startswith('collector_request_duration_seconds') for name, _, _ in samples)
+
+
+def test_merged_snapshot_renders_like_the_sum(metrics):
+    merged = CollectorMetrics(rate_limit_delay=0.25)
+    merged.merge(metrics.snapshot())
+    merged.merge(metrics.snapshot())
+    single = histogram_series(metrics.render())
+    double = histogram_series(merged.render())
+    assert double == {key: 2 * value for key, value in single.items()}
+
+
+def test_bucket_quantile_interpolates_within_the_bucket():
+    counts = [0] * (len(LATENCY_BUCKETS) + 1)
+    counts[LATENCY_BUCKETS.index(0.01)] = 10
+    assert bucket_quantile(counts, 0.5) == pytest.approx(0.0075)
+    assert math.isnan(bucket_quantile([0] * len(counts), 0.5))
+
+
+def test_server_exposes_metrics_endpoint(metrics):
+    server = start_metrics_server(metrics, port=0)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base}/metrics") as response:
+            assert response.headers['Content-Type'] == CONTENT_TYPE
+            families, _ = parse(response.read().decode('utf-8'))
+        assert 'process_cpu_seconds' in families
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{base}/outra")
+        assert error.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
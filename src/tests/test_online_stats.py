@@ -0,0 +1,165 @@
+"""Testes dos acumuladores online (Welford, P²) e da leitura incremental do CSV."""
+
+import math
+
+import numpy as np
+import pytest
+
+from online_stats import CsvTail, P2Quantile, RunningStats, StreamSummary, confidence_sequence_halfwidth
+
+
+@pytest.fixture
+def samples():
+    return np.random.default_rng(42).lognormal(mean=5.0, sigma=0.4, size=5_000)
+
+
+def test_running_stats_matches_numpy(samples):
+    stats = RunningStats()
+    for x in samples:
+        stats.add(x)
+    assert stats.count == len(samples)
+    assert stats.mean == pytest.approx(samples.mean(), rel=1e-12)
+    assert stats.variance == pytest.approx(samples.var(ddof=1), rel=1e-9)
+    assert stats.min == samples.min() and stats.max == samples.max()
+
+
+def test_running_stats_is_stable_with_large_offset():
+    # A fórmula ingênua (soma dos quadrados) perde toda a precisão aqui
+    stats = RunningStats()
+    for x in (1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16):
+        stats.add(x)
+    assert stats.variance == pytest.approx(30.0)
+
+
+def test_running_stats_merge_equals_single_pass(samples):
+    left, right, whole = RunningStats(), RunningStats(), RunningStats()
+    for x in samples[:1_234]:
+        left.add(x)
+    for x in samples[1_234:]:
+        right.add(x)
+    for x in samples:
+        whole.add(x)
+    left.merge(right)
+    left.merge(RunningStats())
+    assert left.count == whole.count
+    assert left.mean == pytest.approx(whole.mean, rel=1e-12)
+    assert left.variance == pytest.approx(whole.variance, rel=1e-9)
+    assert (left.min, left.max) == (whole.min, whole.max)
+
+
+def test_running_stats_variance_undefined_below_two_samples():
+    stats = RunningStats()
+    assert math.isnan(stats.variance)
+    stats.add(1.0)
+    assert math.isnan(stats.std)
+
+
+def stats_of(values):
+    stats = RunningStats()
+    for x in values:
+        stats.add(x)
+    return stats
+
+
+def test_confidence_sequence_shrinks_with_n_and_grows_with_confidence(samples):
+    widths = [confidence_sequence_halfwidth(stats_of(samples[:n])) for n in (10, 100, 1_000, 5_000)]
+    assert widths == sorted(widths, reverse=True)
+    stats = stats_of(samples[:200])
+    by_alpha = [confidence_sequence_halfwidth(stats, alpha) for alpha in (0.2, 0.05, 0.01, 0.001)]
+    assert by_alpha == sorted(by_alpha)
+
+
+def test_confidence_sequence_degenerate_cases():
+    assert confidence_sequence_halfwidth(stats_of([])) == math.inf
+    assert confidence_sequence_halfwidth(stats_of([3.0])) == math.inf
+    assert confidence_sequence_halfwidth(stats_of([3.0] * 5)) == 0.0
+
+
+def first_miss(values, mu, halfwidth, min_n=10):
+    """Primeiro n (a partir de min_n, olhando a cada observação) em que o intervalo exclui mu."""
+    stats = RunningStats()
+    for x in values:
+        stats.add(x)
+        if stats.count >= min_n and abs(stats.mean - mu) > halfwidth(stats):
+            return stats.count
+    return None
+
+
+def test_confidence_sequence_covers_under_continuous_peeking():
+    rng = np.random.default_rng(7)
+    alpha, sequences, horizon = 0.05, 400, 300
+    data = rng.normal(5.0, 2.0, size=(sequences, horizon))
+
+    def sequence(stats):
+        return confidence_sequence_halfwidth(stats, alpha)
+
+    def fixed_n(stats):
+        # IC de 95% para n fixo, indevidamente consultado a cada observação
+        return 1.96 * stats.std / math.sqrt(stats.count)
+
+    misses = sum(first_miss(row, 5.0, sequence) is not None for row in data) / sequences
+    naive = sum(first_miss(row, 5.0, fixed_n) is not None for row in data) / sequences
+    assert misses <= alpha + 0.02
+    assert naive > 3 * alpha
+
+
+@pytest.mark.parametrize('p', [0.5, 0.95, 0.99])
+def test_p2_quantile_close_to_exact(samples, p):
+    estimator = P2Quantile(p)
+    for x in samples:
+        estimator.add(x)
+    exact = np.quantile(samples, p)
+    assert estimator.value == pytest.approx(exact, rel=0.03)
+
+
+def test_p2_quantile_exact_with_few_samples():
+    estimator = P2Quantile(0.5)
+    assert math.isnan(estimator.value)
+    for x in (3.0, 1.0, 2.0):
+        estimator.add(x)
+    assert estimator.value == 2.0
+
+
+@pytest.mark.parametrize('p', [0.0, 1.0, -0.1])
+def test_p2_quantile_rejects_invalid_p(p):
+    with pytest.raises(ValueError):
+        P2Quantile(p)
+
+
+def test_stream_summary_as_dict(samples):
+    summary = StreamSummary()
+    for x in samples:
+        summary.add(x)
+    result = summary.as_dict()
+    assert set(result) == {'n', 'mean', 'std', 'min', 'max', 'p50', 'p95', 'p99'}
+    assert result['n'] == len(samples)
+    assert result['p50'] <= result['p95'] <= result['p99'] <= result['max']
+
+
+def test_csv_tail_reads_only_complete_new_lines(tmp_path):
+    path = tmp_path / 'results.csv'
+    tail = CsvTail(str(path))
+    assert tail.read_new() == ([], False)
+
+    path.write_bytes(b'type,id,response_time_ms\nREST,1,10.5\nGraphQL,1,')
+    records, reset = tail.read_new()
+    assert not reset
+    assert records == [{'type': 'REST', 'id': 1, 'response_time_ms': 10.5}]
+
+    with open(path, 'ab') as f:
+        f.write(b'12.0\n')
+    records, _ = tail.read_new()
+    assert records == [{'type': 'GraphQL', 'id': 1, 'response_time_ms': 12.0}]
+    assert tail.read_new() == ([], False)
+
+
+def test_csv_tail_restarts_when_file_is_truncated(tmp_path):
+    path = tmp_path / 'results.csv'
+    path.write_bytes(b'type,id\nREST,1\nREST,2\n')
+    tail = CsvTail(str(path))
+    assert len(tail.read_new()[0]) == 2
+
+    path.write_bytes(b'type,id\nREST,9\n')
+    records, reset = tail.read_new()
+    assert reset
+    assert records == [{'type': 'REST', 'id': 9}]
@@ -0,0 +1,53 @@
+"""Testes do profiler por amostragem (profiler.py)."""
+
+import threading
+import time
+
+from profiler import SamplingProfiler
+
+
+def busy_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+def read_folded(path):
+    stacks = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            stack, count = line.rstrip('\n').rsplit(' ', 1)
+            stacks[stack] = int(count)
+    return stacks
+
+
+def test_start_stop_writes_folded_stacks(tmp_path):
+    path = tmp_path / 'stacks.folded'
+    profiler = SamplingProfiler(str(path), interval_ms=2)
+    profiler.start()
+    busy_loop(0.2)
+    samples = profiler.stop()
+
+    assert samples > 0
+    stacks = read_folded(path)
+    main = {stack: count for stack, count in stacks.items() if stack.startswith(threading.main_thread().name + ';')}
+    assert sum(main.values()) == samples
+    assert any('busy_loop (test_profiler.py:' in stack for stack in main)
+    assert not any('sampling-profiler' in stack for stack in stacks)
+    counts = list(stacks.values())
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_stop_twice_or_without_start_keeps_the_count(tmp_path):
+    path = tmp_path / 'stacks.folded'
+    profiler = SamplingProfiler(str(path), interval_ms=1)
+    assert profiler.stop() == 0
+    assert not path.exists()
+
+    profiler.start()
+    busy_loop(0.05)
+    samples = profiler.stop()
+    assert profiler.stop() == samples
+    assert not any(thread.name == 'sampling-profiler' for thread in threading.enumerate())
@@ -0,0 +1,69 @@
+"""Testes do buffer colunar de resultados (result_buffer.py)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from result_buffer import CATEGORY, ResultBuffer
+
+SCHEMA = {'type': CATEGORY, 'id': np.int32, 'time_ms': np.float64, 'size_bytes': np.int64}
+
+
+def make_records(n):
+    return [
+        {'type': 'REST' if i % 2 else 'GraphQL', 'id': i, 'time_ms': i * 0.5, 'size_bytes': 100 + i}
+        for i in range(n)
+    ]
+
+
+def test_round_trip_across_chunks():
+    records = make_records(25)
+    buffer = ResultBuffer(SCHEMA, chunk_size=8)
+    for record in records:
+        buffer.append(record)
+    assert len(buffer) == 25
+
+    frame = buffer.to_frame()
+    expected = pd.DataFrame(records).astype({'type': 'category', 'id': np.int32})
+    pd.testing.assert_frame_equal(frame, expected, check_categorical=False)
+    assert list(frame['type'].cat.categories) == ['GraphQL', 'REST']
+    assert frame['size_bytes'].dtype == np.int64
+
+
+def test_columns_consolidate_once_and_share_memory():
+    buffer = ResultBuffer(SCHEMA, chunk_size=4)
+    for record in make_records(10):
+        buffer.append(record)
+    first = buffer.columns()
+    assert first is buffer.columns()
+    assert np.shares_memory(buffer.to_frame()['time_ms'].to_numpy(), first['time_ms'])
+
+
+def test_append_after_consolidation():
+    buffer = ResultBuffer(SCHEMA, chunk_size=4)
+    records = make_records(6)
+    for record in records[:3]:
+        buffer.append(record)
+    buffer.columns()
+    for record in records[3:]:
+        buffer.append(record)
+    assert buffer.to_frame()['id'].tolist() == list(range(6))
+
+
+def test_empty_buffer_keeps_schema():
+    frame = ResultBuffer(SCHEMA).to_frame()
+    assert list(frame.columns) == list(SCHEMA)
+    assert len(frame) == 0
+    assert frame['time_ms'].dtype == np.float64
+
+
+def test_to_arrow_matches_frame():
+    pa = pytest.importorskip('pyarrow')
+    buffer = ResultBuffer(SCHEMA, chunk_size=8)
+    for record in make_records(20):
+        buffer.append(record)
+    table = buffer.to_arrow()
+    assert table.num_rows == 20
+    assert pa.types.is_dictionary(table.schema.field('type').type)
+    assert table.column('type').to_pylist() == buffer.to_frame()['type'].astype(str).tolist()
+    assert table.column('time_ms').to_pylist() == buffer.to_frame()['time_ms'].tolist()
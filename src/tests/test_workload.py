@@ -0,0 +1,159 @@
+"""Testes da validação de cenários e do sorteio de IDs (workload.py)."""
+
+import os
+import random
+from collections import Counter
+
+import pytest
+
+from workload import (DEFAULT_PAIR, id_sampler, load_workload, operation_orders, paired_steps,
+                      williams_square, workload_from_dict)
+
+SCENARIOS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scenarios')
+
+REST = {'name': 'rest', 'kind': 'rest_single'}
+GRAPHQL = {'name': 'graphql', 'kind': 'graphql', 'query': 'query($id: ID!) { character(id: $id) { id } }'}
+
+
+def paired(*operations, **run):
+    return workload_from_dict({
+        'run': {'mode': 'paired', 'ids': {'distribution': 'sequential', 'min': 1, 'max': 10}, **run},
+        'operation': list(operations),
+    })
+
+
+def test_bundled_scenario_loads():
+    workload = load_workload(os.path.join(SCENARIOS, 'mix_leitura.toml'))
+    assert workload.mode == 'mix'
+    assert workload.operations
+    assert all(operation.pair is None for operation in workload.operations)
+
+
+def test_sequential_paired_scenario_defaults_to_one_pass():
+    assert paired(REST, GRAPHQL).requests == 10
+
+
+def test_paired_scenario_without_requests_needs_sequential_ids():
+    with pytest.raises(ValueError, match="requests"):
+        workload_from_dict({
+            'run': {'mode': 'paired', 'ids': {'distribution': 'uniform', 'min': 1, 'max': 10}},
+            'operation': [REST, GRAPHQL],
+        })
+
+
+def test_single_rest_graphql_couple_is_paired_implicitly():
+    workload = paired(REST, GRAPHQL)
+    assert [operation.pair for operation in workload.operations] == [DEFAULT_PAIR, DEFAULT_PAIR]
+
+
+def test_extra_operations_are_left_unpaired_without_labels():
+    batch = {'name': 'batch', 'kind': 'rest_batch', 'batch_size': 5}
+    workload = paired(REST, batch, GRAPHQL)
+    assert [operation.pair for operation in workload.operations] == [None, None, None]
+
+
+def test_declared_pairs_must_have_one_rest_and_one_graphql():
+    workload = paired({**REST, 'pair': 'detalhe'}, {**GRAPHQL, 'pair': 'detalhe'},
+                      {'name': 'page', 'kind': 'rest_page'})
+    assert [operation.pair for operation in workload.operations] == ['detalhe', 'detalhe', None]
+    with pytest.raises(ValueError, match="pair 'detalhe'"):
+        paired({**REST, 'pair': 'detalhe'}, {**REST, 'name': 'rest2', 'pair': 'detalhe'}, GRAPHQL)
+
+
+def test_mix_mode_rejects_pairs():
+    with pytest.raises(ValueError, match="modo paired"):
+        workload_from_dict({
+            'run': {'mode': 'mix', 'requests': 10},
+            'operation': [{**REST, 'pair': 'p'}, {**GRAPHQL, 'pair': 'p'}],
+        })
+
+
+@pytest.mark.parametrize('spec, message', [
+    ({'name': 'x', 'kind': 'soap'}, "'kind'"),
+    ({'name': 'x', 'kind': 'rest_single', 'weight': -1}, "'weight'"),
+    ({'name': 'x', 'kind': 'rest_single', 'rate': 0}, "'rate'"),
+    ({'name': 'x', 'kind': 'graphql'}, "'query'"),
+    ({'name': 'x', 'kind': 'rest_single', 'ids': {'distribution': 'list'}}, "'values'"),
+    ({'name': 'x', 'kind': 'rest_single', 'ids': {'min': 5, 'max': 1}}, "'min' <= 'max'"),
+])
+def test_invalid_operations_are_rejected(spec, message):
+    with pytest.raises(ValueError, match=message):
+        workload_from_dict({'run': {'mode': 'mix', 'requests': 10}, 'operation': [spec]})
+
+
+def test_sequential_sampler_wraps_around():
+    draw = id_sampler({'distribution': 'sequential', 'min': 3, 'max': 5}, random.Random(0))
+    assert [draw() for _ in range(7)] == [3, 4, 5, 3, 4, 5, 3]
+
+
+def test_zipf_sampler_favours_low_ranks():
+    draw = id_sampler({'distribution': 'zipf', 'min': 1, 'max': 100, 's': 1.2}, random.Random(0))
+    counts = Counter(draw() for _ in range(5_000))
+    assert set(counts) <= set(range(1, 101))
+    assert counts[1] > counts[2] > counts[10]
+
+
+@pytest.mark.parametrize('k', range(2, 8))
+def test_williams_square_is_balanced(k):
+    square = williams_square(k)
+    assert len(square) == (k if k % 2 == 0 else 2 * k)
+    for row in square:
+        assert sorted(row) == list(range(k))
+    # Cada tratamento ocupa cada posição o mesmo número de vezes
+    for position in range(k):
+        assert set(Counter(row[position] for row in square).values()) == {len(square) // k}
+    # Cada par ordenado (a precede b imediatamente) aparece o mesmo número de vezes
+    successions = Counter((row[i], row[i + 1]) for row in square for i in range(k - 1))
+    assert len(successions) == k * (k - 1)
+    assert len(set(successions.values())) == 1
+
+
+def test_operation_orders():
+    workload = paired(REST, GRAPHQL, {'name': 'page', 'kind': 'rest_page'})
+    operations = workload.operations
+    fixed = operation_orders(operations, 'fixed', random.Random(0))
+    assert fixed(0) == fixed(5) == operations
+
+    latin = operation_orders(operations, 'latin', random.Random(0))
+    square = williams_square(len(operations))
+    steps = [latin(step) for step in range(len(square) + 1)]
+    assert steps[-1] == steps[0]
+    assert [[operations.index(op) for op in step] for step in steps[:-1]] == square
+
+    shuffled = operation_orders(operations, 'random', random.Random(0))
+    orders = {tuple(op.name for op in shuffled(step)) for step in range(50)}
+    assert len(orders) > 1
+    assert all(sorted(order) == sorted(op.name for op in operations) for order in orders)
+
+
+def test_paired_steps_cover_every_round():
+    workload = paired(REST, GRAPHQL, rounds=3)
+    steps = list(paired_steps(workload, random.Random(0)))
+    assert [round_number for round_number, _ in steps] == [1] * 10 + [2] * 10 + [3] * 10
+    assert [key for _, key in steps[:10]] == list(range(1, 11))
+
+
+def test_shuffled_ids_are_reproducible_permutations():
+    workload = paired(REST, GRAPHQL, shuffle_ids=True, rounds=2, seed=5)
+    first = list(paired_steps(workload, random.Random(workload.seed)))
+    again = list(paired_steps(workload, random.Random(workload.seed)))
+    assert first == again
+    for round_number in (1, 2):
+        keys = [key for r, key in first if r == round_number]
+        assert sorted(keys) == list(range(1, 11))
+    assert [key for _, key in first[:10]] != list(range(1, 11))
+
+
+@pytest.mark.parametrize('run, message', [
+    ({'order': 'zigzag'}, "order"),
+    ({'rounds': 0}, "rounds"),
+])
+def test_invalid_order_options_are_rejected(run, message):
+    with pytest.raises(ValueError, match=message):
+        paired(REST, GRAPHQL, **run)
+
+
+def test_order_options_are_rejected_in_mix_mode():
+    with pytest.raises(ValueError, match="modo paired"):
+        workload_from_dict({'run': {'mode': 'mix', 'requests': 10, 'order': 'latin'},
+                            'operation': [REST, GRAPHQL]})
@@ -0,0 +1,23 @@
+"""
+Páginas do dashboard REST vs GraphQL.
+
+Cada página vive em um módulo próprio com uma função `render(df, paired)` e só é
+importada quando selecionada na barra lateral, de modo que dependências pesadas
+(Plotly, SciPy) não entram no tempo de inicialização das demais páginas.
+"""
+
+# Título exibido na navegação -> módulo da página
+PAGES = {
+    "Visão Geral": "overview",
+    "Análise de Tempo (RQ1)": "time_analysis",
+    "Análise de Tamanho (RQ2)": "size_analysis",
+    "Análise Detalhada": "detailed",
+    "Matriz de Cenários": "scenario_matrix",
+    "Monitoramento ao Vivo": "live",
+}
+
+# Páginas que leem os arquivos por conta própria e abrem mesmo sem um CSV completo
+STANDALONE_PAGES = {"live"}
+
+# Páginas que dependem de pares REST x GraphQL (indisponíveis para dados do modo mix)
+PAIRED_PAGES = {"time_analysis", "size_analysis", "scenario_matrix"}
@@ -0,0 +1,149 @@
+"""
+Carga de dados e cache compartilhados pelas páginas do dashboard.
+"""
+
+import io
+import os
+
+import pandas as pd
+import streamlit as st
+
+from analysis import (apply_overhead_correction, build_paired_index, filter_data, hampel_flags,
+                      load_results, order_effect_test, outlier_windows, paired_without_outliers)
+from calibration import load_calibration
+from workload import load_run_manifest
+
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'experiment_results.csv')
+FIELD_BYTES_PATH = os.path.join(os.path.dirname(RESULTS_PATH), 'field_bytes.csv')
+OVERHEAD_KEY = 'overhead_corrected'
+
+# Assinatura do CSV com que os caches atuais foram calculados
+_results_signature = None
+
+
+def overhead_corrected():
+    """Se o usuário pediu para descontar o piso do harness (checkbox da sidebar)."""
+    return st.session_state.get(OVERHEAD_KEY, False)
+
+
+def results_signature():
+    """(mtime, tamanho) do CSV de resultados, ou None se ele ainda não existe."""
+    try:
+        stat = os.stat(RESULTS_PATH)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def refresh_if_changed():
+    """
+    Descarta os caches de dados quando o CSV muda em disco (por exemplo, enquanto
+    o coletor grava com --stream). Todos os caches do dashboard derivam do CSV ou
+    dos arquivos gravados ao lado dele, por isso a invalidação é única.
+    """
+    global _results_signature
+    signature = results_signature()
+    if signature != _results_signature:
+        st.cache_data.clear()
+        _results_signature = signature
+
+
+# Carregar dados
+@st.cache_data
+def load_calibration_data():
+    """Calibração do harness gravada junto com os resultados, se existir."""
+    return load_calibration(RESULTS_PATH)
+
+@st.cache_data
+def load_data(overhead_corrected=False):
+    """
+    Carrega os dados do experimento do arquivo CSV.
+    
+    Com `overhead_corrected`, o piso do harness da calibração é descontado do tempo.
+    Uma última linha sem quebra de linha (o coletor ainda a está gravando) é ignorada.
+    """
+    if not os.path.exists(RESULTS_PATH):
+        st.error(f"Arquivo não encontrado: {RESULTS_PATH}")
+        return None
+    with open(RESULTS_PATH, 'rb') as f:
+        content = f.read()
+    complete = content[:content.rfind(b'\n') + 1]
+    df = load_results(io.BytesIO(complete)) if complete.count(b'\n') > 1 else pd.DataFrame()
+    if df.empty:
+        st.error(f"Arquivo ainda sem registros: {RESULTS_PATH}")
+        return None
+    calibration = load_calibration_data()
+    if overhead_corrected and calibration is not None:
+        df = apply_overhead_correction(df, calibration)
+    return df
+
+@st.cache_data
+def load_paired_index(overhead_corrected=False):
+    """Índice pareado do dataset carregado, calculado uma única vez."""
+    df = load_data(overhead_corrected)
+    if df is None:
+        return None
+    return build_paired_index(df)
+
+@st.cache_data
+def load_order_effect(overhead_corrected=False):
+    """Teste de efeito de ordem do tempo de resposta, ou None se a ordem não variou."""
+    df = load_data(overhead_corrected)
+    if df is None:
+        return None
+    return order_effect_test(df, 'time_ms')
+
+@st.cache_data
+def load_outliers(window, threshold, overhead_corrected=False):
+    """
+    Registros marcados pelo filtro de Hampel no tempo de resposta, janelas de
+    outliers e índice pareado sem os pares afetados.
+    """
+    df = load_data(overhead_corrected)
+    if df is None:
+        return None
+    flagged = hampel_flags(df, 'time_ms', window, threshold)
+    return flagged, outlier_windows(flagged, 'time_ms'), paired_without_outliers(flagged, 'time_ms')
+
+@st.cache_data(show_spinner=False)
+def outlier_figure(window, threshold, overhead_corrected=False):
+    """Figura da série com os outliers destacados, uma vez por parâmetro do filtro."""
+    from charts import create_outlier_plot
+    
+    flagged = load_outliers(window, threshold, overhead_corrected)[0]
+    return create_outlier_plot(flagged, 'time_ms', 'Tempo de Resposta (ms)')
+
+@st.cache_data
+def load_run_manifest_data():
+    """Manifesto da execução (ordem, rodadas e semente), se existir."""
+    return load_run_manifest(RESULTS_PATH)
+
+@st.cache_data
+def load_field_bytes():
+    """Tabela de bytes por campo do REST (coletor com --field-bytes), se existir."""
+    if not os.path.exists(FIELD_BYTES_PATH):
+        return None
+    return pd.read_csv(FIELD_BYTES_PATH)
+
+def cached_figure(builder_name, metric_col=None, metric_label=None, id_range=None, api_types=None):
+    """
+    Renderiza uma figura uma única vez por estado de filtro.
+    
+    A chave do cache é formada apenas pelos argumentos (nome do gráfico, métrica
+    e filtros) e pela correção de overhead, evitando re-hashear o DataFrame
+    completo a cada rerun.
+    """
+    return _cached_figure(builder_name, metric_col, metric_label, id_range, api_types,
+                          overhead_corrected())
+
+@st.cache_data(show_spinner=False)
+def _cached_figure(builder_name, metric_col, metric_label, id_range, api_types, corrected):
+    from charts import FIGURE_BUILDERS, PAIRED_BUILDERS
+    
+    if builder_name in PAIRED_BUILDERS:
+        data = load_paired_index(corrected)
+    else:
+        data = filter_data(load_data(corrected), id_range, api_types)
+    builder = FIGURE_BUILDERS[builder_name]
+    if metric_col is None:
+        return builder(data)
+    return builder(data, metric_col, metric_label)
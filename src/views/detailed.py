@@ -0,0 +1,101 @@
+"""
+Página: Análise Detalhada
+
+Filtros, estatísticas dos dados filtrados, correlação e exportação.
+"""
+
+import streamlit as st
+
+from analysis import filter_data
+from views.common import cached_figure
+
+def render(df, paired):
+    """Desenha a página de análise detalhada com filtros e exportação."""
+    st.title("🔍 Análise Detalhada")
+    st.markdown("---")
+
+    # Filtros
+    col1, col2 = st.columns(2)
+
+    with col1:
+        min_id = int(df['id'].min())
+        max_id = int(df['id'].max())
+        id_range = st.slider(
+            "Filtrar por ID",
+            min_value=min_id,
+            max_value=max_id,
+            value=(min_id, max_id)
+        )
+
+    with col2:
+        api_filter = st.multiselect(
+            "Filtrar por Tipo de API",
+            options=['REST', 'GraphQL'],
+            default=['REST', 'GraphQL']
+        )
+
+    # Aplicar filtros
+    filtered_df = filter_data(df, id_range, api_filter)
+
+    st.markdown("---")
+
+    # Tabela interativa
+    st.subheader("📋 Dados Filtrados")
+    st.dataframe(
+        filtered_df,
+        use_container_width=True,
+        hide_index=True
+    )
+
+    # Estatísticas dos dados filtrados
+    st.markdown("---")
+    st.subheader("📊 Estatísticas dos Dados Filtrados")
+
+    if len(api_filter) > 0:
+        col1, col2 = st.columns(2)
+
+        for idx, api_type in enumerate(api_filter):
+            with col1 if idx == 0 else col2:
+                st.markdown(f"##### {api_type}")
+                filtered_type = filtered_df[filtered_df['type'] == api_type]
+
+                if len(filtered_type) > 0:
+                    st.write(f"**Tempo de Resposta:**")
+                    st.write(f"- Média: {filtered_type['time_ms'].mean():.2f} ms")
+                    st.write(f"- Mediana: {filtered_type['time_ms'].median():.2f} ms")
+                    st.write(f"- DP: {filtered_type['time_ms'].std():.2f} ms")
+
+                    st.write(f"**Tamanho da Resposta:**")
+                    st.write(f"- Média: {filtered_type['size_bytes'].mean():.0f} bytes")
+                    st.write(f"- Mediana: {filtered_type['size_bytes'].median():.0f} bytes")
+                    st.write(f"- DP: {filtered_type['size_bytes'].std():.0f} bytes")
+
+    # Gráfico de correlação
+    st.markdown("---")
+    st.subheader("🔗 Correlação entre Tempo e Tamanho")
+
+    fig_corr = cached_figure('correlation', id_range=id_range, api_types=tuple(api_filter))
+    st.plotly_chart(fig_corr, use_container_width=True)
+
+    # Calcular correlação
+    if len(filtered_df) > 1:
+        corr_rest = filtered_df[filtered_df['type'] == 'REST'][['time_ms', 'size_bytes']].corr().iloc[0, 1]
+        corr_graphql = filtered_df[filtered_df['type'] == 'GraphQL'][['time_ms', 'size_bytes']].corr().iloc[0, 1]
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Correlação REST", f"{corr_rest:.3f}")
+        with col2:
+            st.metric("Correlação GraphQL", f"{corr_graphql:.3f}")
+
+    # Exportação
+    st.markdown("---")
+    st.subheader("💾 Exportação de Dados")
+
+    csv = filtered_df.to_csv(index=False).encode('utf-8')
+    st.download_button(
+        label="📥 Baixar Dados Filtrados (CSV)",
+        data=csv,
+        file_name=f"filtered_data_{id_range[0]}_{id_range[1]}.csv",
+        mime="text/csv"
+    )
@@ -0,0 +1,165 @@
+"""
+Página: Monitoramento ao Vivo
+
+Acompanha um experimento em andamento lendo incrementalmente o CSV do coletor.
+"""
+
+import math
+import os
+import time
+from collections import deque
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from charts import COLORS, scatter_trace_class
+from online_stats import CsvTail, StreamSummary
+from views.common import RESULTS_PATH
+
+LIVE_HISTORY_POINTS = 2_000   # Últimas medições por tipo mantidas para o gráfico
+LIVE_METRICS = ['time_ms', 'size_bytes']
+
+def new_live_state(path):
+    """Cria o estado do modo ao vivo: tail do arquivo e acumuladores online."""
+    return {
+        'path': path,
+        'tail': CsvTail(path),
+        'summaries': {},
+        'recent': {},
+        'trend': [],
+        'records': 0,
+        'malformed': 0,
+    }
+
+def record_metrics(record):
+    """Métricas numéricas de um registro, ou None se o tipo ou alguma métrica for inválida."""
+    if not record.get('type') or not isinstance(record['type'], str):
+        return None
+    values = {}
+    for metric in LIVE_METRICS:
+        value = record.get(metric)
+        if not isinstance(value, (int, float)) or not math.isfinite(value):
+            return None
+        values[metric] = float(value)
+    return values
+
+def update_live_state(state):
+    """
+    Consome apenas os registros novos do arquivo e atualiza os acumuladores.
+    Registros com campos vazios ou não numéricos são contados e ignorados.
+    """
+    records, reset = state['tail'].read_new()
+    if reset:
+        state.update(new_live_state(state['path']), tail=state['tail'])
+    
+    for record in records:
+        values = record_metrics(record)
+        if values is None:
+            state['malformed'] += 1
+            continue
+        api_type = record['type']
+        if api_type not in state['summaries']:
+            state['summaries'][api_type] = {metric: StreamSummary() for metric in LIVE_METRICS}
+            state['recent'][api_type] = deque(maxlen=LIVE_HISTORY_POINTS)
+        for metric, value in values.items():
+            state['summaries'][api_type][metric].add(value)
+        state['records'] += 1
+        state['recent'][api_type].append((state['records'], record.get('id'), values['time_ms']))
+    
+    if records:
+        state['trend'].append({
+            'records': state['records'],
+            **{api_type: summary['time_ms'].stats.mean
+               for api_type, summary in state['summaries'].items()}
+        })
+    return len(records)
+
+def render_live_view(state):
+    """Desenha métricas e gráficos a partir dos acumuladores, sem reler o arquivo."""
+    new_records = update_live_state(state)
+    malformed = f" · {state['malformed']} malformados ignorados" if state['malformed'] else ""
+    st.caption(f"{state['records']} registros lidos ({new_records} novos){malformed} · "
+               f"offset {state['tail'].offset} bytes · atualizado às {time.strftime('%H:%M:%S')}")
+    
+    if not state['summaries']:
+        st.info("Aguardando registros no arquivo...")
+        return
+    
+    rows = []
+    for api_type, summaries in state['summaries'].items():
+        for metric, summary in summaries.items():
+            rows.append({'Tipo': api_type, 'Métrica': metric, **summary.as_dict()})
+    
+    cols = st.columns(len(state['summaries']))
+    for col, (api_type, summaries) in zip(cols, state['summaries'].items()):
+        stats_time = summaries['time_ms'].as_dict()
+        col.metric(f"Tempo Médio {api_type}", f"{stats_time['mean']:.2f} ms",
+                   delta=f"p99: {stats_time['p99']:.2f} ms", delta_color='off')
+    
+    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_recent = go.Figure()
+        for api_type, recent in state['recent'].items():
+            seq, ids, times = zip(*recent)
+            fig_recent.add_trace(scatter_trace_class(len(seq))(
+                x=seq, y=times, mode='lines', name=api_type,
+                line=dict(color=COLORS.get(api_type)), text=ids,
+                hovertemplate='ID: %{text}<br>%{y:.2f} ms<extra></extra>'
+            ))
+        fig_recent.update_layout(title='Últimas Medições de Tempo', xaxis_title='Registro',
+                                 yaxis_title='Tempo de Resposta (ms)', height=400,
+                                 template='plotly_white')
+        st.plotly_chart(fig_recent, use_container_width=True)
+    
+    with col2:
+        trend = pd.DataFrame(state['trend'])
+        fig_trend = go.Figure()
+        for api_type in state['summaries']:
+            fig_trend.add_trace(go.Scatter(
+                x=trend['records'], y=trend[api_type], mode='lines',
+                name=api_type, line=dict(color=COLORS.get(api_type))
+            ))
+        fig_trend.update_layout(title='Média Acumulada do Tempo', xaxis_title='Registros lidos',
+                                yaxis_title='Tempo Médio (ms)', height=400,
+                                template='plotly_white')
+        st.plotly_chart(fig_trend, use_container_width=True)
+
+def render(df, paired):
+    """Página que acompanha um experimento em andamento (coletor com --stream)."""
+    st.title("📡 Monitoramento ao Vivo")
+    st.markdown("Acompanha o CSV gravado pelo coletor com `--stream`, lendo apenas os registros novos.")
+    st.markdown("---")
+    
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        path = st.text_input(
+            "Arquivo de resultados",
+            value=RESULTS_PATH
+        )
+    with col2:
+        interval = st.number_input("Intervalo (s)", min_value=0.5, max_value=60.0, value=2.0, step=0.5)
+    with col3:
+        auto_refresh = st.checkbox("Atualização automática", value=True)
+        if st.button("Reiniciar leitura"):
+            st.session_state.pop('live', None)
+    
+    state = st.session_state.get('live')
+    if state is None or state['path'] != path:
+        state = new_live_state(path)
+        st.session_state['live'] = state
+    
+    if not os.path.exists(path):
+        st.warning(f"Arquivo ainda não existe: {path}")
+    
+    fragment = getattr(st, 'fragment', None)
+    if auto_refresh and fragment is not None:
+        # Apenas o fragmento é reexecutado a cada intervalo
+        fragment(run_every=interval)(render_live_view)(state)
+    else:
+        render_live_view(state)
+        if auto_refresh:
+            time.sleep(interval)
+            st.rerun()
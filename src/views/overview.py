@@ -0,0 +1,71 @@
+"""
+Página: Visão Geral
+
+Métricas principais e comparação geral entre REST e GraphQL.
+"""
+
+import streamlit as st
+
+from analysis import summary_table
+from views.common import cached_figure
+
+def render(df, paired):
+    """Desenha a página de visão geral do experimento."""
+    rest_df = df[df['type'] == 'REST']
+    graphql_df = df[df['type'] == 'GraphQL']
+    
+    st.title("📊 Visão Geral do Experimento")
+    st.markdown("---")
+
+    # Cards de métricas principais
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            "Tempo Médio REST",
+            f"{rest_df['time_ms'].mean():.2f} ms",
+            delta=f"vs GraphQL: {rest_df['time_ms'].mean() - graphql_df['time_ms'].mean():.2f} ms"
+        )
+
+    with col2:
+        st.metric(
+            "Tempo Médio GraphQL",
+            f"{graphql_df['time_ms'].mean():.2f} ms",
+            delta=f"vs REST: {graphql_df['time_ms'].mean() - rest_df['time_ms'].mean():.2f} ms"
+        )
+
+    with col3:
+        st.metric(
+            "Tamanho Médio REST",
+            f"{rest_df['size_bytes'].mean():.0f} bytes",
+            delta=f"vs GraphQL: {rest_df['size_bytes'].mean() - graphql_df['size_bytes'].mean():.0f} bytes"
+        )
+
+    with col4:
+        st.metric(
+            "Tamanho Médio GraphQL",
+            f"{graphql_df['size_bytes'].mean():.0f} bytes",
+            delta=f"vs REST: {graphql_df['size_bytes'].mean() - rest_df['size_bytes'].mean():.0f} bytes"
+        )
+
+    st.markdown("---")
+
+    # Gráficos comparativos
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📈 Tempo de Resposta")
+        fig_time = cached_figure('boxplot', 'time_ms', 'Tempo de Resposta (ms)')
+        st.plotly_chart(fig_time, use_container_width=True)
+
+    with col2:
+        st.subheader("📦 Tamanho da Resposta")
+        fig_size = cached_figure('boxplot', 'size_bytes', 'Tamanho da Resposta (bytes)')
+        st.plotly_chart(fig_size, use_container_width=True)
+
+    # Tabela resumo estatístico
+    st.markdown("---")
+    st.subheader("📋 Resumo Estatístico")
+
+    summary_df = summary_table(df)
+    st.dataframe(summary_df, use_container_width=True, hide_index=True)
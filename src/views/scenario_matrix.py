@@ -0,0 +1,108 @@
+"""
+Página: Matriz de Cenários
+
+Efeito REST vs GraphQL em cada cenário, com correção para comparações
+múltiplas e detalhamento de uma célula.
+"""
+
+import streamlit as st
+
+from analysis import (CORRECTION_METHODS, METRIC_LABELS, paired_samples,
+                      perform_statistical_test, scenario_matrix)
+from views.common import load_paired_index, overhead_corrected
+
+@st.cache_data(show_spinner=False)
+def cached_scenario_matrix(alpha, correction, corrected=False):
+    """Matriz de cenários calculada uma única vez por (alpha, correção, overhead)."""
+    return scenario_matrix(load_paired_index(corrected), alpha, correction)
+
+def render(df, paired):
+    """Desenha a matriz de cenários e o detalhamento da célula escolhida."""
+    from charts import create_effect_heatmap, create_scatter_comparison
+
+    st.title("🧮 Matriz de Cenários")
+    st.markdown("Diferença pareada **REST - GraphQL** em cada cenário. Todas as células são "
+                "testadas em conjunto e os p-valores são corrigidos para comparações múltiplas.")
+    st.markdown("---")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        correction = st.radio(
+            "Correção para comparações múltiplas",
+            options=list(CORRECTION_METHODS),
+            format_func=CORRECTION_METHODS.get,
+            horizontal=True
+        )
+
+    with col2:
+        alpha = st.select_slider(
+            "Nível de significância (α)",
+            options=[0.01, 0.05, 0.10],
+            value=0.05
+        )
+
+    matrix = cached_scenario_matrix(alpha, correction, overhead_corrected())
+    tested = matrix['p_value'].notna()
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Cenários", matrix['scenario'].nunique())
+    col2.metric("Células Testadas", int(tested.sum()))
+    col3.metric("Células Significativas", int(matrix['significant'].sum()))
+
+    if not tested.any():
+        st.warning("⚠️ Nenhum cenário tem pares completos suficientes para o teste (n ≥ 2)")
+        return
+
+    st.plotly_chart(create_effect_heatmap(matrix, METRIC_LABELS), use_container_width=True)
+    st.caption(f"★ p ajustado ({CORRECTION_METHODS[correction]}) < {alpha}. "
+               "Azul: GraphQL menor/mais rápido; vermelho: REST menor/mais rápido.")
+
+    st.subheader("📋 Tabela de Células")
+    st.dataframe(
+        matrix.assign(metric=matrix['metric'].map(METRIC_LABELS)),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'scenario': 'Cenário',
+            'metric': 'Métrica',
+            'diff_mean': st.column_config.NumberColumn('Diferença Média', format='%.2f'),
+            'ci_lower': st.column_config.NumberColumn('IC Inferior', format='%.2f'),
+            'ci_upper': st.column_config.NumberColumn('IC Superior', format='%.2f'),
+            'cohens_d': st.column_config.NumberColumn("Cohen's d", format='%.3f'),
+            'd_interpretation': 'Efeito',
+            'p_value': st.column_config.NumberColumn('p-valor', format='%.4f'),
+            'p_adjusted': st.column_config.NumberColumn('p ajustado', format='%.4f'),
+            'significant': 'Significativo',
+        }
+    )
+
+    # Detalhamento de uma célula
+    st.markdown("---")
+    st.subheader("🔎 Detalhamento da Célula")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        scenario = st.selectbox("Cenário", options=sorted(matrix['scenario'].unique(), key=str))
+
+    with col2:
+        metric_col = st.selectbox("Métrica", options=list(METRIC_LABELS), format_func=METRIC_LABELS.get)
+
+    cell = matrix[(matrix['scenario'] == scenario) & (matrix['metric'] == metric_col)].iloc[0]
+    metric_label = METRIC_LABELS[metric_col]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Diferença Média", f"{cell['diff_mean']:.2f}", delta=f"{cell['n']} pares", delta_color='off')
+    col2.metric(f"IC {1 - alpha:.0%}", f"[{cell['ci_lower']:.2f}, {cell['ci_upper']:.2f}]")
+    col3.metric("p ajustado", f"{cell['p_adjusted']:.4f}", delta=cell['d_interpretation'], delta_color='off')
+
+    cell_paired = paired.xs(scenario, level='scenario', drop_level=False)
+    pairs = paired_samples(cell_paired, metric_col)
+    if len(pairs) >= 3:
+        test_results = perform_statistical_test(pairs['REST'].values, pairs['GraphQL'].values)
+        st.write(f"**{test_results['test_name']}** (sem correção): "
+                 f"estatística {test_results['test_stat']:.4f}, p-valor {test_results['test_p']:.4f}")
+
+    st.plotly_chart(create_scatter_comparison(cell_paired, metric_col, metric_label),
+                    use_container_width=True)
@@ -0,0 +1,135 @@
+"""
+Página: Análise de Tamanho da Resposta (RQ2)
+
+Testes pareados e gráficos do tamanho da resposta.
+"""
+
+import streamlit as st
+
+from analysis import interpret_size_results, paired_samples, perform_statistical_test
+from views.common import FIELD_BYTES_PATH, cached_figure, load_field_bytes
+
+def render(df, paired):
+    """Desenha a página de análise do tamanho da resposta."""
+    st.title("📦 Análise de Tamanho da Resposta (RQ2)")
+    st.markdown("**Questão de Pesquisa:** O tamanho das respostas retornadas por GraphQL é menor do que o tamanho das respostas retornadas por REST?")
+    st.markdown("---")
+
+    # Pares alinhados pelo índice (run, id, repetition, scenario)
+    pairs = paired_samples(paired, 'size_bytes')
+    rest_paired = pairs['REST'].values
+    graphql_paired = pairs['GraphQL'].values
+
+    # Testes estatísticos
+    test_results = perform_statistical_test(rest_paired, graphql_paired)
+
+    # Cards com resultados principais
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        diff = test_results['diff_mean']
+        reduction_pct = (diff / rest_paired.mean()) * 100
+        st.metric(
+            "Diferença Média",
+            f"{diff:.0f} bytes",
+            delta=f"{reduction_pct:.1f}% de redução"
+        )
+
+    with col2:
+        ci_lower = test_results['ci_lower']
+        ci_upper = test_results['ci_upper']
+        st.metric(
+            "IC 95%",
+            f"[{ci_lower:.0f}, {ci_upper:.0f}] bytes"
+        )
+
+    with col3:
+        d = test_results['cohens_d']
+        st.metric(
+            "Tamanho do Efeito (Cohen's d)",
+            f"{d:.3f}",
+            delta=test_results['d_interpretation']
+        )
+
+    st.markdown("---")
+
+    # Gráficos
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📊 Histograma Comparativo")
+        fig_hist = cached_figure('histogram', 'size_bytes', 'Tamanho da Resposta (bytes)')
+        st.plotly_chart(fig_hist, use_container_width=True)
+
+    with col2:
+        st.subheader("📊 Gráfico de Barras")
+        fig_bar = cached_figure('bar', 'size_bytes', 'Tamanho da Resposta (bytes)')
+        st.plotly_chart(fig_bar, use_container_width=True)
+
+    st.subheader("🔍 Comparação REST vs GraphQL por ID")
+    fig_scatter = cached_figure('scatter', 'size_bytes', 'Tamanho (bytes)')
+    st.plotly_chart(fig_scatter, use_container_width=True)
+
+    # Resultados dos testes estatísticos
+    st.markdown("---")
+    st.subheader("🔬 Resultados dos Testes Estatísticos")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("##### Teste de Normalidade (Shapiro-Wilk)")
+        st.write(f"**Estatística:** {test_results['shapiro_stat']:.4f}")
+        st.write(f"**p-valor:** {test_results['shapiro_p']:.4f}")
+        if test_results['is_normal']:
+            st.success("✅ Dados seguem distribuição normal (p > 0.05)")
+        else:
+            st.warning("⚠️ Dados não seguem distribuição normal (p ≤ 0.05)")
+
+    with col2:
+        st.markdown(f"##### {test_results['test_name']}")
+        st.write(f"**Estatística:** {test_results['test_stat']:.4f}")
+        st.write(f"**p-valor:** {test_results['test_p']:.4f}")
+
+        alpha = 0.05
+        if test_results['test_p'] < alpha:
+            st.success(f"✅ Diferença estatisticamente significativa (p < {alpha})")
+            if diff > 0:
+                st.info("📊 GraphQL retorna respostas **significativamente menores** que REST")
+            else:
+                st.info("📊 REST retorna respostas **significativamente menores** que GraphQL")
+        else:
+            st.warning(f"⚠️ Diferença não estatisticamente significativa (p ≥ {alpha})")
+
+    # Interpretação
+    st.markdown("---")
+    st.subheader("💡 Interpretação dos Resultados")
+
+    st.markdown(interpret_size_results(test_results, reduction_pct))
+
+    # Atribuição de bytes por campo (coletor com --field-bytes)
+    st.markdown("---")
+    st.subheader("🧩 Onde Estão os Bytes do REST")
+
+    field_bytes = load_field_bytes()
+    if field_bytes is None:
+        st.info(f"Execute o coletor com `--field-bytes {FIELD_BYTES_PATH}` para ver quanto cada "
+                "campo da resposta REST ocupa.")
+        return
+
+    from charts import create_field_bytes_bar
+
+    st.plotly_chart(create_field_bytes_bar(field_bytes), use_container_width=True)
+    st.markdown("Bytes que uma representação REST enxuta (ou um parâmetro de *sparse fieldsets*) "
+                "economizaria ao omitir cada campo, incluindo campos aninhados:")
+    st.dataframe(
+        field_bytes,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'field': 'Campo',
+            'depth': 'Nível',
+            'bytes_total': 'Bytes (total)',
+            'bytes_per_response': st.column_config.NumberColumn('Bytes por Resposta', format='%.1f'),
+            'share_pct': st.column_config.NumberColumn('Participação (%)', format='%.1f%%'),
+        }
+    )
@@ -0,0 +1,205 @@
+"""
+Página: Análise de Tempo de Resposta (RQ1)
+
+Testes pareados e gráficos do tempo de resposta.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from analysis import (HAMPEL_THRESHOLD, HAMPEL_WINDOW, interpret_time_results, paired_samples,
+                      perform_statistical_test)
+from views.common import (cached_figure, load_order_effect, load_outliers, load_run_manifest_data,
+                          outlier_figure, overhead_corrected)
+
+def render(df, paired):
+    """Desenha a página de análise do tempo da resposta."""
+    st.title("⏱️ Análise de Tempo de Resposta (RQ1)")
+    st.markdown("**Questão de Pesquisa:** As requisições realizadas por meio de GraphQL apresentam tempo de resposta inferior ao de requisições REST equivalentes?")
+    st.markdown("---")
+
+    # Pares alinhados pelo índice (run, id, repetition, scenario)
+    pairs = paired_samples(paired, 'time_ms')
+    rest_paired = pairs['REST'].values
+    graphql_paired = pairs['GraphQL'].values
+
+    # Testes estatísticos
+    test_results = perform_statistical_test(rest_paired, graphql_paired)
+
+    # Cards com resultados principais
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        diff = test_results['diff_mean']
+        st.metric(
+            "Diferença Média",
+            f"{diff:.2f} ms",
+            delta="REST - GraphQL"
+        )
+
+    with col2:
+        ci_lower = test_results['ci_lower']
+        ci_upper = test_results['ci_upper']
+        st.metric(
+            "IC 95%",
+            f"[{ci_lower:.2f}, {ci_upper:.2f}] ms"
+        )
+
+    with col3:
+        d = test_results['cohens_d']
+        st.metric(
+            "Tamanho do Efeito (Cohen's d)",
+            f"{d:.3f}",
+            delta=test_results['d_interpretation']
+        )
+
+    st.markdown("---")
+
+    # Gráficos
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📊 Histograma Comparativo")
+        fig_hist = cached_figure('histogram', 'time_ms', 'Tempo de Resposta (ms)')
+        st.plotly_chart(fig_hist, use_container_width=True)
+
+    with col2:
+        st.subheader("📈 Box Plot")
+        fig_box = cached_figure('boxplot', 'time_ms', 'Tempo de Resposta (ms)')
+        st.plotly_chart(fig_box, use_container_width=True)
+
+    st.subheader("📉 Tempo de Resposta por ID")
+    fig_line = cached_figure('line', 'time_ms', 'Tempo de Resposta (ms)')
+    st.plotly_chart(fig_line, use_container_width=True)
+
+    # Efeito de ordem (apenas quando a coleta variou a posição das APIs)
+    order_effect = load_order_effect(overhead_corrected())
+    if order_effect is not None:
+        st.markdown("---")
+        st.subheader("🔀 Efeito de Ordem")
+        manifest = load_run_manifest_data()
+        if manifest is not None:
+            st.caption(f"Ordem `{manifest['order']}`, "
+                       f"IDs {'embaralhados' if manifest['shuffle_ids'] else 'em sequência'}, "
+                       f"{manifest['rounds']} rodada(s), semente `{manifest['seed']}`.")
+        st.markdown("Compara as medições feitas **em primeiro lugar** no passo pareado com as "
+                    "feitas **depois**. Na linha *REST - GraphQL*, \"primeiro\" são os pares "
+                    "abertos pelo REST e \"depois\" os abertos pelo GraphQL.")
+        st.dataframe(
+            order_effect.rename(columns={
+                'group': 'Grupo', 'n_first': 'n (primeiro)', 'n_later': 'n (depois)',
+                'mean_first': 'Média primeiro (ms)', 'mean_later': 'Média depois (ms)',
+                'effect': 'Efeito (ms)', 'ci_lower': 'IC inf.', 'ci_upper': 'IC sup.',
+                'p_value': 'p-valor'
+            }).style.format({
+                'Média primeiro (ms)': '{:.2f}', 'Média depois (ms)': '{:.2f}',
+                'Efeito (ms)': '{:+.2f}', 'IC inf.': '{:.2f}', 'IC sup.': '{:.2f}',
+                'p-valor': '{:.4f}'
+            }),
+            use_container_width=True, hide_index=True
+        )
+        significant = order_effect[order_effect['p_value'] < 0.05]
+        if significant.empty:
+            st.success("✅ Nenhum efeito de ordem significativo (p ≥ 0.05)")
+        else:
+            st.warning(f"⚠️ Efeito de ordem significativo em: {', '.join(significant['group'])}. "
+                       "Aquecimento, cache ou conexões reaproveitadas favorecem uma das posições; "
+                       "prefira coletas com ordem balanceada (`--order latin`).")
+
+    # Resultados dos testes estatísticos
+    st.markdown("---")
+    st.subheader("🔬 Resultados dos Testes Estatísticos")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("##### Teste de Normalidade (Shapiro-Wilk)")
+        st.write(f"**Estatística:** {test_results['shapiro_stat']:.4f}")
+        st.write(f"**p-valor:** {test_results['shapiro_p']:.4f}")
+        if test_results['is_normal']:
+            st.success("✅ Dados seguem distribuição normal (p > 0.05)")
+        else:
+            st.warning("⚠️ Dados não seguem distribuição normal (p ≤ 0.05)")
+
+    with col2:
+        st.markdown(f"##### {test_results['test_name']}")
+        st.write(f"**Estatística:** {test_results['test_stat']:.4f}")
+        st.write(f"**p-valor:** {test_results['test_p']:.4f}")
+
+        alpha = 0.05
+        if test_results['test_p'] < alpha:
+            st.success(f"✅ Diferença estatisticamente significativa (p < {alpha})")
+            if diff < 0:
+                st.info("📊 REST é **mais rápido** que GraphQL")
+            else:
+                st.info("📊 GraphQL é **mais rápido** que REST")
+        else:
+            st.warning(f"⚠️ Diferença não estatisticamente significativa (p ≥ {alpha})")
+
+    # Outliers (filtro de Hampel): resultados com e sem os pares afetados
+    st.markdown("---")
+    st.subheader("🚨 Outliers (filtro de Hampel)")
+    st.markdown("Cada requisição é comparada com a mediana móvel do seu tipo de API e cenário, "
+                "na ordem de coleta. Outliers são marcados, não removidos: a tabela abaixo "
+                "repete o teste sem os pares em que algum lado foi marcado.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        window = st.select_slider("Janela (registros)", options=[5, 7, 11, 21, 51, 101],
+                                  value=HAMPEL_WINDOW)
+    with col2:
+        threshold = st.select_slider("Limiar (MADs)", options=[2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0],
+                                     value=HAMPEL_THRESHOLD)
+
+    flagged, windows, clean_paired = load_outliers(window, threshold, overhead_corrected())
+    counts = flagged.groupby('type')['outlier'].agg(['sum', 'size'])
+    col1, col2, col3 = st.columns(3)
+    for column, api_type in zip((col1, col2), ('REST', 'GraphQL')):
+        if api_type in counts.index:
+            n_flagged, n_total = counts.loc[api_type]
+            column.metric(f"Outliers {api_type}", f"{n_flagged}",
+                          delta=f"{100 * n_flagged / n_total:.1f}% das requisições", delta_color="off")
+    clean_pairs = paired_samples(clean_paired, 'time_ms')
+    col3.metric("Pares sem outliers", f"{len(clean_pairs)}", delta=f"de {len(pairs)}", delta_color="off")
+
+    if len(clean_pairs) >= 3:
+        clean_results = perform_statistical_test(clean_pairs['REST'].values, clean_pairs['GraphQL'].values)
+        comparison = pd.DataFrame([
+            {'Dados': label, 'Pares': n, 'Diferença Média (ms)': results['diff_mean'],
+             'IC 95%': f"[{results['ci_lower']:.2f}, {results['ci_upper']:.2f}]",
+             "Cohen's d": results['cohens_d'], 'Teste': results['test_name'], 'p-valor': results['test_p']}
+            for label, n, results in (("Com outliers", len(pairs), test_results),
+                                      ("Sem outliers", len(clean_pairs), clean_results))
+        ])
+        st.dataframe(
+            comparison.style.format({'Diferença Média (ms)': '{:+.2f}', "Cohen's d": '{:.3f}',
+                                     'p-valor': '{:.4f}'}),
+            use_container_width=True, hide_index=True
+        )
+        if (test_results['test_p'] < alpha) != (clean_results['test_p'] < alpha):
+            st.warning("⚠️ A conclusão do teste muda quando os outliers são excluídos; "
+                       "investigue as janelas abaixo antes de reportar o resultado.")
+
+    st.plotly_chart(outlier_figure(window, threshold, overhead_corrected()), use_container_width=True)
+
+    if windows.empty:
+        st.success("✅ Nenhum outlier com os parâmetros atuais")
+    else:
+        st.markdown("##### Janelas responsáveis (outliers consecutivos, maior score primeiro)")
+        if 'start' in windows:
+            windows = windows.assign(start=pd.to_datetime(windows['start'], unit='s'),
+                                     end=pd.to_datetime(windows['end'], unit='s'))
+        st.dataframe(
+            windows.rename(columns={
+                'type': 'Tipo', 'scenario': 'Cenário', 'records': 'Requisições', 'ids': 'IDs',
+                'max_score': 'Score máx.', 'max_value': 'Tempo máx. (ms)',
+                'start': 'Início', 'end': 'Fim'
+            }).style.format({'Score máx.': '{:.1f}', 'Tempo máx. (ms)': '{:.2f}'}),
+            use_container_width=True, hide_index=True
+        )
+
+    # Interpretação
+    st.markdown("---")
+    st.subheader("💡 Interpretação dos Resultados")
+
+    st.markdown(interpret_time_results(test_results))
@@ -0,0 +1,417 @@
+"""
+Cenários de Carga Mista
+Disciplina: Laboratório de Experimentação de Software
+
+Lê um arquivo declarativo (TOML; YAML se o PyYAML estiver instalado) com uma
+mistura ponderada de operações. Cada operação tem seu próprio tipo, peso,
+distribuição de IDs, tempo de pensamento e taxa alvo. A execução fica no
+coletor (`experimet.run_workload`); este módulo valida o arquivo e sorteia os
+IDs de cada operação.
+
+Tipos de operação (`kind`):
+
+- rest_single:  GET /api/character/<id>
+- rest_batch:   GET /api/character/<id>,<id>,... (`batch_size` IDs)
+- rest_nested:  GET do personagem, da sua localização e dos seus episódios
+                (três idas ao servidor)
+- rest_page:    GET /api/character?page=<n> (a distribuição sorteia a página)
+- graphql:      POST de `query`, com as variáveis `$id`, `$ids` (`batch_size`
+                IDs) ou `$page` que a query declarar
+
+Modos de execução (`[run] mode`):
+
+- paired: para cada ID sorteado pela distribuição do `[run]`, executa todas as
+          operações na ordem do arquivo (a coleta pareada REST x GraphQL padrão
+          é este modo com duas operações). Operações REST e GraphQL com o mesmo
+          `pair` são contrapartes na análise pareada; com exatamente uma
+          operação de cada tipo, o par é implícito
+- mix:    um único agendador sorteia a próxima operação pelos pesos, entre as
+          que não excederam a taxa alvo, até `requests` operações ou
+          `duration_s` segundos
+
+No modo paired, a ordem das operações em cada passo (`order`) pode ser fixa
+(a do arquivo), sorteada a cada ID ou balanceada por um quadrado latino de
+Williams (cada operação aparece em cada posição e precede cada outra o mesmo
+número de vezes). Com `shuffle_ids`, a sequência de IDs de cada rodada
+(`rounds`) é embaralhada. Todo sorteio deriva de `seed`, gravada com a execução.
+
+Exemplo:
+
+    [run]
+    name = "mix-leitura"
+    mode = "mix"
+    requests = 500
+    seed = 7
+
+    [[operation]]
+    name = "detalhe_rest"
+    kind = "rest_single"
+    weight = 6
+    ids = { distribution = "zipf", min = 1, max = 826, s = 1.1 }
+
+    [[operation]]
+    name = "lista_graphql"
+    kind = "graphql"
+    weight = 1
+    rate = 2.0
+    think_time_ms = 250
+    batch_size = 20
+    query = "query($ids: [ID!]!) { characters(ids: $ids) { id name } }"
+"""
+
+import json
+import os
+import random
+import re
+from bisect import bisect_left
+from datetime import datetime, timezone
+from itertools import accumulate
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# Tipo de operação -> tipo de API registrado na coluna `type`
+OPERATION_KINDS = {
+    'rest_single': 'REST',
+    'rest_batch': 'REST',
+    'rest_nested': 'REST',
+    'rest_page': 'REST',
+    'graphql': 'GraphQL',
+}
+MODES = ['paired', 'mix']
+ORDERS = ['fixed', 'random', 'latin']
+DISTRIBUTIONS = ['sequential', 'uniform', 'zipf', 'list']
+THINK_TIME_DISTRIBUTIONS = ['fixed', 'exponential']
+GRAPHQL_VARIABLES = re.compile(r'\$(ids|id|page)\b')
+
+# Rótulo de pareamento implícito (uma operação REST e uma GraphQL no modo paired)
+DEFAULT_PAIR = 'default'
+
+# Padrões alinhados ao coletor: personagens da API pública e a pausa entre requisições
+DEFAULT_IDS = {'distribution': 'uniform', 'min': 1, 'max': 826}
+DEFAULT_THINK_TIME_MS = 100.0
+
+
+def id_sampler(spec: dict, rng: random.Random) -> Callable[[], int]:
+    """
+    Função sem argumentos que sorteia o próximo ID segundo `spec`.
+
+    - sequential: min, min+1, ..., max (recomeça do início ao esgotar)
+    - uniform:    inteiro uniforme em [min, max]
+    - zipf:       posto k em [min, max] com probabilidade ∝ 1/(k-min+1)^s
+    - list:       escolha uniforme em `values`
+    """
+    distribution = spec.get('distribution', 'uniform')
+    if distribution == 'list':
+        values = list(spec['values'])
+        return lambda: rng.choice(values)
+
+    low, high = int(spec['min']), int(spec['max'])
+    if distribution == 'sequential':
+        state = {'next': low}
+
+        def sequential():
+            value = state['next']
+            state['next'] = value + 1 if value < high else low
+            return value
+        return sequential
+    if distribution == 'uniform':
+        return lambda: rng.randint(low, high)
+    if distribution == 'zipf':
+        s = float(spec.get('s', 1.0))
+        cumulative = list(accumulate(1.0 / rank ** s for rank in range(1, high - low + 2)))
+        total = cumulative[-1]
+        return lambda: low + bisect_left(cumulative, rng.random() * total)
+    raise ValueError(f"Distribuição desconhecida: {distribution}")
+
+
+class Operation:
+    """Uma operação do cenário, já validada."""
+
+    def __init__(self, spec: dict):
+        self.name = spec['name']
+        self.kind = spec['kind']
+        self.api_type = OPERATION_KINDS[self.kind]
+        self.weight = float(spec.get('weight', 1.0))
+        self.rate = spec.get('rate')
+        self.think_time_ms = float(spec.get('think_time_ms', DEFAULT_THINK_TIME_MS))
+        self.think_time_distribution = spec.get('think_time_distribution', 'fixed')
+        self.batch_size = int(spec.get('batch_size', 1))
+        self.ids = spec.get('ids', DEFAULT_IDS)
+        self.query = spec.get('query')
+        self.pair = spec.get('pair')
+        self.variables = set(GRAPHQL_VARIABLES.findall(self.query)) if self.query else set()
+
+    def think_time(self, rng: random.Random) -> float:
+        """Pausa (segundos) após a operação."""
+        mean = self.think_time_ms / 1000
+        if self.think_time_distribution == 'exponential' and mean > 0:
+            return rng.expovariate(1 / mean)
+        return mean
+
+
+def williams_square(k: int) -> List[List[int]]:
+    """
+    Sequências de um quadrado latino de Williams para k tratamentos.
+
+    Cada tratamento ocupa cada posição e sucede cada outro tratamento o mesmo
+    número de vezes (balanceamento de efeitos de ordem de primeira ordem). Para
+    k ímpar são necessárias 2k sequências (o quadrado e o seu reverso).
+    """
+    first = [0]
+    for i in range(1, k):
+        first.append((i + 1) // 2 if i % 2 else k - i // 2)
+    rows = [[(t + r) % k for t in first] for r in range(k)]
+    if k % 2:
+        rows += [row[::-1] for row in rows]
+    return rows
+
+
+def operation_orders(operations: List[Operation], order: str,
+                     rng: random.Random) -> Callable[[int], List[Operation]]:
+    """Função passo -> operações na ordem em que devem ser executadas naquele passo."""
+    if order == 'random':
+        return lambda step: rng.sample(operations, len(operations))
+    if order == 'latin':
+        square = williams_square(len(operations))
+        return lambda step: [operations[i] for i in square[step % len(square)]]
+    return lambda step: operations
+
+
+class Workload:
+    """Cenário completo: parâmetros de execução e operações."""
+
+    def __init__(self, name: str, mode: str, operations: List[Operation], ids: dict,
+                 requests: Optional[int] = None, duration_s: Optional[float] = None, seed: int = 0,
+                 order: str = 'fixed', shuffle_ids: bool = False, rounds: int = 1):
+        self.name = name
+        self.mode = mode
+        self.operations = operations
+        self.ids = ids
+        self.requests = requests
+        self.duration_s = duration_s
+        self.seed = seed
+        self.order = order
+        self.shuffle_ids = shuffle_ids
+        self.rounds = rounds
+
+    @property
+    def weights(self) -> List[float]:
+        return [operation.weight for operation in self.operations]
+
+
+def _validate_ids(spec, where: str):
+    if not isinstance(spec, dict):
+        raise ValueError(f"{where}: 'ids' deve ser uma tabela")
+    distribution = spec.get('distribution', 'uniform')
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"{where}: distribuição '{distribution}' inválida (use {', '.join(DISTRIBUTIONS)})")
+    if distribution == 'list':
+        if not spec.get('values'):
+            raise ValueError(f"{where}: a distribuição 'list' exige 'values'")
+        return
+    if 'min' not in spec or 'max' not in spec or int(spec['min']) > int(spec['max']):
+        raise ValueError(f"{where}: informe 'min' <= 'max'")
+
+
+def _validate_operation(spec: dict, index: int):
+    where = f"operação {index} ({spec.get('name', 'sem nome')})"
+    if 'name' not in spec:
+        raise ValueError(f"{where}: 'name' é obrigatório")
+    if spec.get('kind') not in OPERATION_KINDS:
+        raise ValueError(f"{where}: 'kind' deve ser um de {', '.join(OPERATION_KINDS)}")
+    if float(spec.get('weight', 1.0)) < 0:
+        raise ValueError(f"{where}: 'weight' deve ser >= 0")
+    if spec.get('rate') is not None and float(spec['rate']) <= 0:
+        raise ValueError(f"{where}: 'rate' deve ser > 0 (operações por segundo)")
+    if float(spec.get('think_time_ms', DEFAULT_THINK_TIME_MS)) < 0:
+        raise ValueError(f"{where}: 'think_time_ms' deve ser >= 0")
+    if spec.get('think_time_distribution', 'fixed') not in THINK_TIME_DISTRIBUTIONS:
+        raise ValueError(f"{where}: 'think_time_distribution' deve ser um de "
+                         f"{', '.join(THINK_TIME_DISTRIBUTIONS)}")
+    if int(spec.get('batch_size', 1)) < 1:
+        raise ValueError(f"{where}: 'batch_size' deve ser >= 1")
+    if spec['kind'] == 'graphql' and not spec.get('query'):
+        raise ValueError(f"{where}: operações graphql exigem 'query'")
+    _validate_ids(spec.get('ids', DEFAULT_IDS), where)
+
+
+def _pair_labels(specs: List[dict], mode: str) -> List[Optional[str]]:
+    """Rótulo `pair` de cada operação (None para operações sem contraparte)."""
+    declared = [str(spec['pair']) if spec.get('pair') is not None else None for spec in specs]
+    if mode == 'mix':
+        if any(declared):
+            raise ValueError("'pair' vale apenas para o modo paired (no modo mix não há contrapartes)")
+        return declared
+    types = [OPERATION_KINDS[spec['kind']] for spec in specs]
+    if not any(declared):
+        return [DEFAULT_PAIR] * len(specs) if sorted(types) == ['GraphQL', 'REST'] else declared
+    members = {}
+    for label, api_type in zip(declared, types):
+        if label is not None:
+            members.setdefault(label, []).append(api_type)
+    for label, pair_types in members.items():
+        if sorted(pair_types) != ['GraphQL', 'REST']:
+            raise ValueError(f"pair '{label}': informe exatamente uma operação REST e uma GraphQL")
+    return declared
+
+
+def workload_from_dict(data: dict, default_name: str = 'workload') -> Workload:
+    """Valida o conteúdo de um cenário e monta o Workload."""
+    run = data.get('run', {})
+    specs = data.get('operation', [])
+    if not specs:
+        raise ValueError("O cenário precisa de ao menos uma [[operation]]")
+    for index, spec in enumerate(specs, 1):
+        _validate_operation(spec, index)
+    names = [spec['name'] for spec in specs]
+    if len(set(names)) != len(names):
+        raise ValueError("Os nomes das operações devem ser únicos")
+
+    mode = run.get('mode', 'mix')
+    if mode not in MODES:
+        raise ValueError(f"[run] mode deve ser um de {', '.join(MODES)}")
+    requests = run.get('requests')
+    duration_s = run.get('duration_s')
+    ids = run.get('ids', DEFAULT_IDS)
+    if mode == 'mix':
+        if requests is None and duration_s is None:
+            raise ValueError("No modo mix, informe [run] requests e/ou duration_s")
+        if sum(float(spec.get('weight', 1.0)) for spec in specs) <= 0:
+            raise ValueError("A soma dos pesos deve ser > 0")
+    else:
+        _validate_ids(ids, '[run]')
+        if requests is None:
+            if ids.get('distribution') != 'sequential':
+                raise ValueError("No modo paired, informe [run] requests (ou use ids sequenciais)")
+            # IDs sequenciais sem `requests`: uma volta completa pelo intervalo
+            requests = int(ids['max']) - int(ids['min']) + 1
+    order = run.get('order', 'fixed')
+    shuffle_ids = bool(run.get('shuffle_ids', False))
+    rounds = int(run.get('rounds', 1))
+    if order not in ORDERS:
+        raise ValueError(f"[run] order deve ser um de {', '.join(ORDERS)}")
+    if rounds < 1:
+        raise ValueError("[run] rounds deve ser >= 1")
+    if mode == 'mix' and (order != 'fixed' or shuffle_ids or rounds > 1):
+        raise ValueError("order, shuffle_ids e rounds valem apenas para o modo paired "
+                         "(no modo mix a ordem já é sorteada)")
+
+    return Workload(
+        name=run.get('name', default_name),
+        mode=mode,
+        operations=[Operation({**spec, 'pair': label})
+                    for spec, label in zip(specs, _pair_labels(specs, mode))],
+        ids=ids,
+        requests=int(requests) if requests is not None else None,
+        duration_s=float(duration_s) if duration_s is not None else None,
+        seed=int(run.get('seed', 0)),
+        order=order,
+        shuffle_ids=shuffle_ids,
+        rounds=rounds,
+    )
+
+
+def load_workload(path: str, **overrides) -> Workload:
+    """
+    Lê um cenário .toml (ou .yaml/.yml, com PyYAML) e o valida.
+
+    `overrides` substitui chaves de [run] do arquivo (ex.: opções da linha de
+    comando) antes da validação.
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    if path.endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("Cenários YAML exigem o PyYAML (pip install pyyaml); "
+                             "ou use o formato TOML")
+        with open(path, encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+    else:
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("Cenários TOML exigem Python 3.11+ (tomllib); "
+                             "ou use o formato YAML, com PyYAML")
+        with open(path, 'rb') as f:
+            try:
+                data = tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise ValueError(f"TOML inválido em {path}: {e}") from e
+    if overrides:
+        data['run'] = {**data.get('run', {}), **overrides}
+    return workload_from_dict(data, name)
+
+
+def paired_workload(start_id: int, end_id: int, operations: List[dict], name: str, **run) -> Workload:
+    """
+    Cenário pareado que percorre os IDs de `start_id` a `end_id`.
+
+    `run` recebe as demais chaves de [run] (order, shuffle_ids, rounds, seed).
+    """
+    return workload_from_dict({
+        'run': {
+            'name': name,
+            'mode': 'paired',
+            'requests': end_id - start_id + 1,
+            'ids': {'distribution': 'sequential', 'min': start_id, 'max': end_id},
+            **run,
+        },
+        'operation': operations,
+    })
+
+
+def paired_steps(workload: Workload, rng: random.Random) -> Iterator[Tuple[int, int]]:
+    """
+    Passos (rodada, ID) de um cenário paired.
+
+    Cada rodada sorteia `requests` IDs pela distribuição do [run] (uma volta
+    completa, para IDs sequenciais sem `requests`) e, com `shuffle_ids`, os
+    embaralha. `duration_s`, se houver, pode encerrar a coleta antes.
+    """
+    draw = id_sampler(workload.ids, rng)
+    for round_number in range(1, workload.rounds + 1):
+        keys = [draw() for _ in range(workload.requests)]
+        if workload.shuffle_ids:
+            rng.shuffle(keys)
+        for key in keys:
+            yield round_number, key
+
+
+
+def run_manifest(workload: Workload) -> dict:
+    """Parâmetros que reproduzem a execução de um cenário (inclusive a semente)."""
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'scenario': workload.name,
+        'mode': workload.mode,
+        'order': workload.order,
+        'shuffle_ids': workload.shuffle_ids,
+        'rounds': workload.rounds,
+        'seed': workload.seed,
+        'requests': workload.requests,
+        'duration_s': workload.duration_s,
+        'ids': workload.ids,
+        'operations': [operation.name for operation in workload.operations],
+    }
+
+
+def save_run_manifest(manifest: dict, results_path: str) -> str:
+    """Grava o manifesto ao lado do CSV de resultados e retorna o caminho usado."""
+    path = run_manifest_path(results_path)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def run_manifest_path(results_path: str) -> str:
+    """Manifesto da execução gravado ao lado do CSV de resultados."""
+    return os.path.splitext(results_path)[0] + '.run.json'
+
+
+def load_run_manifest(results_path: str) -> Optional[dict]:
+    """Manifesto associado a um CSV de resultados, ou None se não houver."""
+    path = run_manifest_path(results_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)